@@ -0,0 +1,268 @@
+"""
+Compare the recall and latency of the Qdrant quantization profiles on a sample of the knowledge base.
+
+A sample of the stored chunks is copied into one scratch collection per profile, and
+held-out chunks serve as queries. The reference neighbours are those of an exact search
+on the unquantized copy: each profile is scored by its recall@k against them and by its
+search latency, for each oversampling and rescoring setting. Usage:
+
+    python benchmark_quantization.py --sample 20000 --queries 200 --top-k 10 --oversampling 1 2 4
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Set
+
+from qdrant_client import AsyncQdrantClient, models
+
+import config  # noqa: F401  (configures logging)
+from src.components.rag.domain.value_objects import DocumentRetrievalVector, SearchOptions
+from src.components.rag.domain.value_objects.input_document import StoreDocumentStatus
+from src.components.rag.infrastructure.persistence import QdrantVectorRetrieverAdapter, QdrantVectorStoreAdapter
+from src.components.rag.infrastructure.persistence.qdrant_vector_base import QdrantVectorBase
+from src.components.rag.infrastructure.persistence.repositories_settings import repo_settings
+
+PROFILES = ("none", "scalar", "binary", "product")
+# Bits stored per dimension by the searched vectors of each profile
+BITS_PER_DIMENSION = {
+    "none": 32,
+    "scalar": 8,
+    "binary": 1,
+    "product": 32 / int(repo_settings.product_compression.lstrip("x")),
+}
+
+logger = logging.getLogger(__name__)
+
+
+async def sample_points(client: AsyncQdrantClient, collection_name: str, count: int) -> List[DocumentRetrievalVector]:
+    """
+    Read up to `count` chunks of a collection with their vectors.
+
+    Args:
+        client (AsyncQdrantClient): Qdrant client.
+        collection_name (str): Collection to read.
+        count (int): Number of chunks to read.
+
+    Returns:
+        List[DocumentRetrievalVector]: The chunks, in the order of their ids.
+    """
+    points: List[DocumentRetrievalVector] = []
+    offset = None
+    while len(points) < count:
+        records, offset = await client.scroll(collection_name=collection_name, limit=min(256, count - len(points)),
+                                              offset=offset, with_payload=True, with_vectors=True)
+        points += [
+            DocumentRetrievalVector(id=record.id, content=record.payload.get("content", ""),
+                                    metadata=record.payload.get("metadata", {}), vector=record.vector)
+            for record in records
+        ]
+        if offset is None:
+            break
+    return points
+
+
+async def wait_until_indexed(client: AsyncQdrantClient, collection_name: str, timeout_seconds: float) -> None:
+    """
+    Wait until Qdrant has built the index and quantized vectors of a collection.
+
+    Args:
+        client (AsyncQdrantClient): Qdrant client.
+        collection_name (str): Collection to wait for.
+        timeout_seconds (float): Maximum time to wait.
+
+    Raises:
+        TimeoutError: If the collection is still being optimized after `timeout_seconds`.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while (await client.get_collection(collection_name)).status != models.CollectionStatus.GREEN:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"{collection_name} is still being indexed after {timeout_seconds:.0f} s")
+        await asyncio.sleep(1)
+
+
+async def build_collection(client: AsyncQdrantClient, collection_name: str, profile: str,
+                           points: List[DocumentRetrievalVector], timeout_seconds: float) -> QdrantVectorRetrieverAdapter:
+    """
+    Copy chunks into a fresh collection with a quantization profile.
+
+    Args:
+        client (AsyncQdrantClient): Qdrant client.
+        collection_name (str): Scratch collection, replaced if it exists.
+        profile (str): Quantization profile of the collection.
+        points (List[DocumentRetrievalVector]): Chunks to copy.
+        timeout_seconds (float): Maximum time to wait for the indexing.
+
+    Returns:
+        QdrantVectorRetrieverAdapter: A retriever searching the collection.
+    """
+    await client.delete_collection(collection_name)
+    store = QdrantVectorStoreAdapter(client=client, collection_name=collection_name, quantization=profile,
+                                     fallback_dimension=len(points[0].vector))
+    result = await store.upsert(points)
+    if result.status != StoreDocumentStatus.SUCCESS:
+        raise RuntimeError(f"Copying the sample into {collection_name} failed: {result.metrics.get('errors')}")
+    await wait_until_indexed(client, collection_name, timeout_seconds)
+    # Only the options of each measurement apply, not the search defaults of the deployment
+    return QdrantVectorRetrieverAdapter(client=client, collection_name=collection_name, quantization=profile,
+                                        search_options=SearchOptions())
+
+
+async def exact_neighbours(retriever: QdrantVectorRetrieverAdapter, queries: List[List[float]],
+                           top_k: int) -> List[Set[str]]:
+    """
+    Find the true nearest neighbours of each query by exhaustive search.
+
+    Args:
+        retriever (QdrantVectorRetrieverAdapter): Retriever of the unquantized collection.
+        queries (List[List[float]]): Query vectors.
+        top_k (int): Number of neighbours per query.
+
+    Returns:
+        List[Set[str]]: Ids of the neighbours of each query.
+    """
+    exact = SearchOptions(exact=True)
+    return [{str(result.id) for result in await retriever.search(query=query, top_k=top_k, options=exact)}
+            for query in queries]
+
+
+async def measure(retriever: QdrantVectorRetrieverAdapter, queries: List[List[float]], truth: List[Set[str]],
+                  top_k: int, oversampling: Optional[float], rescore: Optional[bool]) -> Dict[str, float]:
+    """
+    Run the queries one at a time and score the results against the true neighbours.
+
+    Returns:
+        Dict[str, float]: Mean recall@k, and median and 95th percentile latencies in milliseconds.
+    """
+    options = SearchOptions(oversampling=oversampling, rescore=rescore)
+    # Warm the caches of the collection before timing
+    for query in queries[:10]:
+        await retriever.search(query=query, top_k=top_k, options=options)
+
+    latencies, recalls = [], []
+    for query, neighbours in zip(queries, truth):
+        started = time.perf_counter()
+        results = await retriever.search(query=query, top_k=top_k, options=options)
+        latencies.append((time.perf_counter() - started) * 1000)
+        recalls.append(len({str(result.id) for result in results} & neighbours) / max(len(neighbours), 1))
+    return {
+        "recall": statistics.fmean(recalls),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0],
+    }
+
+
+async def run_benchmark(source_collection: str, profiles: Sequence[str], sample: int, queries: int, top_k: int,
+                        oversampling: Sequence[float], timeout_seconds: float, keep: bool) -> List[Dict]:
+    """
+    Benchmark the quantization profiles on a sample of a collection.
+
+    Args:
+        source_collection (str): Collection the sample is read from. It is only read.
+        profiles (Sequence[str]): Quantization profiles to compare.
+        sample (int): Number of chunks indexed in each scratch collection.
+        queries (int): Number of held-out chunks used as queries.
+        top_k (int): Number of results per query.
+        oversampling (Sequence[float]): Oversampling values tried on the quantized profiles.
+        timeout_seconds (float): Maximum time to wait for the indexing of each collection.
+        keep (bool): Whether to keep the scratch collections.
+
+    Returns:
+        List[Dict]: One row per profile and search setting.
+    """
+    client = QdrantVectorBase.create_client()
+    collections = {profile: f"{source_collection}_benchmark_{profile}" for profile in ("none", *profiles)}
+    try:
+        points = await sample_points(client, source_collection, sample + queries)
+        if len(points) <= queries:
+            raise ValueError(f"{source_collection} holds {len(points)} chunks, not enough for {queries} queries")
+        query_vectors = [point.vector for point in points[-queries:]]
+        points = points[:-queries]
+        dimension = len(points[0].vector)
+        logger.info(f"run_benchmark :: Indexing {len(points)} chunks of dimension {dimension} per profile")
+
+        # The unquantized copy provides the reference neighbours
+        retrievers = {"none": await build_collection(client, collections["none"], "none", points, timeout_seconds)}
+        truth = await exact_neighbours(retrievers["none"], query_vectors, top_k)
+
+        rows = []
+        for profile in profiles:
+            if profile not in retrievers:
+                retrievers[profile] = await build_collection(client, collections[profile], profile, points,
+                                                             timeout_seconds)
+            settings = [(None, None)] if profile == "none" else \
+                [(factor, rescore) for factor in oversampling for rescore in (True, False)]
+            for factor, rescore in settings:
+                logger.info(f"run_benchmark :: Measuring {profile} (oversampling={factor}, rescore={rescore})")
+                metrics = await measure(retrievers[profile], query_vectors, truth, top_k, factor, rescore)
+                rows.append({
+                    "profile": profile,
+                    "oversampling": factor,
+                    "rescore": rescore,
+                    "vector_mb": len(points) * dimension * BITS_PER_DIMENSION[profile] / 8 / (1024 * 1024),
+                    **metrics,
+                })
+        return rows
+    finally:
+        if not keep:
+            for collection_name in collections.values():
+                await client.delete_collection(collection_name)
+        await client.close()
+
+
+def format_table(rows: List[Dict], top_k: int) -> str:
+    """
+    Format the benchmark results for the terminal.
+
+    Args:
+        rows (List[Dict]): Rows returned by `run_benchmark`.
+        top_k (int): Number of results per query.
+
+    Returns:
+        str: A table with one line per profile and search setting.
+    """
+    lines = [f"{'profile':<8} {'oversampling':>12} {'rescore':>7} {f'recall@{top_k}':>9} "
+             f"{'p50 ms':>7} {'p95 ms':>7} {'vectors MB':>10}"]
+    lines += [
+        f"{row['profile']:<8} {'-' if row['oversampling'] is None else row['oversampling']:>12} "
+        f"{'-' if row['rescore'] is None else row['rescore']!s:>7} {row['recall']:>9.3f} "
+        f"{row['p50_ms']:>7.2f} {row['p95_ms']:>7.2f} {row['vector_mb']:>10.1f}"
+        for row in rows
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the recall and latency of the Qdrant quantization profiles.")
+    parser.add_argument("--collection", default=repo_settings.collection_name,
+                        help="Collection the sample is read from (default: QDRANT_COLLECTION_NAME)")
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=list(PROFILES),
+                        help="Quantization profiles to compare (default: all)")
+    parser.add_argument("--sample", type=int, default=20000, help="Chunks indexed per profile (default: 20000)")
+    parser.add_argument("--queries", type=int, default=200, help="Held-out chunks used as queries (default: 200)")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query (default: 10)")
+    parser.add_argument("--oversampling", type=float, nargs="+", default=[1.0, 2.0, 4.0],
+                        help="Oversampling values tried on the quantized profiles (default: 1 2 4)")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds to wait for each index (default: 600)")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch collections")
+    parser.add_argument("--log-level", default="INFO", help="Log level of the run (default: INFO)")
+    args = parser.parse_args(argv)
+
+    for setting in ("sample", "queries", "top_k"):
+        if getattr(args, setting) < 1:
+            parser.error(f"--{setting.replace('_', '-')} must be at least 1")
+    if min(args.oversampling) < 1:
+        parser.error("--oversampling values must be at least 1")
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    rows = asyncio.run(run_benchmark(args.collection, args.profiles, args.sample, args.queries, args.top_k,
+                                     args.oversampling, args.timeout, args.keep))
+    print(format_table(rows, args.top_k))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ from starlette.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRoute
 
 from config import SETTINGS
+from src.components.rag.infrastructure import __routers__ as chatbot_routers, rag_lifespan
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -16,6 +17,7 @@ app = FastAPI(
     title=SETTINGS.PROJECT_NAME,
     openapi_url=f"{SETTINGS.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=rag_lifespan,
 )
 
 # Set up CORS middleware
@@ -28,7 +30,5 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from src.components.rag.infrastructure import __routers__ as chatbot_routers
-
 for router in chatbot_routers:
     app.include_router(router, prefix=SETTINGS.API_V1_STR)
@@ -1,12 +1,36 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
 from src.components.rag.application.ports.driving.document_store_port import DocumentStorePort
+from src.components.rag.domain.services.bulk_ingestion_service import BulkIngestionService
 from src.components.rag.domain.services.document_store_service import DocumentStoreService
-from src.components.rag.domain.value_objects import InputDocument
+from src.components.rag.domain.services.ingestion_job_service import IngestionJobService
+from src.components.rag.domain.value_objects import InputDocument, IngestionJob, BulkIngestionReport, \
+    DeleteDocumentResult
 from src.components.rag.domain.value_objects.input_document import StoreDocumentResult
 
 
 class DocumentStoreHandler(DocumentStorePort):
-    def __init__(self, document_store_service: DocumentStoreService):
+    def __init__(self, document_store_service: DocumentStoreService, ingestion_job_service: IngestionJobService,
+                 bulk_ingestion_service: BulkIngestionService):
         self.document_store_service = document_store_service
+        self.ingestion_job_service = ingestion_job_service
+        self.bulk_ingestion_service = bulk_ingestion_service
 
     async def add_document(self, document: InputDocument) -> StoreDocumentResult:
         return await self.document_store_service.ingest_document(document)
+
+    async def replace_document(self, document: InputDocument, all_versions: bool = False) -> StoreDocumentResult:
+        return await self.document_store_service.replace_document(document, all_versions)
+
+    async def delete_document(self, filename: str, all_versions: bool = False) -> DeleteDocumentResult:
+        return await self.document_store_service.delete_document(filename, all_versions)
+
+    async def add_documents(self, documents: Iterable[InputDocument], replace: bool = False) -> BulkIngestionReport:
+        return await self.bulk_ingestion_service.ingest(documents, replace)
+
+    async def submit_document(self, document: InputDocument, replace: bool = False) -> IngestionJob:
+        return await self.ingestion_job_service.submit(document, replace)
+
+    async def get_job(self, job_id: UUID) -> Optional[IngestionJob]:
+        return await self.ingestion_job_service.get_job(job_id)
@@ -1,8 +1,8 @@
-from typing import List
+from typing import AsyncIterator, List
 
 from src.components.rag.application.ports.driving import QueryPort
 from src.components.rag.domain.services.query_service import QueryService
-from src.components.rag.domain.value_objects import DocumentRetrieval, RAGResponse, Query, Response
+from src.components.rag.domain.value_objects import DocumentRetrieval, RAGResponse, Query, Response, RAGStreamEvent
 
 
 class QueryHandler(QueryPort):
@@ -34,3 +34,15 @@ class QueryHandler(QueryPort):
         """
 
         return await self.service.process_query(query=user_query)
+
+    async def stream_query(self, user_query: Query) -> AsyncIterator[RAGStreamEvent]:
+        """Stream a RAG response: sources first, then tokens, then usage and timings.
+
+        Args:
+            user_query (Query): The user query object containing the search request.
+
+        Yields:
+            RAGStreamEvent: Events of the streamed response.
+        """
+        async for event in self.service.stream_query(query=user_query):
+            yield event
@@ -3,13 +3,19 @@ Outputs
 Domain to adapters
 """
 from .embedding_port import EmbeddingPort
+from .ingestion_checkpoint_port import IngestionCheckpointPort
+from .ingestion_job_repository_port import IngestionJobRepositoryPort
 from .llm_port import LLMPort
+from .semantic_cache_port import SemanticCachePort
 from .text_chunking_port import TextChunkingPort
 from .vector_retriever_port import VectorRetrieverPort
 from .vector_store_port import VectorStorePort
 __all__ = [
     "EmbeddingPort",
+    "IngestionCheckpointPort",
+    "IngestionJobRepositoryPort",
     "LLMPort",
+    "SemanticCachePort",
     "TextChunkingPort",
     "VectorRetrieverPort",
     "VectorStorePort"
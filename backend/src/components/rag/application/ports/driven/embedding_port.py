@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 from src.components.rag.domain.value_objects import Embedding
 
@@ -29,3 +30,25 @@ class EmbeddingPort(ABC):
             A list of floats representing the embedding vector.
         """
         pass
+
+    @abstractmethod
+    async def embed_texts(self, texts: List[str]) -> List[Embedding]:
+        """Generate embedding vectors for several texts at once.
+
+        Implementations should group texts into as few backend calls as possible.
+
+        Args:
+            texts: Input texts to convert into vector representations.
+
+        Returns:
+            Embeddings in the same order as the input texts.
+        """
+        pass
+
+    def get_metrics(self) -> dict:
+        """Return implementation-specific metrics, such as batching or caching statistics.
+
+        Returns:
+            dict: Metrics of the embedding backend, empty by default.
+        """
+        return {}
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+from uuid import UUID
+
+from src.components.rag.domain.value_objects import DocumentRetrieval, Embedding, IngestionCheckpoint
+from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
+
+
+class IngestionCheckpointPort(ABC):
+    """Port interface for persisting the intermediate results of an ingestion job.
+
+    Each completed stage is saved under the job id, so that a job interrupted by a
+    restart resumes after its last completed stage instead of starting over.
+    """
+
+    @abstractmethod
+    async def load(self, job_id: UUID) -> IngestionCheckpoint:
+        """Return the saved intermediate results of a job.
+
+        Args:
+            job_id: Identifier of the job.
+
+        Returns:
+            IngestionCheckpoint: The saved results, empty if none were saved.
+        """
+        pass
+
+    @abstractmethod
+    async def save_extracted(self, job_id: UUID, content: ExtractedContent) -> None:
+        """Save the extracted content of a job's document.
+
+        Args:
+            job_id: Identifier of the job.
+            content: The extracted content, with the structured document if any.
+        """
+        pass
+
+    @abstractmethod
+    async def save_chunks(self, job_id: UUID, chunks: List[DocumentRetrieval],
+                          stored_chunk_ids: Sequence[UUID] = ()) -> None:
+        """Save the chunks of a job's document.
+
+        Args:
+            job_id: Identifier of the job.
+            chunks: The chunks, with the ids they will be stored under.
+            stored_chunk_ids: Ids of the chunks of the document stored before the job.
+        """
+        pass
+
+    @abstractmethod
+    async def save_embeddings(self, job_id: UUID, offset: int, embeddings: List[Embedding]) -> None:
+        """Save the embeddings of a group of consecutive new chunks.
+
+        Args:
+            job_id: Identifier of the job.
+            offset: Index of the first chunk of the group among the new chunks.
+            embeddings: Embeddings of the chunks of the group, in chunk order.
+        """
+        pass
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from src.components.rag.domain.value_objects import IngestionJob, InputDocument
+
+
+class IngestionJobRepositoryPort(ABC):
+    """Port interface for persisting asynchronous ingestion jobs and their queued documents."""
+
+    @abstractmethod
+    async def add(self, job: IngestionJob, document: InputDocument) -> None:
+        """Store a newly submitted job with the document it ingests.
+
+        Args:
+            job: The queued job.
+            document: The document to ingest.
+        """
+        pass
+
+    @abstractmethod
+    async def save(self, job: IngestionJob) -> None:
+        """Replace the stored state of a job.
+
+        Once the job is finished its document is no longer kept, nor the
+        checkpoints of its ingestion if the repository stores them.
+
+        Args:
+            job: The new state of the job.
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: UUID) -> Optional[IngestionJob]:
+        """Return the stored state of a job.
+
+        Args:
+            job_id: Identifier of the job.
+
+        Returns:
+            Optional[IngestionJob]: The job, or None if it is unknown or was evicted.
+        """
+        pass
+
+    @abstractmethod
+    async def list_unfinished(self) -> List[Tuple[IngestionJob, InputDocument]]:
+        """Return the queued and running jobs with their documents, oldest first.
+
+        Returns:
+            List[Tuple[IngestionJob, InputDocument]]: Jobs to resume, e.g. after a restart.
+        """
+        pass
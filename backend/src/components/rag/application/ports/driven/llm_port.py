@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 
-from src.components.rag.domain.value_objects import Message, Response
+from src.components.rag.domain.value_objects import Message, Response, ResponseChunk
 
 
 class LLMPort(ABC):
@@ -21,3 +21,19 @@ class LLMPort(ABC):
             Response: The generated response with metadata.
         """
         pass
+
+    @abstractmethod
+    def stream_response(
+        self,
+        messages: List[Message]
+    ) -> AsyncIterator[ResponseChunk]:
+        """Stream a text response from the LLM as it is generated.
+
+        Args:
+            messages: List of messages in conversation format.
+
+        Yields:
+            ResponseChunk: Incremental pieces of the response; token usage is
+                reported on the last chunk when the provider supports it.
+        """
+        pass
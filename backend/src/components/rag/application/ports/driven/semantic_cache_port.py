@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from src.components.rag.domain.value_objects import RAGResponse
+
+
+class SemanticCachePort(ABC):
+    """Port interface for caching RAG answers by query similarity."""
+
+    @abstractmethod
+    async def lookup(self, query_vector: List[float]) -> Optional[RAGResponse]:
+        """Return the stored answer of the most similar previous query, if similar enough.
+
+        Args:
+            query_vector: Embedding vector of the incoming query.
+
+        Returns:
+            Optional[RAGResponse]: The cached answer with its sources, or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    async def store(self, query_vector: List[float], response: RAGResponse, retrieved_at: datetime) -> None:
+        """Store the answer of a query.
+
+        The answer is dropped if the knowledge base was written after `retrieved_at`,
+        since its sources may already be outdated.
+
+        Args:
+            query_vector: Embedding vector of the query.
+            response: The generated answer with its sources.
+            retrieved_at: UTC time at which the sources were retrieved.
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self) -> None:
+        """Drop every cached answer, typically after the vector store was written."""
+        pass
@@ -10,7 +10,7 @@ class TextExtractionPort(ABC):
     """
 
     @abstractmethod
-    def extract_text(self, file: InputDocument) -> ExtractedContent:
+    async def extract_text(self, file: InputDocument) -> ExtractedContent:
         """
         Extracts text from a document and global metadata.
 
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
-from src.components.rag.domain.value_objects import Query, DocumentRetrieval
+from src.components.rag.domain.value_objects import Query, DocumentRetrieval, SearchFilter, SearchOptions
 
 
 class VectorRetrieverPort(ABC):
@@ -22,11 +22,17 @@ class VectorRetrieverPort(ABC):
     """
 
     @abstractmethod
-    async def search(self, query: list[float], *args, **kwargs) -> List[DocumentRetrieval]:
+    async def search(self, query: list[float], *args, search_filter: Optional[SearchFilter] = None,
+                     options: Optional[SearchOptions] = None, **kwargs) -> List[DocumentRetrieval]:
         """Search for the most relevant documents given a query.
 
         Args:
             query (list[float]): The domain vector query object representing the search request.
+            search_filter (Optional[SearchFilter]): Restricts the search to the chunks whose metadata
+                match, applied during the search rather than on its results.
+            options (Optional[SearchOptions]): Recall and latency trade-off of this search, e.g. a small
+                `hnsw_ef` for fast queries or `exact` for evaluation runs. Unset options use the
+                defaults of the implementation.
 
         Returns:
             List[DocumentRetrieval]: List of retrieved documents ranked by relevance.
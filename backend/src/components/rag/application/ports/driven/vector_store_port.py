@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Awaitable, Callable, List, Optional, Sequence
+from uuid import UUID
 
-from src.components.rag.domain.value_objects import StoreDocumentResult, DocumentRetrievalVector
+from src.components.rag.domain.value_objects import StoreDocumentResult, DocumentRetrieval, DocumentRetrievalVector, \
+    CollectionStorage, StorageTier
 
 
 class VectorStorePort(ABC):
@@ -15,15 +17,129 @@ class VectorStorePort(ABC):
     async def upsert(
             self,
             vector_documents: List[DocumentRetrievalVector],
+            on_batch: Optional[Callable[[int], Awaitable[None]]] = None,
     ) -> StoreDocumentResult:
         """
         Ingest a chunks from a document into the vector database.
 
         Args:
             vector_documents (List[DocumentRetrievalVector]): vectorized chunks to ingest into vector database
+            on_batch (Optional[Callable[[int], Awaitable[None]]]): Called with the number of chunks of each
+                batch once stored, to report the progress of the upsert
 
         Returns:
             List[str]: IDs of the document chunks stored in the vector database
         """
         pass
 
+    @abstractmethod
+    async def is_document_stored(self, document_id: UUID, document_hash: str) -> bool:
+        """
+        Check whether every chunk of a version of a document is stored in the vector database.
+
+        Chunks carry the id and content hash of their document and the chunk count of
+        the document in their metadata (`document_id`, `document_hash` and `chunk_count`).
+
+        Args:
+            document_id (UUID): Identifier of the document.
+            document_hash (str): Content hash of the version of the document.
+
+        Returns:
+            bool: True if all the chunks of the document with this content hash are stored.
+        """
+        pass
+
+    @abstractmethod
+    async def list_document_versions(self, document_id: UUID, filename: Optional[str] = None) -> List[Optional[str]]:
+        """
+        List the versions of a document with stored chunks.
+
+        Args:
+            document_id (UUID): Identifier of the document, recorded as `document_id` in the chunk metadata.
+            filename (Optional[str]): Name of the document, to also consider the chunks recorded under it only,
+                e.g. stored before document ids were recorded.
+
+        Returns:
+            List[Optional[str]]: Distinct content hashes (`document_hash`) of the stored chunks of the document,
+                None standing for chunks stored without one. Empty if no chunk of the document is stored.
+        """
+        pass
+
+    @abstractmethod
+    async def list_chunk_ids(self, document_id: UUID) -> List[UUID]:
+        """
+        List the ids of the stored chunks of a document.
+
+        Args:
+            document_id (UUID): Identifier of the document, recorded as `document_id` in the chunk metadata.
+
+        Returns:
+            List[UUID]: Ids of the chunks of the document, in no particular order.
+        """
+        pass
+
+    @abstractmethod
+    async def update_chunk_metadata(self, chunks: List[DocumentRetrieval]) -> None:
+        """
+        Replace the metadata of stored chunks, keeping their vectors.
+
+        Args:
+            chunks (List[DocumentRetrieval]): Stored chunks, with their new metadata.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_chunks(self, chunk_ids: List[UUID]) -> None:
+        """
+        Delete stored chunks.
+
+        Args:
+            chunk_ids (List[UUID]): Ids of the chunks to delete. Unknown ids are ignored.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_document(
+            self,
+            document_id: UUID,
+            filename: Optional[str] = None,
+            keep: Sequence[UUID] = (),
+    ) -> int:
+        """
+        Delete the stored chunks of a document.
+
+        Args:
+            document_id (UUID): Identifier of the document, recorded as `document_id` in the chunk metadata.
+            filename (Optional[str]): Name of the document, to also delete the chunks recorded under it only,
+                e.g. stored before document ids were recorded.
+            keep (Sequence[UUID]): Ids of chunks of the document to keep, e.g. those of its new version.
+
+        Returns:
+            int: Number of chunks deleted.
+        """
+        pass
+
+    @abstractmethod
+    async def get_storage(self) -> CollectionStorage:
+        """
+        Describe where the data of the collection is stored.
+
+        Returns:
+            CollectionStorage: The storage layout of the collection and whether it is being rewritten.
+        """
+        pass
+
+    @abstractmethod
+    async def set_storage_tier(self, tier: StorageTier) -> CollectionStorage:
+        """
+        Move the data of the existing collection to a storage tier.
+
+        The stored data is rewritten in the background; the collection stays searchable meanwhile.
+
+        Args:
+            tier (StorageTier): Target tier: HOT keeps the data in RAM, WARM memory-maps it from disk.
+
+        Returns:
+            CollectionStorage: The storage layout of the collection after the change was accepted.
+        """
+        pass
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, Optional
+from uuid import UUID
 
-from src.components.rag.domain.value_objects import InputDocument, StoreDocumentResult
+from src.components.rag.domain.value_objects import InputDocument, StoreDocumentResult, IngestionJob, \
+    BulkIngestionReport, DeleteDocumentResult
 
 
 class DocumentStorePort(ABC):
@@ -23,3 +25,57 @@ class DocumentStorePort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def replace_document(
+            self,
+            document: InputDocument,
+            all_versions: bool = False,
+    ) -> StoreDocumentResult:
+        """
+        Replace the stored chunks of a document, identified by its filename, with those of a new version.
+
+        A filename holding several stored versions is rejected unless `all_versions` is set.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_document(self, filename: str, all_versions: bool = False) -> DeleteDocumentResult:
+        """
+        Delete every stored chunk of a document from the system's knowledge base.
+
+        A filename holding several stored versions is rejected unless `all_versions` is set.
+        """
+        pass
+
+    @abstractmethod
+    async def add_documents(
+            self,
+            documents: Iterable[InputDocument],
+            replace: bool = False,
+    ) -> BulkIngestionReport:
+        """
+        Ingest many documents concurrently and report the outcome and throughput of the run.
+
+        A document whose filename holds a different stored document is rejected unless `replace` is set.
+        """
+        pass
+
+    @abstractmethod
+    async def submit_document(
+            self,
+            document: InputDocument,
+            replace: bool = False,
+    ) -> IngestionJob:
+        """
+        Queue a document for ingestion in the background and return the job tracking it.
+
+        A document whose filename holds a different stored document is rejected unless `replace` is set.
+        """
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: UUID) -> Optional[IngestionJob]:
+        """
+        Return the current state of an ingestion job, or None if it is unknown.
+        """
+        pass
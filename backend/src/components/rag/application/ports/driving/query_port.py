@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 
-from src.components.rag.domain.value_objects import Query, RAGResponse
+from src.components.rag.domain.value_objects import Query, RAGResponse, RAGStreamEvent
 
 
 class QueryPort(ABC):
@@ -35,3 +36,16 @@ class QueryPort(ABC):
             TODO
         """
         pass
+
+    @abstractmethod
+    def stream_query(self, request: Query) -> AsyncIterator[RAGStreamEvent]:
+        """Processes a chat message and streams the response as it is generated.
+
+        Args:
+            request (Query): The query object containing the user's message.
+
+        Yields:
+            RAGStreamEvent: The retrieved sources first, then the answer tokens,
+                then a final event with token usage and timings.
+        """
+        pass
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from src.components.rag.domain.services.document_store_service import DocumentConflictError, DocumentStoreService
+from src.components.rag.domain.value_objects import BulkDocumentResult, BulkIngestionReport, ChunkDiff, Embedding, \
+    InputDocument, PipelineStageMetrics, StoreDocumentResult
+from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
+
+STAGES = ("extract", "chunk", "embed", "upsert")
+
+
+class _PipelineItem:
+    """State of a document flowing through the pipeline."""
+
+    __slots__ = ("document", "replace", "size_bytes", "extracted", "diff", "embeddings", "result", "error",
+                 "conflict")
+
+    def __init__(self, document: InputDocument, replace: bool = False):
+        self.document = document
+        self.replace = replace
+        self.size_bytes = 0
+        self.extracted: Optional[ExtractedContent] = None
+        self.diff: Optional[ChunkDiff] = None
+        self.embeddings: Optional[List[Embedding]] = None
+        self.result: Optional[StoreDocumentResult] = None
+        self.error: Optional[str] = None
+        self.conflict = False
+
+    def to_result(self) -> BulkDocumentResult:
+        return BulkDocumentResult(filename=self.document.filename, size_bytes=self.size_bytes,
+                                  result=self.result, error=self.error, conflict=self.conflict)
+
+
+class _StageStats:
+    """Counters of one stage over one run."""
+
+    __slots__ = ("documents", "failed", "busy_seconds", "blocked_seconds")
+
+    def __init__(self):
+        self.documents = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+
+
+class BulkIngestionService:
+    """
+    Domain service ingesting many documents through a staged pipeline.
+
+    Ingestion is split into the extract, chunk, embed and upsert stages of
+    `DocumentStoreService`, each run by its own workers and connected by bounded
+    queues, so that document N+1 is extracted while document N is embedded and
+    document N-1 upserted. The wall-clock time of a run approaches that of its
+    slowest stage rather than the sum of the stages. A full queue blocks the stage
+    feeding it, which bounds the documents in memory. The concurrency of each stage
+    is a budget shared by all concurrent runs, and a failing document leaves the
+    pipeline without stopping the others, as does a document whose content is
+    already stored.
+
+    Documents follow the policy of `DocumentStoreService.ingest_document`: a different
+    document uploaded under a stored filename is rejected as a conflict unless the run
+    replaces documents, in which case it supersedes the stored one and only its changed
+    chunks are embedded. A document whose content is already stored is skipped in both
+    cases.
+    """
+
+    def __init__(
+            self,
+            document_store_service: DocumentStoreService,
+            extract_concurrency: int = 2,
+            chunk_concurrency: int = 2,
+            embed_concurrency: int = 2,
+            upsert_concurrency: int = 2,
+            queue_size: int = 4,
+    ):
+        """
+        Initialize the bulk ingestion service.
+
+        Args:
+            document_store_service: Service providing the ingestion stages.
+            extract_concurrency: Number of documents extracted at once, across all runs.
+            chunk_concurrency: Number of documents chunked at once, across all runs.
+            embed_concurrency: Number of documents embedded at once, across all runs.
+            upsert_concurrency: Number of documents upserted at once, across all runs.
+            queue_size: Capacity of the queue in front of each stage.
+        """
+        self.document_store_service = document_store_service
+        self.concurrency: Dict[str, int] = {
+            "extract": extract_concurrency,
+            "chunk": chunk_concurrency,
+            "embed": embed_concurrency,
+            "upsert": upsert_concurrency,
+        }
+        self.queue_size = queue_size
+        self._budgets = {stage: asyncio.Semaphore(workers) for stage, workers in self.concurrency.items()}
+        self._processors: Dict[str, Callable[[_PipelineItem], Awaitable[None]]] = {
+            "extract": self._extract,
+            "chunk": self._chunk,
+            "embed": self._embed,
+            "upsert": self._upsert,
+        }
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def _extract(self, item: _PipelineItem) -> None:
+        item.size_bytes = item.document.size_bytes
+        document_hash = await self.document_store_service.fingerprint_document(item.document)
+        # An unchanged document gets its result here and leaves the pipeline
+        item.result = await self.document_store_service.find_unchanged(item.document, document_hash)
+        if item.result is not None:
+            return
+        try:
+            if item.replace:
+                await self.document_store_service.check_unambiguous(item.document.filename)
+            else:
+                await self.document_store_service.check_filename_available(item.document, document_hash)
+        except DocumentConflictError:
+            item.conflict = True
+            raise
+        item.extracted = await self.document_store_service.extract_document(item.document, document_hash)
+
+    async def _chunk(self, item: _PipelineItem) -> None:
+        chunks = await self.document_store_service.chunk_document(item.extracted)
+        item.extracted = None
+        stored_chunk_ids = await self.document_store_service.list_stored_chunk_ids(item.document)
+        item.diff = self.document_store_service.diff_chunks(chunks, stored_chunk_ids)
+
+    async def _embed(self, item: _PipelineItem) -> None:
+        # Only the chunks absent from the stored version of the document are embedded
+        item.embeddings = await self.document_store_service.embed_chunks(item.diff.new)
+
+    async def _upsert(self, item: _PipelineItem) -> None:
+        # Outside a replacement, the stored chunks are those of an interrupted ingestion of the same content
+        vanished = item.diff.vanished if item.replace else []
+        item.result = await self.document_store_service.store_chunks(item.diff.new, item.embeddings,
+                                                                     item.diff.kept, vanished)
+        if item.replace:
+            chunk_ids = [chunk.id for chunk in item.diff.new + item.diff.kept]
+            item.result = await self.document_store_service.purge_replaced(item.document, chunk_ids, item.result)
+        item.diff = item.embeddings = None
+
+    async def _stage_worker(self, stage: str, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue],
+                            stats: _StageStats) -> None:
+        """Process the documents of a stage until cancelled, forwarding them to the next stage."""
+        while True:
+            item: _PipelineItem = await inbox.get()
+            try:
+                async with self._budgets[stage]:
+                    started = time.perf_counter()
+                    try:
+                        await self._processors[stage](item)
+                    except Exception as e:
+                        self.logger.error(f"_stage_worker :: {stage} failed for {item.document.filename}: {str(e)}")
+                        item.error = str(e)
+                        stats.failed += 1
+                    finally:
+                        stats.busy_seconds += time.perf_counter() - started
+                        stats.documents += 1
+
+                if item.error is None and item.result is None and outbox is not None:
+                    started = time.perf_counter()
+                    await outbox.put(item)
+                    stats.blocked_seconds += time.perf_counter() - started
+            finally:
+                inbox.task_done()
+
+    async def ingest(self, documents: Iterable[InputDocument], replace: bool = False) -> BulkIngestionReport:
+        """
+        Ingest documents through the staged pipeline.
+
+        The iterable is consumed lazily, as the first queue accepts documents, so that
+        a large directory walk is never materialized at once.
+
+        Args:
+            documents: Documents to ingest.
+            replace: Whether a document supersedes a different document stored under its filename, e.g.
+                to re-ingest an edited directory tree. A filename holding several stored documents is
+                still rejected as a conflict.
+
+        Returns:
+            BulkIngestionReport: Outcome of each document, throughput and per-stage metrics of the run.
+        """
+        self.logger.info(f"ingest :: Starting bulk ingestion (concurrency={self.concurrency}, "
+                         f"queue_size={self.queue_size}, replace={replace})")
+        started = time.perf_counter()
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in STAGES]
+        stats = {stage: _StageStats() for stage in STAGES}
+        items: List[_PipelineItem] = []
+
+        workers = [
+            asyncio.create_task(self._stage_worker(
+                stage, queues[position], queues[position + 1] if position + 1 < len(STAGES) else None, stats[stage]))
+            for position, stage in enumerate(STAGES)
+            for _ in range(self.concurrency[stage])
+        ]
+        try:
+            for document in documents:
+                item = _PipelineItem(document, replace)
+                items.append(item)
+                await queues[0].put(item)
+            # Documents only move forward, so each queue drains once the previous one has
+            for queue in queues:
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        elapsed_seconds = time.perf_counter() - started
+        report = BulkIngestionReport(
+            documents=[item.to_result() for item in items],
+            elapsed_seconds=elapsed_seconds,
+            stages=[
+                PipelineStageMetrics(
+                    stage=stage,
+                    workers=self.concurrency[stage],
+                    documents=stats[stage].documents,
+                    failed=stats[stage].failed,
+                    busy_seconds=round(stats[stage].busy_seconds, 3),
+                    blocked_seconds=round(stats[stage].blocked_seconds, 3),
+                    utilisation=round(stats[stage].busy_seconds / (elapsed_seconds * self.concurrency[stage]), 3)
+                    if elapsed_seconds > 0 else 0.0,
+                )
+                for stage in STAGES
+            ],
+        )
+        self.logger.info(
+            f"ingest :: Ingested {report.succeeded}/{len(report.documents)} documents, {report.ingested_chunks} chunks "
+            f"in {report.elapsed_seconds:.1f}s ({report.documents_per_second} docs/s, "
+            f"{report.chunks_per_second} chunks/s, {report.megabytes_per_second} MB/s)"
+        )
+        self.logger.info("ingest :: Stage utilisation: " + ", ".join(
+            f"{metrics.stage}={metrics.utilisation:.0%}" for metrics in report.stages))
+        return report
@@ -1,13 +1,64 @@
-from datetime import datetime
+import asyncio
+from collections import Counter
+from datetime import datetime, timezone
+import hashlib
 import logging
-from typing import List
+from typing import Awaitable, Callable, List, Optional, Sequence
+from uuid import NAMESPACE_URL, UUID, uuid5
 
-from src.components.rag.application.ports.driven import VectorStorePort, EmbeddingPort
+from src.components.rag.application.ports.driven import VectorStorePort, EmbeddingPort, SemanticCachePort, \
+    IngestionCheckpointPort
 from src.components.rag.application.ports.driven.text_chunking_port import TextChunkingPort
 from src.components.rag.application.ports.driven.text_extraction_port import TextExtractionPort
-from src.components.rag.domain.value_objects import InputDocument, Embedding, DocumentRetrieval, DocumentRetrievalVector
+from src.components.rag.domain.value_objects import InputDocument, Embedding, DocumentRetrieval, DocumentRetrievalVector, \
+    IngestionProgress, IngestionStage, IngestionCheckpoint, ChunkDiff
 from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
-from src.components.rag.domain.value_objects.input_document import StoreDocumentResult, StoreDocumentStatus
+from src.components.rag.domain.value_objects.input_document import DeleteDocumentResult, StoreDocumentResult, \
+    StoreDocumentStatus
+
+ProgressCallback = Callable[[IngestionProgress], Awaitable[None]]
+EmbeddedGroupCallback = Callable[[int, List[Embedding]], Awaitable[None]]
+StoredBatchCallback = Callable[[int], Awaitable[None]]
+
+# Namespaces of the ids derived from document filenames and chunk contents
+DOCUMENT_ID_NAMESPACE = uuid5(NAMESPACE_URL, "rag/documents")
+CHUNK_ID_NAMESPACE = uuid5(NAMESPACE_URL, "rag/document-chunks")
+
+
+def derive_document_id(filename: str) -> UUID:
+    """
+    Derive the id of a document from its filename, shared by its successive versions.
+
+    Args:
+        filename: Name of the document.
+
+    Returns:
+        UUID: The id of the document.
+    """
+    return uuid5(DOCUMENT_ID_NAMESPACE, filename)
+
+
+def derive_chunk_id(document_id: UUID, content_hash: str, occurrence: int = 0) -> UUID:
+    """
+    Derive the id of a chunk from its document and the hash of its text.
+
+    A chunk keeps its id across versions of the document as long as its text is
+    unchanged, wherever it moves in the document; `occurrence` tells apart the
+    chunks of a document with the same text.
+
+    Args:
+        document_id: Id of the document.
+        content_hash: SHA-256 hash of the text of the chunk.
+        occurrence: Number of earlier chunks of the document with the same text.
+
+    Returns:
+        UUID: The id of the chunk.
+    """
+    return uuid5(CHUNK_ID_NAMESPACE, f"{document_id}:{content_hash}:{occurrence}")
+
+
+class DocumentConflictError(RuntimeError):
+    """Raised when a document is stored under the filename of a different stored document."""
 
 
 class DocumentStoreService:
@@ -23,7 +74,10 @@ class DocumentStoreService:
         vector_store_port: VectorStorePort,
         embedding_port: EmbeddingPort,
         text_extraction_port: TextExtractionPort,
-        text_chunking_port: TextChunkingPort
+        text_chunking_port: TextChunkingPort,
+        semantic_cache_port: Optional[SemanticCachePort] = None,
+        embedding_group_size: int = 256,
+        checkpoint_port: Optional[IngestionCheckpointPort] = None
     ):
         """
         Initialize the document management service.
@@ -33,42 +87,294 @@ class DocumentStoreService:
             embedding_port: Port for generating vector embeddings from text
             text_extraction_port: Port for extracting text from documents
             text_chunking_port: Port for chunking text into smaller segments
+            semantic_cache_port: Optional answer cache to invalidate when the vector store is written
+            embedding_group_size: Number of chunks handed to the embedding port at once, between progress reports
+                and checkpoints
+            checkpoint_port: Optional store of intermediate results, from which interrupted ingestions resume
         """
         self.vector_store_port = vector_store_port
         self.embedding_port = embedding_port
         self.text_extraction_port = text_extraction_port
         self.text_chunking_port = text_chunking_port
+        self.semantic_cache_port = semantic_cache_port
+        self.embedding_group_size = max(1, embedding_group_size)
+        self.checkpoint_port = checkpoint_port
         self.logger = logging.getLogger(__name__)
 
-    def add_metadata(self, extracted_content: ExtractedContent, input_document: InputDocument) -> ExtractedContent:
+    def add_metadata(
+        self,
+        extracted_content: ExtractedContent,
+        input_document: InputDocument,
+        document_hash: Optional[str] = None,
+    ) -> ExtractedContent:
         """
         Add document-specific metadata to extracted content.
 
         Args:
             extracted_content (ExtractedContent): The extracted content with existing metadata.
             input_document (InputDocument): The input document containing filename and type.
+            document_hash (Optional[str]): Content hash of the document, recorded with each chunk if given.
 
         Returns:
             ExtractedContent: Updated extracted content with enhanced metadata.
         """
         self.logger.info("add_metadata :: Preparing metadata for chunking")
         metadata = extracted_content.metadata | {
+            "document_id": str(derive_document_id(input_document.filename)),
             "filename": input_document.filename,
             "document_type": input_document.type,
-            "ingested_at": datetime.now().isoformat(),
+            "ingested_at": datetime.now(timezone.utc).isoformat(),
         }
+        if document_hash is not None:
+            metadata["document_hash"] = document_hash
         self.logger.debug(f"add_metadata :: Complete metadata: {metadata}")
 
-        updated_extracted_content = ExtractedContent(
-            text=extracted_content.text,
-            metadata=metadata
-        )
+        updated_extracted_content = extracted_content.model_copy(update={"metadata": metadata})
 
         return updated_extracted_content
 
+    async def fingerprint_document(self, input_document: InputDocument) -> str:
+        """
+        Compute the content hash of a document.
+
+        Args:
+            input_document: The document to hash.
+
+        Returns:
+            str: The content hash, read in a worker thread for a document given by path.
+        """
+        if input_document.path is not None:
+            return await asyncio.to_thread(input_document.content_hash)
+        return input_document.content_hash()
+
+    async def find_unchanged(self, input_document: InputDocument, document_hash: str) -> Optional[StoreDocumentResult]:
+        """
+        Check whether the document is already fully stored with the same content.
+
+        Args:
+            input_document: The document, identified by its filename.
+            document_hash: Content hash of the document.
+
+        Returns:
+            Optional[StoreDocumentResult]: An UNCHANGED result if the document is stored, None otherwise.
+        """
+        document_id = derive_document_id(input_document.filename)
+        if not await self.vector_store_port.is_document_stored(document_id, document_hash):
+            return None
+        self.logger.info(f"find_unchanged :: Document {input_document.filename} is already stored with content "
+                         f"{document_hash}, skipping ingestion")
+        return StoreDocumentResult(total_chunks=0, ingested_chunks=0, failed_chunks=0,
+                                   status=StoreDocumentStatus.UNCHANGED)
+
+    async def check_filename_available(self, input_document: InputDocument, document_hash: str) -> None:
+        """
+        Check that no other document is stored under the filename of a document.
+
+        The filename identifies a document, so a different document uploaded under the
+        name of a stored one is rejected instead of being taken for a new version of it:
+        only `replace_document` supersedes a stored document.
+
+        Args:
+            input_document: The document, identified by its filename.
+            document_hash: Content hash of the document.
+
+        Raises:
+            DocumentConflictError: If chunks of another version of the document are stored.
+        """
+        versions = await self.vector_store_port.list_document_versions(derive_document_id(input_document.filename),
+                                                                       input_document.filename)
+        if any(version != document_hash for version in versions):
+            raise DocumentConflictError(f"Another document is already stored as {input_document.filename}; "
+                                        f"replace it or upload the document under another name")
+
+    async def extract_document(self, input_document: InputDocument,
+                               document_hash: Optional[str] = None) -> ExtractedContent:
+        """
+        Extract the text of a document and add its document-specific metadata.
+
+        Args:
+            input_document: The document to extract.
+            document_hash: Optional content hash of the document, from which a complete upsert is recognized.
+
+        Returns:
+            ExtractedContent: The extracted content, ready to be chunked.
+        """
+        self.logger.info("extract_document :: Extracting text and metadata from document")
+        extracted_content: ExtractedContent = await self.text_extraction_port.extract_text(input_document)
+
+        self.logger.info("extract_document :: Adding specific metadata for the document")
+        return self.add_metadata(extracted_content, input_document, document_hash)
+
+    async def chunk_document(self, extracted_content: ExtractedContent) -> List[DocumentRetrieval]:
+        """
+        Chunk extracted content into smaller segments.
+
+        When the metadata holds the id of the document, the chunk ids are derived from it
+        and from the hash of their text with `derive_chunk_id`. Each chunk also records
+        the hash of its text, the content hash of the document and the chunk count of the
+        document, from which a complete upsert is recognized.
+
+        Args:
+            extracted_content: The extracted content with its metadata.
+
+        Returns:
+            List[DocumentRetrieval]: The chunks, in document order.
+        """
+        self.logger.info("chunk_document :: Chunking text into smaller segments")
+        chunked_documents: List[DocumentRetrieval] = await self.text_chunking_port.chunk_text(extracted_content)
+        self.logger.debug(f"chunk_document :: Generated {len(chunked_documents)} chunks")
+
+        document_id = extracted_content.metadata.get("document_id")
+        if document_id is None:
+            return chunked_documents
+
+        document_metadata = {
+            "document_id": document_id,
+            "document_hash": extracted_content.metadata.get("document_hash"),
+            "chunk_count": len(chunked_documents),
+        }
+        occurrences: Counter = Counter()
+        identified_chunks: List[DocumentRetrieval] = []
+        for chunk in chunked_documents:
+            content_hash = hashlib.sha256(chunk.content.encode("utf-8")).hexdigest()
+            identified_chunks.append(chunk.model_copy(update={
+                "id": derive_chunk_id(UUID(document_id), content_hash, occurrences[content_hash]),
+                "metadata": (chunk.metadata or {}) | document_metadata | {"content_hash": content_hash},
+            }))
+            occurrences[content_hash] += 1
+        return identified_chunks
+
+    async def list_stored_chunk_ids(self, input_document: InputDocument) -> List[UUID]:
+        """
+        List the ids of the stored chunks of a document, i.e. of its previous version.
+
+        Args:
+            input_document: The document, identified by its filename.
+
+        Returns:
+            List[UUID]: Ids of the stored chunks of the document.
+        """
+        return await self.vector_store_port.list_chunk_ids(derive_document_id(input_document.filename))
+
+    @staticmethod
+    def diff_chunks(chunks: List[DocumentRetrieval], stored_chunk_ids: Sequence[UUID]) -> ChunkDiff:
+        """
+        Compare the chunks of a document with its stored chunks.
+
+        Since chunk ids are derived from the text of the chunks, the comparison is by id.
+
+        Args:
+            chunks: The chunks of the new version of the document.
+            stored_chunk_ids: Ids of the stored chunks of the document.
+
+        Returns:
+            ChunkDiff: The new chunks to embed, the stored chunks to keep and the ids of the chunks to delete.
+        """
+        stored = set(stored_chunk_ids)
+        chunk_ids = {chunk.id for chunk in chunks}
+        return ChunkDiff(
+            new=[chunk for chunk in chunks if chunk.id not in stored],
+            kept=[chunk for chunk in chunks if chunk.id in stored],
+            vanished=[chunk_id for chunk_id in stored_chunk_ids if chunk_id not in chunk_ids],
+        )
+
+    async def embed_chunks(
+        self,
+        chunks: List[DocumentRetrieval],
+        embedded: Sequence[Embedding] = (),
+        on_group: Optional[EmbeddedGroupCallback] = None,
+    ) -> List[Embedding]:
+        """
+        Embed chunks group by group, skipping the leading chunks already embedded.
+
+        Args:
+            chunks: The chunks to embed.
+            embedded: Embeddings of the leading chunks computed earlier, e.g. before an interruption.
+            on_group: Optional coroutine function called with the offset and embeddings of each new group.
+
+        Returns:
+            List[Embedding]: One embedding per chunk, in chunk order.
+        """
+        self.logger.info("embed_chunks :: Generating embeddings for document chunks")
+        embeddings: List[Embedding] = list(embedded[:len(chunks)])
+        for start in range(len(embeddings), len(chunks), self.embedding_group_size):
+            group = chunks[start:start + self.embedding_group_size]
+            group_embeddings = await self.embedding_port.embed_texts([chunk.content for chunk in group])
+            embeddings.extend(group_embeddings)
+            if on_group is not None:
+                await on_group(start, group_embeddings)
+        self.logger.debug(f"embed_chunks :: Generated {len(embeddings)} embeddings")
+        return embeddings
+
+    async def store_chunks(
+        self,
+        chunks: List[DocumentRetrieval],
+        embeddings: List[Embedding],
+        kept: Sequence[DocumentRetrieval] = (),
+        vanished: Sequence[UUID] = (),
+        on_batch: Optional[StoredBatchCallback] = None,
+    ) -> StoreDocumentResult:
+        """
+        Store embedded chunks in the vector repository and invalidate the answer cache.
+
+        For a new version of a stored document, the metadata of its unchanged chunks is
+        updated and its vanished chunks are deleted once the new chunks are stored. If no
+        new chunk could be stored, the previous version is left as it is.
+
+        Args:
+            chunks: The chunks to store.
+            embeddings: The embedding of each chunk, in chunk order.
+            kept: Chunks already stored, whose metadata is updated without re-embedding them.
+            vanished: Ids of the stored chunks to delete.
+            on_batch: Called with the number of chunks of each batch stored.
+
+        Returns:
+            StoreDocumentResult: Result of the upsert, counting the kept chunks as ingested, with the
+                embedding metrics.
+        """
+        if chunks:
+            vectors = [
+                DocumentRetrievalVector(**chunk.model_dump(), vector=embedding.vector)
+                for chunk, embedding in zip(chunks, embeddings)
+            ]
+            self.logger.debug(f"store_chunks :: Created {len(vectors)} vector documents")
+
+            # Upsert the document vectors into the repository
+            self.logger.info("store_chunks :: Storing document vectors in repository")
+            store_document_results: StoreDocumentResult = await self.vector_store_port.upsert(vectors, on_batch)
+        else:
+            store_document_results = StoreDocumentResult(total_chunks=0, ingested_chunks=0, failed_chunks=0,
+                                                         status=StoreDocumentStatus.SUCCESS)
+
+        if store_document_results.status != StoreDocumentStatus.ERROR:
+            if kept:
+                self.logger.info(f"store_chunks :: Updating metadata of {len(kept)} unchanged chunks")
+                await self.vector_store_port.update_chunk_metadata(list(kept))
+            if vanished:
+                self.logger.info(f"store_chunks :: Deleting {len(vanished)} vanished chunks")
+                await self.vector_store_port.delete_chunks(list(vanished))
+
+        if self.semantic_cache_port is not None:
+            self.logger.info("store_chunks :: Invalidating semantic answer cache")
+            await self.semantic_cache_port.invalidate()
+
+        metrics = (store_document_results.metrics or {}) | {
+            "embedding": self.embedding_port.get_metrics(),
+            "chunks": {"new": len(chunks), "kept": len(kept), "deleted": len(vanished)},
+        }
+        return store_document_results.model_copy(update={
+            "total_chunks": store_document_results.total_chunks + len(kept),
+            "ingested_chunks": store_document_results.ingested_chunks + len(kept),
+            "metrics": metrics,
+        })
+
     async def ingest_document(
         self, 
         input_document: InputDocument,
+        on_progress: Optional[ProgressCallback] = None,
+        job_id: Optional[UUID] = None,
+        replace: bool = False,
+        all_versions: bool = False,
     ) -> StoreDocumentResult:
         """
         Add a new document to the repository by processing, embedding, and storing it.
@@ -76,9 +382,27 @@ class DocumentStoreService:
         This method takes an input document, processes it into chunks, generates embeddings
         for each chunk, and stores the resulting vectors in the vector repository for
         retrieval purposes.
+
+        The filename identifies the document. A document whose content is already fully
+        stored is not extracted again: the result has the UNCHANGED status. A different
+        document stored under the same filename is left untouched and the ingestion is
+        rejected, unless `replace` is set. Otherwise the chunks are compared with the stored
+        chunks of the document, e.g. of an interrupted ingestion or of the version being
+        replaced: only the new chunks are embedded and upserted, and on a replacement the
+        chunks absent from the new version are deleted.
 StoreDocumentResult
         Args:
             input_document: The input document to be processed and added
+            on_progress: Optional coroutine function called with the progress at each stage
+                and after each group of embedded chunks
+            job_id: Optional identifier of the ingestion job. With a checkpoint port, the results of
+                each stage are saved under it and a previously interrupted run resumes after the last
+                completed stage
+            replace: If True, the document is ingested even if unchanged, and every stored chunk of the
+                document that is not part of the new version is deleted afterwards, including chunks
+                stored under its filename only. A filename holding several stored documents is rejected
+            all_versions: Whether a replacement supersedes every document stored under the filename when
+                there are several
 
         Returns:
             DocumentIngestionResult: Result object containing status and information about stored vectors
@@ -86,39 +410,166 @@ StoreDocumentResult
         Raises:
             ValueError: If document type is not supported
             ProcessingError: If document processing fails
+            DocumentConflictError: If another document is stored under the filename and `replace` is False,
+                or several documents are and `all_versions` is False
         """
         self.logger.info(f"ingest_document :: Starting document ingestion for file: {input_document.filename}")
-        
-        # Extract text and metadata from document
-        self.logger.info("ingest_document :: Extracting text and metadata from document")
-        extracted_content: ExtractedContent = await self.text_extraction_port.extract_text(input_document)
+        progress = IngestionProgress()
 
-        self.logger.info("ingest_document :: Adding specific metadata for the document")
-        updated_extracted_content = self.add_metadata(extracted_content, input_document)
+        async def report(**changes) -> None:
+            nonlocal progress
+            progress = progress.model_copy(update=changes)
+            if on_progress is not None:
+                await on_progress(progress)
 
-        # Chunk the text into smaller segments
-        self.logger.info("ingest_document :: Chunking text into smaller segments")
-        chunked_documents: List[DocumentRetrieval] = await self.text_chunking_port.chunk_text(updated_extracted_content)
-        self.logger.debug(f"ingest_document :: Generated {len(chunked_documents)} chunks")
-        
-        # Create vector documents with embeddings
-        self.logger.info("ingest_document :: Generating embeddings for document chunks")
-        vectors = []
-        for i, chunk in enumerate(chunked_documents):
-            self.logger.debug(f"ingest_document :: Processing chunk {i+1}/{len(chunked_documents)}")
-            
-            # Generate embedding for each chunk
-            embedding: Embedding = await self.embedding_port.embed_text(chunk.content)
-            self.logger.debug(f"ingest_document :: Generated embedding with dimension: {len(embedding.vector) if embedding else 0}")
-            
-            # Create vector document
-            vector = DocumentRetrievalVector(**chunk.model_dump(), vector=embedding.vector)
-            vectors.append(vector)
-        
-        self.logger.debug(f"ingest_document :: Created {len(vectors)} vector documents")
+        checkpointing = self.checkpoint_port is not None and job_id is not None
+        checkpoint = await self.checkpoint_port.load(job_id) if checkpointing else IngestionCheckpoint()
+
+        chunked_documents: Optional[List[DocumentRetrieval]] = checkpoint.chunks
+        stored_chunk_ids: Optional[List[UUID]] = checkpoint.stored_chunk_ids
+        if chunked_documents is not None:
+            self.logger.info(f"ingest_document :: Resuming from {len(chunked_documents)} checkpointed chunks")
+        else:
+            extracted_content: Optional[ExtractedContent] = checkpoint.extracted
+            if extracted_content is not None:
+                self.logger.info("ingest_document :: Resuming from checkpointed extracted content")
+            else:
+                await report(stage=IngestionStage.EXTRACTING)
+                document_hash = await self.fingerprint_document(input_document)
+                if replace:
+                    if not all_versions:
+                        await self.check_unambiguous(input_document.filename)
+                else:
+                    unchanged = await self.find_unchanged(input_document, document_hash)
+                    if unchanged is not None:
+                        await report(stage=IngestionStage.DONE)
+                        return unchanged
+                    await self.check_filename_available(input_document, document_hash)
+                extracted_content = await self.extract_document(input_document, document_hash)
+                if checkpointing:
+                    await self.checkpoint_port.save_extracted(job_id, extracted_content)
+
+            await report(stage=IngestionStage.CHUNKING)
+            chunked_documents = await self.chunk_document(extracted_content)
+            # Saved with the chunks, so that a resumed ingestion embeds the same new chunks
+            stored_chunk_ids = await self.list_stored_chunk_ids(input_document)
+            if checkpointing:
+                await self.checkpoint_port.save_chunks(job_id, chunked_documents, stored_chunk_ids)
+
+        diff = self.diff_chunks(chunked_documents, stored_chunk_ids or [])
+        # Outside a replacement, the stored chunks are those of an interrupted ingestion of the same content
+        vanished = diff.vanished if replace else []
+        self.logger.info(f"ingest_document :: {len(diff.new)} new, {len(diff.kept)} unchanged and "
+                         f"{len(vanished)} vanished chunks")
+
+        async def on_group(offset: int, group_embeddings: List[Embedding]) -> None:
+            if checkpointing:
+                await self.checkpoint_port.save_embeddings(job_id, offset, group_embeddings)
+            await report(chunks_embedded=len(diff.kept) + offset + len(group_embeddings))
+
+        # Skip the groups embedded before an interruption
+        embedded = checkpoint.embeddings[:len(diff.new)]
+        await report(stage=IngestionStage.EMBEDDING, chunks_total=len(chunked_documents),
+                     chunks_embedded=len(diff.kept) + len(embedded))
+        embeddings = await self.embed_chunks(diff.new, embedded, on_group)
 
-        # Upsert the document vectors into the repository
-        self.logger.info("ingest_document :: Storing document vectors in repository")
-        store_document_results: StoreDocumentResult = await self.vector_store_port.upsert(vectors)
+        async def on_batch(count: int) -> None:
+            await report(chunks_upserted=progress.chunks_upserted + count)
 
+        await report(stage=IngestionStage.UPSERTING)
+        store_document_results = await self.store_chunks(diff.new, embeddings, diff.kept, vanished, on_batch)
+        if replace:
+            chunk_ids = [chunk.id for chunk in chunked_documents]
+            store_document_results = await self.purge_replaced(input_document, chunk_ids, store_document_results)
+        await report(stage=IngestionStage.DONE, chunks_upserted=store_document_results.ingested_chunks)
         return store_document_results
+
+    async def purge_replaced(self, input_document: InputDocument, chunk_ids: Sequence[UUID],
+                             store_document_results: StoreDocumentResult) -> StoreDocumentResult:
+        """
+        Delete the stored chunks of a replaced document that are not part of its new version.
+
+        Nothing is deleted if no chunk of the new version could be stored.
+
+        Args:
+            input_document: The new version of the document, identified by its filename.
+            chunk_ids: Ids of every chunk of the new version, new or kept.
+            store_document_results: Result of storing the new version.
+
+        Returns:
+            StoreDocumentResult: The result, with the purged chunks counted as deleted.
+        """
+        if store_document_results.status == StoreDocumentStatus.ERROR:
+            return store_document_results
+        purged = await self.vector_store_port.delete_document(
+            derive_document_id(input_document.filename), input_document.filename, keep=list(chunk_ids),
+        )
+        chunk_metrics = store_document_results.metrics["chunks"]
+        return store_document_results.model_copy(update={
+            "metrics": store_document_results.metrics | {
+                "chunks": chunk_metrics | {"deleted": chunk_metrics["deleted"] + purged}
+            },
+        })
+
+    async def check_unambiguous(self, filename: str) -> None:
+        """
+        Check that a filename designates a single stored document.
+
+        Since ingestions reject a different document under a stored filename, a filename
+        only holds several versions when they were stored before that check existed, or
+        by concurrent uploads of different documents under the same name. Replacing or
+        deleting by such a filename would wipe all of them at once.
+
+        Args:
+            filename: Name of the document.
+
+        Raises:
+            DocumentConflictError: If chunks of several versions of the document are stored.
+        """
+        versions = await self.vector_store_port.list_document_versions(derive_document_id(filename), filename)
+        if len(versions) > 1:
+            raise DocumentConflictError(f"{len(versions)} different documents are stored as {filename}; "
+                                        f"confirm that all of them are meant")
+
+    async def replace_document(self, input_document: InputDocument, all_versions: bool = False) -> StoreDocumentResult:
+        """
+        Replace the stored chunks of a document with those of a new version.
+
+        Unlike `ingest_document`, the document is ingested even if its content is
+        unchanged, and no chunk of a previous version is left behind.
+
+        Args:
+            input_document: The new version of the document, identified by its filename.
+            all_versions: Whether to replace every document stored under the filename when there are several.
+
+        Returns:
+            StoreDocumentResult: Result of the ingestion of the new version.
+
+        Raises:
+            DocumentConflictError: If several documents are stored under the filename and `all_versions` is False.
+        """
+        self.logger.info(f"replace_document :: Replacing document {input_document.filename}")
+        return await self.ingest_document(input_document, replace=True, all_versions=all_versions)
+
+    async def delete_document(self, filename: str, all_versions: bool = False) -> DeleteDocumentResult:
+        """
+        Delete every stored chunk of a document and invalidate the answer cache.
+
+        Args:
+            filename: Name of the document.
+            all_versions: Whether to delete every document stored under the filename when there are several.
+
+        Returns:
+            DeleteDocumentResult: The number of chunks deleted, 0 if the document is unknown.
+
+        Raises:
+            DocumentConflictError: If several documents are stored under the filename and `all_versions` is False.
+        """
+        self.logger.info(f"delete_document :: Deleting document {filename}")
+        if not all_versions:
+            await self.check_unambiguous(filename)
+        deleted_chunks = await self.vector_store_port.delete_document(derive_document_id(filename), filename)
+        if deleted_chunks and self.semantic_cache_port is not None:
+            self.logger.info("delete_document :: Invalidating semantic answer cache")
+            await self.semantic_cache_port.invalidate()
+        return DeleteDocumentResult(filename=filename, deleted_chunks=deleted_chunks)
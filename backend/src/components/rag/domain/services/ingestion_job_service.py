@@ -0,0 +1,175 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.components.rag.application.ports.driven import IngestionJobRepositoryPort
+from src.components.rag.domain.services.document_store_service import DocumentStoreService
+from src.components.rag.domain.value_objects import InputDocument, IngestionJob, IngestionJobStatus, \
+    IngestionProgress, IngestionStage
+
+ReleaseDocument = Callable[[InputDocument], None]
+
+
+class IngestionQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the ingestion queue is full."""
+
+
+class IngestionJobService:
+    """
+    Domain service running document ingestions as background jobs.
+
+    Submitted documents are queued and ingested by a fixed number of worker tasks
+    through `DocumentStoreService.ingest_document`, so that clients get a job id back
+    immediately and poll its stage and chunk counters instead of holding a request
+    open for the whole ingestion. The queue is bounded: submissions beyond its
+    capacity are rejected rather than buffered without limit.
+
+    Jobs are stored with their document by the job repository. Stopping the service
+    leaves unfinished jobs as they are, and `start` queues them again; with a durable
+    repository and checkpoint store they resume after their last completed stage.
+    """
+
+    def __init__(
+            self,
+            document_store_service: DocumentStoreService,
+            job_repository: IngestionJobRepositoryPort,
+            max_workers: int = 2,
+            max_queued: int = 100,
+            release_document: Optional[ReleaseDocument] = None,
+    ):
+        """
+        Initialize the ingestion job service.
+
+        Args:
+            document_store_service: Service ingesting a single document.
+            job_repository: Port storing the state of the jobs.
+            max_workers: Number of documents ingested concurrently.
+            max_queued: Maximum number of submitted jobs waiting for a worker.
+            release_document: Optional callable invoked with the document of each finished job,
+                e.g. to delete a spooled file.
+        """
+        self.document_store_service = document_store_service
+        self.job_repository = job_repository
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.release_document = release_document
+        # Unbounded so that resumed jobs are always queued; submissions are bounded by `max_queued`
+        self._queue: asyncio.Queue[Tuple[IngestionJob, InputDocument]] = asyncio.Queue()
+        # Ids of the jobs queued or running in this process
+        self._pending: Set[UUID] = set()
+        self._workers: List[asyncio.Task] = []
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def start(self) -> None:
+        """Queue the unfinished jobs of a previous run and start the worker tasks.
+
+        Does nothing if the workers are already running.
+        """
+        if self._workers:
+            return
+        for job, document in await self.job_repository.list_unfinished():
+            if job.id in self._pending:
+                continue
+            self.logger.info(f"start :: Resuming job {job.id} for {job.filename} at stage {job.progress.stage.value}")
+            job = await self._update(job, status=IngestionJobStatus.QUEUED)
+            self._enqueue(job, document)
+        self.logger.info(f"start :: Starting {self.max_workers} ingestion workers")
+        self._workers = [asyncio.create_task(self._worker(), name=f"ingestion-worker-{index}")
+                         for index in range(self.max_workers)]
+
+    async def submit(self, document: InputDocument, replace: bool = False) -> IngestionJob:
+        """
+        Queue a document for ingestion.
+
+        Args:
+            document: The document to ingest. If the submission is rejected, it is not released.
+            replace: Whether the document supersedes a different document stored under its filename,
+                as with `DocumentStoreService.replace_document`.
+
+        Returns:
+            IngestionJob: The queued job.
+
+        Raises:
+            IngestionQueueFullError: If the queue is full.
+        """
+        if self._queue.qsize() >= self.max_queued:
+            self.logger.warning(f"submit :: Ingestion queue full, rejecting {document.filename}")
+            raise IngestionQueueFullError("The ingestion queue is full, retry later")
+
+        job = IngestionJob(filename=document.filename, replace=replace)
+        await self.job_repository.add(job, document)
+        self._enqueue(job, document)
+        self.logger.info(f"submit :: Queued job {job.id} for {document.filename} ({self._queue.qsize()} queued)")
+        return job
+
+    async def get_job(self, job_id: UUID) -> Optional[IngestionJob]:
+        """
+        Return the current state of a job.
+
+        Args:
+            job_id: Identifier of the job.
+
+        Returns:
+            Optional[IngestionJob]: The job, or None if it is unknown.
+        """
+        return await self.job_repository.get(job_id)
+
+    async def close(self) -> None:
+        """Stop the workers, leaving the unfinished jobs to be resumed by the next `start`."""
+        self.logger.info("close :: Stopping ingestion workers")
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._pending.clear()
+
+    def _enqueue(self, job: IngestionJob, document: InputDocument) -> None:
+        """Queue a job for the workers."""
+        self._pending.add(job.id)
+        self._queue.put_nowait((job, document))
+
+    async def _update(self, job: IngestionJob, **changes) -> IngestionJob:
+        """Store a new state of a job and return it."""
+        job = job.model_copy(update=changes | {"updated_at": datetime.now(timezone.utc)})
+        await self.job_repository.save(job)
+        return job
+
+    async def _finish(self, job: IngestionJob, document: InputDocument, **changes) -> None:
+        """Store the final state of a job and release its document."""
+        await self._update(job, progress=job.progress.model_copy(update={"stage": IngestionStage.DONE}), **changes)
+        if self.release_document is not None:
+            self.release_document(document)
+
+    async def _run(self, job: IngestionJob, document: InputDocument) -> None:
+        """Ingest the document of a job, recording progress and outcome."""
+        job = await self._update(job, status=IngestionJobStatus.RUNNING)
+
+        async def on_progress(progress: IngestionProgress) -> None:
+            nonlocal job
+            job = await self._update(job, progress=progress)
+
+        try:
+            result = await self.document_store_service.ingest_document(document, on_progress=on_progress,
+                                                                       job_id=job.id, replace=job.replace)
+        except Exception as e:
+            self.logger.error(f"_run :: Job {job.id} failed: {str(e)}")
+            await self._finish(job, document, status=IngestionJobStatus.FAILED, error=str(e))
+            return
+
+        self.logger.info(f"_run :: Job {job.id} succeeded with {result.ingested_chunks} chunks")
+        await self._finish(job, document, status=IngestionJobStatus.SUCCEEDED, result=result)
+
+    async def _worker(self) -> None:
+        """Ingest queued documents one at a time until cancelled."""
+        while True:
+            job, document = await self._queue.get()
+            try:
+                await self._run(job, document)
+            finally:
+                self._pending.discard(job.id)
+                self._queue.task_done()
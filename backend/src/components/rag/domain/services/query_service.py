@@ -1,10 +1,14 @@
 import logging
-from typing import List
+import time
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
 
 
-from src.components.rag.application.ports.driven import VectorRetrieverPort, LLMPort, EmbeddingPort
+from src.components.rag.application.ports.driven import VectorRetrieverPort, LLMPort, EmbeddingPort, \
+    SemanticCachePort
 from src.components.rag.config import RAGConfig
-from src.components.rag.domain.value_objects import Query, DocumentRetrieval, Message, RAGResponse, Embedding
+from src.components.rag.domain.value_objects import Query, DocumentRetrieval, Message, RAGResponse, Embedding, \
+    RAGStreamEvent, SourcesEvent, TokenEvent, CompletedEvent, SearchFilter, SearchOptions
 from src.components.rag.domain.value_objects.message_role import MessageRole
 
 
@@ -17,6 +21,7 @@ class QueryService:
             llm_port: LLMPort,
             embedding_port: EmbeddingPort,
             rag_config: RAGConfig,
+            semantic_cache_port: Optional[SemanticCachePort] = None,
     ):
         """Initialize QueryService.
 
@@ -25,25 +30,33 @@ class QueryService:
             llm_port: LLM interface.
             embedding_port: Text embedding interface.
             rag_config: RAG configuration.
+            semantic_cache_port: Optional answer cache looked up by query similarity.
         """
         self.rag_config = rag_config
+        self.semantic_cache_port = semantic_cache_port
         self.embedding_port = embedding_port
         self.vector_retriever_port = vector_retriever_port
         self.llm_port = llm_port
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info("QueryService initialized successfully")
 
-    async def _retrieve_relevant_documents(self, query_embedding: Embedding) -> List[DocumentRetrieval]:
+    async def _retrieve_relevant_documents(self, query_embedding: Embedding,
+                                           search_filter: Optional[SearchFilter] = None,
+                                           search_options: Optional[SearchOptions] = None) -> List[DocumentRetrieval]:
         """Retrieve relevant documents using vector search.
 
         Args:
             query_embedding: Query embedding vector.
+            search_filter: Optional restriction of the search to the chunks whose metadata match.
+            search_options: Optional recall and latency trade-off of the search.
 
         Returns:
             List of relevant documents.
         """
         self.logger.debug("Starting document retrieval ...")
-        retrieved_documents = await self.vector_retriever_port.search(query=query_embedding.vector)
+        retrieved_documents = await self.vector_retriever_port.search(query=query_embedding.vector,
+                                                                      search_filter=search_filter,
+                                                                      options=search_options)
         self.logger.info(f"Retrieved {len(retrieved_documents)} documents from vector search")
         self.logger.debug(f"Retrieved document IDs: {[doc.id for doc in retrieved_documents]}")
         return retrieved_documents
@@ -72,6 +85,18 @@ class QueryService:
         self.logger.debug(f"Total context length: {len(context_content)} characters")
         return messages
 
+    def _uses_semantic_cache(self, query: Query) -> bool:
+        """Return True if the query may be answered from, and stored in, the semantic cache.
+
+        The cache is keyed by the query vector alone, so a filtered query bypasses it:
+        its answer only holds for the documents it was restricted to. So does a query
+        with search options, e.g. an exact search of an evaluation run, whose sources
+        must come from its own retrieval.
+        """
+        return self.semantic_cache_port is not None \
+            and (query.search_filter is None or query.search_filter.is_empty) \
+            and (query.search_options is None or query.search_options.is_empty)
+
     @staticmethod
     async def _validate_query(query: Query) -> Query:
         """Validate query content.
@@ -109,19 +134,30 @@ class QueryService:
         self.logger.debug("Generating query embedding")
         query_embedding = await self.embedding_port.embed_text(validated_query.content)
 
-        # Step 3: Retrieve relevant documents and build context messages
-        retrieved_documents = await self._retrieve_relevant_documents(query_embedding=query_embedding)
+        # Step 3: Serve a previous answer to a similar enough query
+        use_cache = self._uses_semantic_cache(validated_query)
+        if use_cache:
+            cached_response = await self.semantic_cache_port.lookup(query_embedding.vector)
+            if cached_response is not None:
+                self.logger.info("Query answered from semantic cache")
+                return cached_response
+
+        # Step 4: Retrieve relevant documents and build context messages
+        retrieved_at = datetime.now(timezone.utc)
+        retrieved_documents = await self._retrieve_relevant_documents(query_embedding=query_embedding,
+                                                                      search_filter=validated_query.search_filter,
+                                                                      search_options=validated_query.search_options)
         
         context_messages = await self._build_context_messages(validated_query.content, retrieved_documents)
 
-        # Step 4: Generate response from LLM
+        # Step 5: Generate response from LLM
         self.logger.debug("Sending request to LLM")
         llm_response = await self.llm_port.generate_response(context_messages)
         self.logger.info("LLM response generated successfully")
 
         self.logger.info("Query processing completed successfully for query")
-        # Step 5: Format and return RAG response
-        return RAGResponse(
+        # Step 6: Format and return RAG response
+        rag_response = RAGResponse(
             content=llm_response.content,
             generated_at=llm_response.generated_at,
             model_used=llm_response.model_used,
@@ -130,3 +166,89 @@ class QueryService:
             output_tokens=llm_response.output_tokens,
             sources=retrieved_documents
         )
+
+        if use_cache:
+            await self.semantic_cache_port.store(query_embedding.vector, rag_response, retrieved_at=retrieved_at)
+
+        return rag_response
+
+    async def stream_query(self, query: Query) -> AsyncIterator[RAGStreamEvent]:
+        """Process query and stream the RAG response as it is generated.
+
+        Emits the retrieved sources first, then the answer tokens, then a final
+        event with token usage and timings (including time-to-first-token).
+
+        Args:
+            query: User query to process.
+
+        Yields:
+            RAGStreamEvent: Sources event, token events, then a completed event.
+        """
+        self.logger.info("Starting streamed query processing")
+        start = time.perf_counter()
+
+        validated_query = await self._validate_query(query)
+        query_embedding = await self.embedding_port.embed_text(validated_query.content)
+
+        use_cache = self._uses_semantic_cache(validated_query)
+        if use_cache:
+            cached_response = await self.semantic_cache_port.lookup(query_embedding.vector)
+            if cached_response is not None:
+                self.logger.info("Streamed query answered from semantic cache")
+                yield SourcesEvent(sources=cached_response.sources)
+                yield TokenEvent(content=cached_response.content)
+                elapsed_ms = int((time.perf_counter() - start) * 1000)
+                yield CompletedEvent(
+                    model_used=cached_response.model_used,
+                    input_tokens=cached_response.input_tokens,
+                    output_tokens=cached_response.output_tokens,
+                    time_to_first_token_ms=elapsed_ms,
+                    processing_time_ms=elapsed_ms,
+                    cached=True,
+                )
+                return
+
+        retrieved_at = datetime.now(timezone.utc)
+        retrieved_documents = await self._retrieve_relevant_documents(query_embedding=query_embedding,
+                                                                      search_filter=validated_query.search_filter,
+                                                                      search_options=validated_query.search_options)
+        yield SourcesEvent(sources=retrieved_documents)
+
+        context_messages = await self._build_context_messages(validated_query.content, retrieved_documents)
+
+        self.logger.debug("Streaming request to LLM")
+        parts: List[str] = []
+        time_to_first_token_ms = None
+        model_used = input_tokens = output_tokens = None
+        async for chunk in self.llm_port.stream_response(context_messages):
+            model_used = chunk.model_used or model_used
+            input_tokens = chunk.input_tokens if chunk.input_tokens is not None else input_tokens
+            output_tokens = chunk.output_tokens if chunk.output_tokens is not None else output_tokens
+            if not chunk.content:
+                continue
+            if time_to_first_token_ms is None:
+                time_to_first_token_ms = int((time.perf_counter() - start) * 1000)
+                self.logger.info(f"First token after {time_to_first_token_ms}ms")
+            parts.append(chunk.content)
+            yield TokenEvent(content=chunk.content)
+
+        processing_time_ms = int((time.perf_counter() - start) * 1000)
+        self.logger.info(f"Streamed query processing completed in {processing_time_ms}ms")
+        yield CompletedEvent(
+            model_used=model_used,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            time_to_first_token_ms=time_to_first_token_ms,
+            processing_time_ms=processing_time_ms,
+        )
+
+        if use_cache:
+            rag_response = RAGResponse(
+                content="".join(parts),
+                model_used=model_used,
+                processing_time_ms=processing_time_ms,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                sources=retrieved_documents
+            )
+            await self.semantic_cache_port.store(query_embedding.vector, rag_response, retrieved_at=retrieved_at)
@@ -1,18 +1,44 @@
+from .bulk_ingestion import BulkDocumentResult, BulkIngestionReport, PipelineStageMetrics
+from .chunk_diff import ChunkDiff
+from .collection_storage import CollectionStorage, StorageTier
 from .document_retrieval import DocumentRetrieval, DocumentRetrievalVector
 from .embedding import Embedding
-from .input_document import InputDocument, StoreDocumentResult
+from .input_document import DeleteDocumentResult, InputDocument, StoreDocumentResult
+from .ingestion_job import IngestionCheckpoint, IngestionJob, IngestionJobStatus, IngestionProgress, IngestionStage
 from .message import Message
 from .query import Query
-from .responses import Response, RAGResponse
+from .responses import Response, ResponseChunk, RAGResponse
+from .rag_stream_event import RAGStreamEvent, SourcesEvent, TokenEvent, CompletedEvent
+from .search_filter import SearchFilter
+from .search_options import SearchOptions
 
 __all__ = [
+    "BulkDocumentResult",
+    "BulkIngestionReport",
+    "PipelineStageMetrics",
+    "ChunkDiff",
+    "CollectionStorage",
+    "StorageTier",
     "DocumentRetrieval",
     "DocumentRetrievalVector",
     "Embedding",
+    "DeleteDocumentResult",
     "InputDocument",
     "StoreDocumentResult",
+    "IngestionCheckpoint",
+    "IngestionJob",
+    "IngestionJobStatus",
+    "IngestionProgress",
+    "IngestionStage",
     "Message",
     "Query",
     "RAGResponse",
     "Response",
+    "ResponseChunk",
+    "RAGStreamEvent",
+    "SourcesEvent",
+    "TokenEvent",
+    "CompletedEvent",
+    "SearchFilter",
+    "SearchOptions",
 ]
@@ -0,0 +1,117 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+from src.components.rag.domain.value_objects.input_document import StoreDocumentResult, StoreDocumentStatus
+
+
+class BulkDocumentResult(BaseModel):
+    """
+    Outcome of one document of a bulk ingestion.
+
+    Attributes:
+        filename (str): Name of the document.
+        size_bytes (int): Size of the document.
+        result (Optional[StoreDocumentResult]): Result of the ingestion, if it completed.
+        error (Optional[str]): Error message, if the ingestion failed.
+        conflict (bool): Whether the ingestion was rejected because of the documents stored under the filename.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    filename: str = Field(..., description="Name of the document")
+    size_bytes: int = Field(..., description="Size of the document in bytes")
+    result: Optional[StoreDocumentResult] = Field(default=None, description="Result of the ingestion, if it completed")
+    error: Optional[str] = Field(default=None, description="Error message, if the ingestion failed")
+    conflict: bool = Field(default=False, description="Whether the ingestion was rejected because of the "
+                                                      "documents stored under the filename")
+
+
+class PipelineStageMetrics(BaseModel):
+    """
+    Activity of one stage of the ingestion pipeline over a bulk ingestion.
+
+    Attributes:
+        stage (str): Name of the stage.
+        workers (int): Number of documents the stage processes at once.
+        documents (int): Number of documents processed by the stage.
+        failed (int): Number of documents that failed in the stage.
+        busy_seconds (float): Time spent processing documents, summed over the workers.
+        blocked_seconds (float): Time spent waiting for room in the next stage's queue (backpressure).
+        utilisation (float): Share of the workers' time spent processing; the bottleneck stage is close to 1.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    stage: str = Field(..., description="Name of the stage")
+    workers: int = Field(..., description="Number of documents the stage processes at once")
+    documents: int = Field(..., description="Number of documents processed by the stage")
+    failed: int = Field(..., description="Number of documents that failed in the stage")
+    busy_seconds: float = Field(..., description="Time spent processing documents, summed over the workers")
+    blocked_seconds: float = Field(..., description="Time spent waiting for room in the next stage's queue")
+    utilisation: float = Field(..., description="Share of the workers' time spent processing documents")
+
+
+class BulkIngestionReport(BaseModel):
+    """
+    Outcome and throughput of a bulk ingestion.
+
+    Attributes:
+        documents (List[BulkDocumentResult]): Outcome of each document, in submission order.
+        elapsed_seconds (float): Wall-clock duration of the ingestion.
+        stages (List[PipelineStageMetrics]): Activity of each stage of the pipeline, in pipeline order.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    documents: List[BulkDocumentResult] = Field(default_factory=list,
+                                                description="Outcome of each document, in submission order")
+    elapsed_seconds: float = Field(..., description="Wall-clock duration of the ingestion")
+    stages: List[PipelineStageMetrics] = Field(default_factory=list,
+                                               description="Activity of each stage of the pipeline, in pipeline order")
+
+    @computed_field(description="Number of documents ingested without error")
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for document in self.documents if document.error is None)
+
+    @computed_field(description="Number of documents whose ingestion failed")
+    @property
+    def failed(self) -> int:
+        return len(self.documents) - self.succeeded
+
+    @computed_field(description="Number of documents rejected because of the documents stored under their filename")
+    @property
+    def conflicts(self) -> int:
+        return sum(1 for document in self.documents if document.conflict)
+
+    @computed_field(description="Number of documents skipped because their content was already stored")
+    @property
+    def unchanged(self) -> int:
+        return sum(1 for document in self.documents
+                   if document.result is not None and document.result.status == StoreDocumentStatus.UNCHANGED)
+
+    @computed_field(description="Number of chunks stored in the vector database")
+    @property
+    def ingested_chunks(self) -> int:
+        return sum(document.result.ingested_chunks for document in self.documents if document.result is not None)
+
+    @computed_field(description="Total size of the documents in bytes")
+    @property
+    def total_bytes(self) -> int:
+        return sum(document.size_bytes for document in self.documents)
+
+    def _rate(self, amount: float) -> float:
+        return round(amount / self.elapsed_seconds, 3) if self.elapsed_seconds > 0 else 0.0
+
+    @computed_field(description="Documents processed per second")
+    @property
+    def documents_per_second(self) -> float:
+        return self._rate(len(self.documents))
+
+    @computed_field(description="Chunks stored per second")
+    @property
+    def chunks_per_second(self) -> float:
+        return self._rate(self.ingested_chunks)
+
+    @computed_field(description="Megabytes of documents processed per second")
+    @property
+    def megabytes_per_second(self) -> float:
+        return self._rate(self.total_bytes / (1024 * 1024))
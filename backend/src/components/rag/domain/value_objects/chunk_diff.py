@@ -0,0 +1,27 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.components.rag.domain.value_objects.document_retrieval import DocumentRetrieval
+
+
+class ChunkDiff(BaseModel):
+    """
+    Difference between the chunks of a new version of a document and the stored chunks.
+
+    Chunk ids are derived from the document and the chunk text, so an unchanged chunk
+    keeps its id from one version to the next.
+
+    Attributes:
+        new (List[DocumentRetrieval]): Chunks not stored yet, to embed and upsert.
+        kept (List[DocumentRetrieval]): Chunks already stored, whose vectors are reused.
+        vanished (List[UUID]): Ids of the stored chunks absent from the new version, to delete.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    new: List[DocumentRetrieval] = Field(default_factory=list, description="Chunks not stored yet, to embed and upsert")
+    kept: List[DocumentRetrieval] = Field(default_factory=list,
+                                          description="Chunks already stored, whose vectors are reused")
+    vanished: List[UUID] = Field(default_factory=list,
+                                 description="Ids of the stored chunks absent from the new version, to delete")
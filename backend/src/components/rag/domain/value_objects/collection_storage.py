@@ -0,0 +1,43 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+
+class StorageTier(Enum):
+    HOT = "hot"  # Vectors, payloads and HNSW graph held in RAM
+    WARM = "warm"  # Vectors, payloads and HNSW graph memory-mapped from disk
+
+
+class CollectionStorage(BaseModel):
+    """
+    Where the data of a vector collection is stored.
+
+    Attributes:
+        collection_name (str): Name of the collection.
+        vectors_on_disk (bool): Whether the original vectors are memory-mapped from disk.
+        payload_on_disk (bool): Whether the payloads are stored on disk.
+        hnsw_on_disk (bool): Whether the HNSW graph is memory-mapped from disk.
+        tier (Optional[StorageTier]): Tier matching the layout, or None for a mixed layout.
+        points_count (Optional[int]): Number of points in the collection.
+        optimizing (bool): Whether the collection is still being rewritten, e.g. after a migration.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    collection_name: str = Field(..., description="Name of the collection")
+    vectors_on_disk: bool = Field(..., description="Whether the original vectors are memory-mapped from disk")
+    payload_on_disk: bool = Field(..., description="Whether the payloads are stored on disk")
+    hnsw_on_disk: bool = Field(..., description="Whether the HNSW graph is memory-mapped from disk")
+    points_count: Optional[int] = Field(default=None, description="Number of points in the collection")
+    optimizing: bool = Field(default=False,
+                             description="Whether the collection is still being rewritten, e.g. after a migration")
+
+    @computed_field(description="Tier matching the layout, or None for a mixed layout")
+    @property
+    def tier(self) -> Optional[StorageTier]:
+        """Tier matching the layout, or None if only part of the data is on disk."""
+        if self.vectors_on_disk and self.payload_on_disk and self.hnsw_on_disk:
+            return StorageTier.WARM
+        if not (self.vectors_on_disk or self.payload_on_disk or self.hnsw_on_disk):
+            return StorageTier.HOT
+        return None
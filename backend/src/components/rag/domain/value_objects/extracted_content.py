@@ -1,11 +1,15 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class ExtractedContent(BaseModel):
     """
     Value Object representing extracted content from a document with its metadata.
     Immutable object containing the text content and associated metadata.
+
+    It may also carry the structured document built by the extraction backend. The
+    domain treats it as opaque; a chunker of the same backend can split it directly
+    instead of parsing the text again. It is not serialized.
     """
     model_config = ConfigDict(frozen=True)
 
@@ -14,3 +18,8 @@ class ExtractedContent(BaseModel):
         default_factory=dict,
         description="Dictionary containing document metadata such as format, creation date, author, etc."
     )
+    document: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Structured document produced by the extraction backend, opaque to the domain."
+    )
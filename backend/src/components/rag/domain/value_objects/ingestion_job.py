@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.components.rag.domain.value_objects.document_retrieval import DocumentRetrieval
+from src.components.rag.domain.value_objects.embedding import Embedding
+from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
+from src.components.rag.domain.value_objects.input_document import StoreDocumentResult
+
+
+class IngestionStage(Enum):
+    QUEUED = "queued"        # Waiting for a worker
+    EXTRACTING = "extracting"
+    CHUNKING = "chunking"
+    EMBEDDING = "embedding"
+    UPSERTING = "upserting"
+    DONE = "done"            # Finished, successfully or not
+
+
+class IngestionJobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class IngestionProgress(BaseModel):
+    """
+    Progress of a document ingestion.
+
+    Attributes:
+        stage (IngestionStage): Current stage of the ingestion.
+        chunks_total (int): Number of chunks of the document, known once chunked.
+        chunks_embedded (int): Number of chunks embedded so far.
+        chunks_upserted (int): Number of chunks stored in the vector store so far.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    stage: IngestionStage = Field(default=IngestionStage.QUEUED, description="Current stage of the ingestion")
+    chunks_total: int = Field(default=0, description="Number of chunks of the document, known once chunked")
+    chunks_embedded: int = Field(default=0, description="Number of chunks embedded so far")
+    chunks_upserted: int = Field(default=0, description="Number of chunks stored in the vector store so far")
+
+
+class IngestionJob(BaseModel):
+    """
+    An asynchronous document ingestion job.
+
+    Attributes:
+        id (UUID): Unique identifier of the job.
+        filename (str): Name of the ingested document.
+        replace (bool): Whether the document supersedes a different document stored under its filename.
+        status (IngestionJobStatus): Status of the job.
+        progress (IngestionProgress): Stage and chunk counters of the ingestion.
+        result (Optional[StoreDocumentResult]): Result of the ingestion, once succeeded.
+        error (Optional[str]): Error message, once failed.
+        created_at (datetime): When the job was submitted.
+        updated_at (datetime): When the job was last updated.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID = Field(default_factory=uuid4, description="Unique identifier of the job")
+    filename: str = Field(..., description="Name of the ingested document")
+    replace: bool = Field(default=False,
+                          description="Whether the document supersedes a different document stored under its filename")
+    status: IngestionJobStatus = Field(default=IngestionJobStatus.QUEUED, description="Status of the job")
+    progress: IngestionProgress = Field(default_factory=IngestionProgress,
+                                        description="Stage and chunk counters of the ingestion")
+    result: Optional[StoreDocumentResult] = Field(default=None, description="Result of the ingestion, once succeeded")
+    error: Optional[str] = Field(default=None, description="Error message, once failed")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc),
+                                 description="When the job was submitted")
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc),
+                                 description="When the job was last updated")
+
+
+class IngestionCheckpoint(BaseModel):
+    """
+    Intermediate results of an interrupted ingestion, from which it resumes.
+
+    Attributes:
+        extracted (Optional[ExtractedContent]): Extracted content with its metadata, once extracted.
+        chunks (Optional[List[DocumentRetrieval]]): Chunks of the document, once chunked.
+        stored_chunk_ids (Optional[List[UUID]]): Ids of the chunks of the document stored before this
+            ingestion, saved with the chunks so that a resumed ingestion embeds the same new chunks.
+        embeddings (List[Embedding]): Embeddings of the leading new chunks embedded so far, in chunk order.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    extracted: Optional[ExtractedContent] = Field(default=None, description="Extracted content, once extracted")
+    chunks: Optional[List[DocumentRetrieval]] = Field(default=None, description="Chunks of the document, once chunked")
+    stored_chunk_ids: Optional[List[UUID]] = Field(
+        default=None, description="Ids of the chunks of the document stored before this ingestion, once chunked"
+    )
+    embeddings: List[Embedding] = Field(
+        default_factory=list, description="Embeddings of the leading new chunks embedded so far, in chunk order"
+    )
@@ -1,6 +1,8 @@
+import hashlib
+import os
 from typing import BinaryIO, Optional, Dict, Any
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from enum import Enum
 
 
@@ -8,22 +10,57 @@ class InputDocument(BaseModel):
     """
     Represents an input document with its content and formalized type.
 
+    The content is either held in memory or referenced by the path of a local file,
+    so that large uploads are not copied into memory.
+
     Attributes:
-        content (bytes): The binary content of the document.
+        content (Optional[bytes]): The binary content of the document.
+        path (Optional[str]): Path of a local file holding the content, instead of `content`.
         type (InputDocumentType): The formalized type of the document.
     """
     model_config = ConfigDict(frozen=True)
     
     # TODO add id
     filename: str = Field(..., description="The name of the document file")
-    content: bytes = Field(..., description="The binary content of the document")
+    content: Optional[bytes] = Field(default=None, description="The binary content of the document")
+    path: Optional[str] = Field(default=None, description="Path of a local file holding the content of the document")
     type: str = Field(..., description="The formalized type of the document")
 
+    @model_validator(mode="after")
+    def _check_content_or_path(self) -> "InputDocument":
+        """Ensure exactly one of `content` and `path` is set."""
+        if (self.content is None) == (self.path is None):
+            raise ValueError("Exactly one of content and path must be provided")
+        return self
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the document content, read from the file system for a document given by path."""
+        return len(self.content) if self.content is not None else os.path.getsize(self.path)
+
+    def content_hash(self) -> str:
+        """
+        Compute the SHA-256 hash of the document content.
+
+        A document given by path is read in blocks, without loading it into memory.
+
+        Returns:
+            str: The hexadecimal digest of the content.
+        """
+        if self.content is not None:
+            return hashlib.sha256(self.content).hexdigest()
+        digest = hashlib.sha256()
+        with open(self.path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
 
 class StoreDocumentStatus(Enum):
     SUCCESS = "success"  # All vectors were inserted
     PARTIAL = "partial"  # Some vectors were inserted, but not all
     ERROR = "error"      # No vectors were inserted
+    UNCHANGED = "unchanged"  # The same content was already stored, nothing was inserted
 
 
 class StoreDocumentResult(BaseModel):
@@ -62,4 +99,18 @@ class StoreDocumentResult(BaseModel):
     ingested_chunks: int = Field(..., description="Number of chunks successfully ingested into the vector database")
     failed_chunks: int = Field(..., description="Number of chunks that failed during the ingestion process")
     status: StoreDocumentStatus = Field(..., description="Overall status of the ingestion operation")
-    metrics: Optional[Dict[str, Any]] = Field(None, description="Performance metrics and additional metadata for the operation, such as processing time, memory usage, or error details")
\ No newline at end of file
+    metrics: Optional[Dict[str, Any]] = Field(None, description="Performance metrics and additional metadata for the operation, such as processing time, memory usage, or error details")
+
+
+class DeleteDocumentResult(BaseModel):
+    """
+    Result of deleting a document from the vector database.
+
+    Attributes:
+        filename (str): Name of the deleted document.
+        deleted_chunks (int): Number of chunks of the document deleted from the vector database.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    filename: str = Field(..., description="Name of the deleted document")
+    deleted_chunks: int = Field(..., description="Number of chunks of the document deleted from the vector database")
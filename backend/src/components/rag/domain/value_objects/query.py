@@ -1,5 +1,10 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.components.rag.domain.value_objects.search_filter import SearchFilter
+from src.components.rag.domain.value_objects.search_options import SearchOptions
+
 
 class Query(BaseModel):
     """
@@ -8,3 +13,7 @@ class Query(BaseModel):
     """
     model_config = ConfigDict(frozen=True)
     content: str = Field(..., description="The content of the query, typically a question or request.")
+    search_filter: Optional[SearchFilter] = Field(
+        default=None, description="Restricts the retrieval to the chunks whose metadata match, if given.")
+    search_options: Optional[SearchOptions] = Field(
+        default=None, description="Recall and latency trade-off of the retrieval, if not the default one.")
@@ -0,0 +1,37 @@
+from typing import List, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.components.rag.domain.value_objects.document_retrieval import DocumentRetrieval
+
+
+class SourcesEvent(BaseModel):
+    """First event of a streamed RAG answer, carrying the retrieved sources."""
+    model_config = ConfigDict(frozen=True)
+
+    event: Literal["sources"] = Field(default="sources", description="Event name")
+    sources: List[DocumentRetrieval] = Field(default_factory=list, description="Documents used as context")
+
+
+class TokenEvent(BaseModel):
+    """A piece of the generated answer."""
+    model_config = ConfigDict(frozen=True)
+
+    event: Literal["token"] = Field(default="token", description="Event name")
+    content: str = Field(..., description="The text generated since the previous token event")
+
+
+class CompletedEvent(BaseModel):
+    """Last event of a streamed RAG answer, carrying usage and timing information."""
+    model_config = ConfigDict(frozen=True)
+
+    event: Literal["done"] = Field(default="done", description="Event name")
+    model_used: Optional[str] = Field(default=None, description="Model that generated the answer")
+    input_tokens: Optional[int] = Field(default=None, description="Number of tokens in the input prompt")
+    output_tokens: Optional[int] = Field(default=None, description="Number of generated tokens")
+    time_to_first_token_ms: Optional[int] = Field(default=None, description="Time until the first token event")
+    processing_time_ms: int = Field(..., description="Total time taken to stream the answer")
+    cached: bool = Field(default=False, description="Whether the answer was served from the semantic answer cache")
+
+
+RAGStreamEvent = Union[SourcesEvent, TokenEvent, CompletedEvent]
@@ -30,6 +30,25 @@ class Response(BaseModel):
     provider: Optional[str] = Field(default=None, description="The LLM provider used to generate the response")
 
 
+class ResponseChunk(BaseModel):
+    """A value object representing an incremental piece of a streamed language model response.
+
+    Attributes:
+        content (str): The text generated since the previous chunk, possibly empty.
+        finish_reason (str, optional): Why generation stopped, set on the last content chunk.
+        model_used (str, optional): Name or identifier of the model generating the response.
+        input_tokens (int, optional): Number of tokens in the input prompt, usually on the final chunk.
+        output_tokens (int, optional): Number of generated tokens, usually on the final chunk.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    content: str = Field(default="", description="The text generated since the previous chunk")
+    finish_reason: Optional[str] = Field(default=None, description="Why generation stopped, on the last content chunk")
+    model_used: Optional[str] = Field(default=None, description="Model generating the response")
+    input_tokens: Optional[int] = Field(default=None, description="Number of tokens in the input prompt")
+    output_tokens: Optional[int] = Field(default=None, description="Number of generated tokens")
+
+
 class RAGResponse(Response):
     """RAG (Retrieval-Augmented Generation) response value object.
 
@@ -39,6 +58,8 @@ class RAGResponse(Response):
     Attributes:
         sources (List[DocumentRetrieval]): List of documents that were retrieved
             and used as context for generating the response. Defaults to an empty list.
+        cached (bool): Whether the response was served from the semantic answer cache.
+        cache_similarity (float, optional): Similarity between the query and the cached query on a cache hit.
         model_config (ConfigDict): Pydantic configuration allowing the model to be
             immutable (frozen=True).
 
@@ -49,3 +70,7 @@ class RAGResponse(Response):
     """
     model_config = ConfigDict(frozen=True)
     sources: List[DocumentRetrieval] = Field(default_factory=list)
+    cached: bool = Field(default=False, description="Whether the response was served from the semantic answer cache")
+    cache_similarity: Optional[float] = Field(
+        default=None, description="Similarity between the query and the cached query on a cache hit"
+    )
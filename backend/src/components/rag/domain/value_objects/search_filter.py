@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class SearchFilter(BaseModel):
+    """
+    Restriction of a vector search to the chunks whose metadata match.
+
+    Conditions are combined with AND; a list matches a chunk whose value is any of
+    its entries. The fields are those recorded by `DocumentStoreService.add_metadata`.
+
+    Attributes:
+        filenames (Optional[List[str]]): Documents to search, by filename.
+        document_types (Optional[List[str]]): MIME types of the documents to search.
+        ingested_after (Optional[datetime]): Only search chunks ingested at or after this time.
+        ingested_before (Optional[datetime]): Only search chunks ingested at or before this time.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    filenames: Optional[List[str]] = Field(default=None, description="Documents to search, by filename")
+    document_types: Optional[List[str]] = Field(default=None, description="MIME types of the documents to search")
+    ingested_after: Optional[datetime] = Field(default=None,
+                                               description="Only search chunks ingested at or after this time")
+    ingested_before: Optional[datetime] = Field(default=None,
+                                                description="Only search chunks ingested at or before this time")
+
+    @model_validator(mode="after")
+    def _check_ingestion_range(self) -> "SearchFilter":
+        if self.ingested_after is not None and self.ingested_before is not None \
+                and self.ingested_after > self.ingested_before:
+            raise ValueError("ingested_after must not be later than ingested_before")
+        return self
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the filter has no condition and matches every chunk."""
+        return not (self.filenames or self.document_types
+                    or self.ingested_after is not None or self.ingested_before is not None)
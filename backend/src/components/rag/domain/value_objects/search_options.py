@@ -0,0 +1,51 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SearchOptions(BaseModel):
+    """
+    Trade-off between recall and latency of a vector search.
+
+    Unset options fall back to the defaults of the retriever, then to those of the
+    vector database. A larger `hnsw_ef` explores more of the index for a better recall,
+    and `exact` skips the index for a brute-force search, e.g. for evaluation runs.
+
+    Attributes:
+        hnsw_ef (Optional[int]): Size of the candidate list explored in the HNSW graph.
+        exact (Optional[bool]): Whether to search exhaustively instead of through the index.
+        score_threshold (Optional[float]): Minimum score of a result.
+        indexed_only (Optional[bool]): Whether to skip the points not indexed yet, e.g. during a bulk ingestion.
+        oversampling (Optional[float]): Candidates fetched with quantized vectors, as a multiple of the results.
+        rescore (Optional[bool]): Whether to rescore the candidates with the original vectors.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    hnsw_ef: Optional[int] = Field(default=None, ge=1,
+                                   description="Size of the candidate list explored in the HNSW graph")
+    exact: Optional[bool] = Field(default=None,
+                                  description="Whether to search exhaustively instead of through the index")
+    score_threshold: Optional[float] = Field(default=None, description="Minimum score of a result")
+    indexed_only: Optional[bool] = Field(
+        default=None, description="Whether to skip the points not indexed yet, e.g. during a bulk ingestion")
+    oversampling: Optional[float] = Field(
+        default=None, ge=1, description="Candidates fetched with quantized vectors, as a multiple of the results")
+    rescore: Optional[bool] = Field(default=None,
+                                    description="Whether to rescore the candidates with the original vectors")
+
+    @property
+    def is_empty(self) -> bool:
+        """True if no option is set."""
+        return all(value is None for value in self.model_dump().values())
+
+    def with_defaults(self, defaults: "SearchOptions") -> "SearchOptions":
+        """
+        Fill the unset options from defaults.
+
+        Args:
+            defaults (SearchOptions): Options used where this one has none.
+
+        Returns:
+            SearchOptions: The merged options.
+        """
+        return defaults.model_copy(update=self.model_dump(exclude_none=True))
@@ -1,12 +1,16 @@
+from .embedding_cache import CachedEmbeddingAdapter
 from .litellm_proxy.litellm_base_adapter import LiteLLMBaseAdapter
 from .llm.litellm_embedding_adapter import LiteLLMEmbeddingAdapter
 from .llm.litellm_llm_adapter import LiteLLMAdapter
+from .semantic_cache import InMemorySemanticCacheAdapter
 from .text_extraction import DoclingTextExtractionAdapter
 from .text_chunking import DoclingTextChunkingAdapter
 __all__ = [
+    "CachedEmbeddingAdapter",
     "LiteLLMBaseAdapter",
     "LiteLLMEmbeddingAdapter",
     "LiteLLMAdapter",
+    "InMemorySemanticCacheAdapter",
     "DoclingTextExtractionAdapter",
     "DoclingTextChunkingAdapter"
 
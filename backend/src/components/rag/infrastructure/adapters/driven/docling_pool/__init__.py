@@ -0,0 +1,8 @@
+from .docling_pool_config import DoclingPoolConfig, default_docling_pool_settings
+from .docling_process_pool import DoclingProcessPool
+
+__all__ = [
+    "DoclingPoolConfig",
+    "DoclingProcessPool",
+    "default_docling_pool_settings"
+]
@@ -0,0 +1,36 @@
+from typing import List
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class DoclingPoolConfig(BaseSettings):
+    """Configuration for the process pool running Docling conversion and chunking.
+
+    Attributes:
+        enabled: Whether Docling runs in worker processes. If False, it runs in a thread of the API process.
+        max_workers: Number of worker processes.
+        max_pending: Number of tasks allowed to wait for a free worker; further tasks wait before being queued.
+        task_timeout_seconds: Time in seconds after which a conversion or chunking task is abandoned.
+        warmup: Whether to start the workers and load converters and the chunker at application startup.
+        warmup_formats: Input formats whose conversion pipelines are loaded by the warmup.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="DOCLING_POOL_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra='ignore',
+    )
+
+    enabled: bool = Field(default=True, description="Whether Docling runs in worker processes")
+    max_workers: int = Field(default=2, gt=0, description="Number of worker processes")
+    max_pending: int = Field(default=8, ge=0, description="Number of tasks allowed to wait for a free worker")
+    task_timeout_seconds: float = Field(default=600.0, gt=0.0,
+                                        description="Time in seconds after which a task is abandoned")
+    warmup: bool = Field(default=False, description="Whether to start the workers and load Docling at startup")
+    warmup_formats: List[str] = Field(default=["pdf"],
+                                      description="Input formats whose conversion pipelines are loaded by the warmup")
+
+
+default_docling_pool_settings = DoclingPoolConfig()
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class DoclingProcessPool:
+    """Run CPU-bound Docling work in worker processes, off the event loop.
+
+    Worker processes are started with the `spawn` method (forking a process that
+    holds gRPC channels and threads is unsafe) and run `initializer` once, so that
+    converters and chunkers are loaded before the first task.
+
+    At most `max_workers + max_pending` tasks are handed to the executor at a time;
+    further callers wait for a slot, which bounds the executor queue and the memory
+    held by pickled documents. A task exceeding `task_timeout_seconds`, or whose
+    caller is cancelled, is abandoned: it is removed from the queue if it has not
+    started yet, otherwise its result is discarded when the worker finishes. An
+    abandoned task keeps its slot until then, since it still occupies a worker.
+
+    When disabled, tasks run in a thread of the current process instead.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = 2,
+            max_pending: int = 8,
+            task_timeout_seconds: Optional[float] = 600.0,
+            initializer: Optional[Callable[..., None]] = None,
+            initargs: Tuple[Any, ...] = (),
+            enabled: bool = True,
+    ):
+        """Initialize the pool. Worker processes are started on first use.
+
+        Args:
+            max_workers: Number of worker processes.
+            max_pending: Number of tasks allowed to wait for a free worker.
+            task_timeout_seconds: Time in seconds after which a task is abandoned. None disables the timeout.
+            initializer: Function run once in each worker process at startup.
+            initargs: Arguments of the initializer.
+            enabled: Whether to use worker processes, or a thread of the current process.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.task_timeout_seconds = task_timeout_seconds
+        self.initializer = initializer
+        self.initargs = initargs
+        self.enabled = enabled
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(max_workers + max_pending)
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the executor, creating it on first use or after it broke."""
+        if self._executor is None:
+            self.logger.info(f"_get_executor :: Starting Docling process pool with {self.max_workers} workers")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        return self._executor
+
+    def _submit(self, fn: Callable[..., T], *args: Any) -> Tuple[asyncio.Future, Optional[Future]]:
+        """Start a task in a worker process, or in a thread of the current process when disabled.
+
+        Returns:
+            Tuple[asyncio.Future, Optional[Future]]: The future to await and, for a worker process,
+                the executor future through which the task is cancelled.
+        """
+        if self.enabled:
+            task = self._get_executor().submit(fn, *args)
+            return asyncio.wrap_future(task), task
+        return asyncio.ensure_future(asyncio.to_thread(fn, *args)), None
+
+    def _release(self) -> None:
+        """Give back the slot of a finished task."""
+        self._in_flight -= 1
+        self._slots.release()
+
+    def _abandon(self, future: asyncio.Future, task: Optional[Future]) -> None:
+        """Let a task finish without its caller, keeping its slot until then.
+
+        A task that has not started is removed from the executor queue. A running one
+        cannot be interrupted, so its slot is only released once the worker is done
+        with it: otherwise abandoned tasks would pile up in the executor beyond the
+        bound on the number of tasks handed to it.
+
+        Args:
+            future: The future of the task.
+            task: The executor future of the task, None for a task run in a thread.
+        """
+        if task is not None:
+            task.cancel()
+
+        def discard(_: asyncio.Future) -> None:
+            if not future.cancelled():
+                # Read, so that the error of the abandoned task is not reported as never retrieved
+                future.exception()
+            self._release()
+
+        future.add_done_callback(discard)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a function in a worker process and return its result.
+
+        Args:
+            fn: Picklable (module-level) function to run.
+            *args: Picklable arguments of the function.
+
+        Returns:
+            T: The result of the function.
+
+        Raises:
+            asyncio.TimeoutError: If the task exceeds `task_timeout_seconds`.
+            Exception: Any exception raised by the function.
+        """
+        await self._slots.acquire()
+        self._in_flight += 1
+        future: Optional[asyncio.Future] = None
+        task: Optional[Future] = None
+        try:
+            future, task = self._submit(fn, *args)
+            done, _ = await asyncio.wait({future}, timeout=self.task_timeout_seconds)
+            if not done:
+                self._timed_out += 1
+                self.logger.error(f"run :: {fn.__name__} abandoned after {self.task_timeout_seconds}s")
+                raise asyncio.TimeoutError(f"{fn.__name__} exceeded {self.task_timeout_seconds}s")
+            result = future.result()
+        except asyncio.TimeoutError:
+            raise
+        except BrokenProcessPool:
+            self._failed += 1
+            self.logger.error("run :: A Docling worker died, restarting the process pool")
+            self._reset_executor()
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            # Still running after a timeout or the cancellation of the caller
+            if future is not None and not future.done():
+                self._abandon(future, task)
+            else:
+                self._release()
+        self._completed += 1
+        return result
+
+    def _reset_executor(self) -> None:
+        """Discard the executor so that a new one is created on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def start(self) -> None:
+        """Start every worker process now, running the initializer, instead of on first use.
+
+        Used to warm up the pool at application startup.
+        """
+        self.logger.info(f"start :: Warming up {self.max_workers} Docling workers")
+        if not self.enabled:
+            if self.initializer is not None:
+                await asyncio.to_thread(self.initializer, *self.initargs)
+            return
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        # Tasks submitted while no worker is idle each spawn a new worker process
+        pids = await asyncio.gather(*(loop.run_in_executor(executor, os.getpid) for _ in range(self.max_workers)))
+        self.logger.info(f"start :: Docling workers ready ({len(set(pids))} processes)")
+
+    def get_metrics(self) -> dict:
+        """Return the settings and counters of the pool.
+
+        Returns:
+            dict: Worker count, tasks in flight, and completed/failed/timed-out counters.
+        """
+        return {
+            "enabled": self.enabled,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "timed_out": self._timed_out,
+        }
+
+    def close(self) -> None:
+        """Cancel queued tasks and stop the worker processes."""
+        if self._executor is not None:
+            self.logger.info("close :: Shutting down Docling process pool")
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,127 @@
+"""Docling work run inside the worker processes of DoclingProcessPool.
+
+The functions of this module are module-level so that they can be pickled and
+sent to worker processes. Converters and the chunker are expensive to build
+(layout models, tokenizer), so each process builds them lazily once and reuses
+them across documents: converters are cached by input format and pipeline
+options, and a single chunker is shared.
+"""
+import hashlib
+import logging
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from docling.chunking import HybridChunker
+from docling.datamodel.base_models import DocumentStream, InputFormat
+from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling_core.types import DoclingDocument
+
+logger = logging.getLogger(__name__)
+
+_converters: Dict[Tuple[Optional[InputFormat], Optional[str]], DocumentConverter] = {}
+_chunker: Optional[HybridChunker] = None
+
+
+def get_converter(input_format: Optional[InputFormat] = None,
+                  pipeline_options: Optional[PdfPipelineOptions] = None) -> DocumentConverter:
+    """Return the converter of this process for a format and pipeline options, building it once.
+
+    Args:
+        input_format: Format the converter is restricted to. None accepts every format.
+        pipeline_options: PDF pipeline options. None uses Docling defaults.
+
+    Returns:
+        DocumentConverter: The cached converter.
+    """
+    options_key = hashlib.md5(str(pipeline_options.model_dump()).encode("utf-8"),
+                              usedforsecurity=False).hexdigest() if pipeline_options is not None else None
+    key = (input_format, options_key)
+    converter = _converters.get(key)
+    if converter is None:
+        logger.info(f"get_converter :: Building converter for format={input_format}, options={options_key}")
+        format_options = {InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)} \
+            if pipeline_options is not None else None
+        converter = DocumentConverter(
+            allowed_formats=[input_format] if input_format is not None else None,
+            format_options=format_options,
+        )
+        _converters[key] = converter
+    return converter
+
+
+def get_chunker() -> HybridChunker:
+    """Return the chunker of this process, building it once."""
+    global _chunker
+    if _chunker is None:
+        logger.info("get_chunker :: Building HybridChunker")
+        _chunker = HybridChunker()
+    return _chunker
+
+
+def init_worker(warmup_formats: Sequence[str] = ()) -> None:
+    """Initialize a worker process, optionally warming up converters and the chunker.
+
+    Without warmup formats, nothing is loaded until the first document needs it. With
+    warmup formats, their conversion pipelines, the Markdown pipeline used for chunking
+    and the chunker tokenizer are loaded upfront.
+
+    Args:
+        warmup_formats: Input formats (e.g. "pdf", "docx") whose conversion pipelines are loaded upfront.
+    """
+    if not warmup_formats:
+        return
+    logger.info(f"init_worker :: Warming up Docling for formats {list(warmup_formats)}")
+    for name in warmup_formats:
+        get_converter().initialize_pipeline(InputFormat(name))
+    get_converter(InputFormat.MD).initialize_pipeline(InputFormat.MD)
+    get_chunker()
+
+
+def convert_document(filename: str, content: Optional[bytes] = None,
+                     path: Optional[str] = None) -> Tuple[str, DoclingDocument]:
+    """Convert a document to a DoclingDocument and its Markdown export.
+
+    The converter accepts every format, letting Docling detect it from the name and content.
+    A document given by path is opened by Docling directly, without copying it in memory.
+
+    Args:
+        filename: Name of the document, used to detect its format.
+        content: Binary content of the document, if not given by path.
+        path: Path of a local file holding the document.
+
+    Returns:
+        Tuple[str, DoclingDocument]: The Markdown export and the structured document.
+    """
+    source = Path(path) if path is not None else DocumentStream(name=filename, stream=BytesIO(content))
+    document = get_converter().convert(source).document
+    return document.export_to_markdown(), document
+
+
+def chunk_document(document: DoclingDocument) -> List[Tuple[str, str]]:
+    """Chunk a structured document with the HybridChunker.
+
+    Args:
+        document: The DoclingDocument to chunk.
+
+    Returns:
+        List[Tuple[str, str]]: Text and chunk type of each chunk, in document order.
+    """
+    return [(chunk.text, type(chunk).__name__) for chunk in get_chunker().chunk(dl_doc=document)]
+
+
+def chunk_markdown(filename: str, text: str) -> List[Tuple[str, str]]:
+    """Chunk a Markdown text with the HybridChunker.
+
+    Used when no structured document is available, e.g. for text posted to the API.
+
+    Args:
+        filename: Name of the Markdown document, ending with `.md`.
+        text: Markdown text to chunk.
+
+    Returns:
+        List[Tuple[str, str]]: Text and chunk type of each chunk, in document order.
+    """
+    source = DocumentStream(name=filename, stream=BytesIO(text.encode("utf-8")))
+    return chunk_document(get_converter(InputFormat.MD).convert(source=source).document)
@@ -0,0 +1,12 @@
+from .cached_embedding_adapter import CachedEmbeddingAdapter
+from .embedding_cache_config import EmbeddingCacheConfig, default_embedding_cache_settings
+from .embedding_cache_store import EmbeddingCacheStore
+from .query_embedding_cache_adapter import QueryEmbeddingCacheAdapter
+
+__all__ = [
+    "CachedEmbeddingAdapter",
+    "EmbeddingCacheConfig",
+    "EmbeddingCacheStore",
+    "QueryEmbeddingCacheAdapter",
+    "default_embedding_cache_settings"
+]
@@ -0,0 +1,89 @@
+import hashlib
+import logging
+from typing import Dict, List
+
+from src.components.rag.application.ports.driven import EmbeddingPort
+from src.components.rag.domain.value_objects import Embedding
+from src.components.rag.infrastructure.adapters.driven.embedding_cache.embedding_cache_store import CacheKey, \
+    EmbeddingCacheStore, decode_vector, encode_vector
+
+
+class CachedEmbeddingAdapter(EmbeddingPort):
+    """EmbeddingPort decorator serving embeddings from a content-addressed cache.
+
+    Embeddings are keyed by (model, sha256 of text), so identical chunks are embedded
+    once across documents, re-uploads and restarts. Only cache misses reach the
+    wrapped embedding port, deduplicated and in a single batched call.
+    """
+
+    def __init__(self, embedding_port: EmbeddingPort, store: EmbeddingCacheStore):
+        """Initialize the cached embedding adapter.
+
+        Args:
+            embedding_port: The embedding port computing embeddings on cache misses.
+            store: The cache store holding the vectors.
+        """
+        super().__init__(
+            model=getattr(embedding_port, "model", None) or embedding_port.__class__.__name__,
+            fallback_dimension=getattr(embedding_port, "fallback_dimension", 0),
+        )
+        self.embedding_port = embedding_port
+        self.store = store
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.info(f"__init__ :: Caching embeddings of model {self.model}")
+
+    def _key(self, text: str) -> CacheKey:
+        """Build the cache key of a text."""
+        return self.model, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def embed_text(self, text: str) -> Embedding:
+        """Return the embedding of a text, from cache when available.
+
+        Args:
+            text: Input text to convert into a vector representation.
+
+        Returns:
+            Embedding: The embedding of the text.
+        """
+        return (await self.embed_texts([text]))[0]
+
+    async def embed_texts(self, texts: List[str]) -> List[Embedding]:
+        """Return the embeddings of several texts, computing only the cache misses.
+
+        Args:
+            texts: Input texts to convert into vector representations.
+
+        Returns:
+            List[Embedding]: Embeddings in the same order as the input texts.
+        """
+        if not texts:
+            return []
+
+        keys = [self._key(text) for text in texts]
+        unique_keys = list(dict.fromkeys(keys))
+        cached = await self.store.get_many(unique_keys)
+
+        embeddings: Dict[CacheKey, Embedding] = {
+            key: Embedding(model=self.model, vector=decode_vector(blob), processing_time_ms=0)
+            for key, blob in cached.items()
+        }
+
+        missing_keys = [key for key in unique_keys if key not in cached]
+        self.logger.info(f"embed_texts :: {len(texts)} texts, {len(unique_keys) - len(missing_keys)} cached, "
+                         f"{len(missing_keys)} to embed")
+
+        if missing_keys:
+            text_by_key = dict(zip(keys, texts))
+            computed = await self.embedding_port.embed_texts([text_by_key[key] for key in missing_keys])
+            embeddings.update(zip(missing_keys, computed))
+            await self.store.put_many({key: encode_vector(e.vector) for key, e in zip(missing_keys, computed)})
+
+        return [embeddings[key] for key in keys]
+
+    def get_metrics(self) -> dict:
+        """Return cache counters along with the wrapped port metrics.
+
+        Returns:
+            dict: Cache hit/miss counters and the wrapped embedding port metrics.
+        """
+        return {"cache": self.store.get_metrics(), **self.embedding_port.get_metrics()}
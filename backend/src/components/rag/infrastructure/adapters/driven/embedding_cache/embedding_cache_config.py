@@ -0,0 +1,38 @@
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class EmbeddingCacheConfig(BaseSettings):
+    """Configuration for the content-addressed embedding cache.
+
+    Attributes:
+        enabled: Whether embeddings are cached at all.
+        memory_max_bytes: Byte budget of the in-memory LRU tier.
+        sqlite_path: Path of the persistent SQLite tier, None to disable it.
+        query_cache_enabled: Whether query embeddings are cached.
+        query_cache_max_entries: Maximum number of cached query embeddings.
+        query_cache_ttl_seconds: Time in seconds a query embedding stays valid.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="EMBEDDING_CACHE_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra='ignore',
+    )
+
+    enabled: bool = Field(default=True, description="Whether embeddings are cached at all")
+    memory_max_bytes: int = Field(default=64 * 1024 * 1024, ge=0,
+                                  description="Byte budget of the in-memory LRU tier")
+    sqlite_path: Optional[str] = Field(default="data/embedding_cache.sqlite3",
+                                       description="Path of the persistent SQLite tier, None to disable it")
+
+    query_cache_enabled: bool = Field(default=True, description="Whether query embeddings are cached")
+    query_cache_max_entries: int = Field(default=1024, gt=0, description="Maximum number of cached query embeddings")
+    query_cache_ttl_seconds: float = Field(default=3600.0, gt=0.0,
+                                           description="Time in seconds a query embedding stays valid")
+
+
+default_embedding_cache_settings = EmbeddingCacheConfig()
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+CacheKey = Tuple[str, str]
+
+# Approximate per-entry bookkeeping cost (key strings, dict slot, bytes header)
+_ENTRY_OVERHEAD_BYTES = 160
+
+
+def encode_vector(vector: List[float]) -> bytes:
+    """Pack a vector as float32 bytes (the precision Qdrant stores anyway)."""
+    return array('f', vector).tobytes()
+
+
+def decode_vector(blob: bytes) -> List[float]:
+    """Unpack float32 bytes into a vector."""
+    values = array('f')
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingCacheStore:
+    """Two-tier store of embedding vectors keyed by (model, sha256 of text).
+
+    The first tier is an in-memory LRU bounded by bytes, the second an optional
+    SQLite database that survives restarts. Disk hits are promoted to memory.
+    """
+
+    def __init__(self, memory_max_bytes: int, sqlite_path: Optional[str] = None):
+        """Initialize the store.
+
+        Args:
+            memory_max_bytes: Byte budget of the in-memory LRU tier.
+            sqlite_path: Path of the SQLite database, None for a memory-only cache.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.memory_max_bytes = memory_max_bytes
+        self.sqlite_path = sqlite_path
+
+        self._memory: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if sqlite_path:
+            directory = os.path.dirname(os.path.abspath(sqlite_path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, created_at REAL NOT NULL, "
+                "PRIMARY KEY (model, text_hash))"
+            )
+            self._db.commit()
+        self.logger.info(f"__init__ :: Embedding cache store ready (memory={memory_max_bytes}B, sqlite={sqlite_path})")
+
+    def _remember(self, key: CacheKey, blob: bytes) -> None:
+        """Insert an entry in the memory tier and evict least recently used entries over budget."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        size = len(blob) + _ENTRY_OVERHEAD_BYTES
+        if size > self.memory_max_bytes:
+            return
+        self._memory[key] = blob
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted) + _ENTRY_OVERHEAD_BYTES
+
+    def _get_many(self, keys: List[CacheKey]) -> Dict[CacheKey, bytes]:
+        """Look keys up in memory, then on disk for the remaining ones."""
+        found: Dict[CacheKey, bytes] = {}
+        with self._lock:
+            missing: List[CacheKey] = []
+            for key in keys:
+                blob = self._memory.get(key)
+                if blob is None:
+                    missing.append(key)
+                    continue
+                self._memory.move_to_end(key)
+                found[key] = blob
+            self.memory_hits += len(found)
+
+            if missing and self._db is not None:
+                for key in missing:
+                    row = self._db.execute(
+                        "SELECT vector FROM embeddings WHERE model = ? AND text_hash = ?", key
+                    ).fetchone()
+                    if row is not None:
+                        found[key] = row[0]
+                        self._remember(key, row[0])
+                        self.disk_hits += 1
+
+            self.misses += len(keys) - len(found)
+        return found
+
+    def _put_many(self, entries: Dict[CacheKey, bytes]) -> None:
+        """Store entries in both tiers."""
+        with self._lock:
+            for key, blob in entries.items():
+                self._remember(key, blob)
+            if self._db is not None and entries:
+                now = time.time()
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, created_at) VALUES (?, ?, ?, ?)",
+                    [(model, text_hash, blob, now) for (model, text_hash), blob in entries.items()]
+                )
+                self._db.commit()
+
+    async def get_many(self, keys: List[CacheKey]) -> Dict[CacheKey, bytes]:
+        """Return the cached vectors found for the given keys.
+
+        Disk lookups run in a worker thread to keep the event loop responsive.
+
+        Args:
+            keys: Unique (model, text hash) keys to look up.
+
+        Returns:
+            Dict[CacheKey, bytes]: Packed vectors of the keys found in either tier.
+        """
+        if self._db is None:
+            return self._get_many(keys)
+        return await asyncio.to_thread(self._get_many, keys)
+
+    async def put_many(self, entries: Dict[CacheKey, bytes]) -> None:
+        """Store packed vectors in both tiers.
+
+        Args:
+            entries: Packed vectors by (model, text hash) key.
+        """
+        if self._db is None:
+            self._put_many(entries)
+            return
+        await asyncio.to_thread(self._put_many, entries)
+
+    def get_metrics(self) -> dict:
+        """Return hit/miss counters and memory usage of the store.
+
+        Returns:
+            dict: Hits per tier, misses, hit ratio and memory usage.
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else None,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+        }
+
+    def close(self) -> None:
+        """Close the SQLite tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,135 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+
+from src.components.rag.application.ports.driven import EmbeddingPort
+from src.components.rag.domain.value_objects import Embedding
+
+CacheKey = Tuple[str, str]
+
+
+class QueryEmbeddingCacheAdapter(EmbeddingPort):
+    """EmbeddingPort decorator caching query embeddings in a small TTL + LRU cache.
+
+    Keys are the embedding model and the normalized query text (case-folded, with
+    whitespace collapsed), so that repeated FAQ-style questions skip the embedding
+    round-trip on the query hot path.
+    """
+
+    def __init__(
+            self,
+            embedding_port: EmbeddingPort,
+            max_entries: int = 1024,
+            ttl_seconds: float = 3600.0,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the query embedding cache.
+
+        Args:
+            embedding_port: The embedding port computing embeddings on cache misses.
+            max_entries: Maximum number of cached query embeddings.
+            ttl_seconds: Time in seconds a cached embedding stays valid.
+            clock: Monotonic clock returning seconds, overridable for tests.
+        """
+        super().__init__(
+            model=getattr(embedding_port, "model", None) or embedding_port.__class__.__name__,
+            fallback_dimension=getattr(embedding_port, "fallback_dimension", 0),
+        )
+        self.embedding_port = embedding_port
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Embedding]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize a query text for cache lookups.
+
+        Args:
+            text: The raw query text.
+
+        Returns:
+            str: The case-folded text with collapsed whitespace.
+        """
+        return " ".join(text.split()).casefold()
+
+    def _get(self, key: CacheKey):
+        """Return a valid cached embedding or None, dropping expired entries."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, embedding = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return embedding
+
+    def _put(self, key: CacheKey, embedding: Embedding) -> None:
+        """Store an embedding and evict the least recently used entries over capacity."""
+        self._entries[key] = (self.clock() + self.ttl_seconds, embedding)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def embed_text(self, text: str) -> Embedding:
+        """Return the embedding of a query, from cache when available.
+
+        Args:
+            text: The query text.
+
+        Returns:
+            Embedding: The embedding of the query.
+        """
+        key = (self.model, self.normalize(text))
+        embedding = self._get(key)
+        if embedding is not None:
+            self.hits += 1
+            self.logger.debug("embed_text :: Query embedding cache hit")
+            return embedding
+
+        self.misses += 1
+        embedding = await self.embedding_port.embed_text(text)
+        self._put(key, embedding)
+        return embedding
+
+    async def embed_texts(self, texts: List[str]) -> List[Embedding]:
+        """Return the embeddings of several queries, embedding the misses in one call.
+
+        Args:
+            texts: The query texts.
+
+        Returns:
+            List[Embedding]: Embeddings in the same order as the input texts.
+        """
+        keys = [(self.model, self.normalize(text)) for text in texts]
+        found = {key: self._get(key) for key in dict.fromkeys(keys)}
+        missing = [key for key, embedding in found.items() if embedding is None]
+        self.hits += len(found) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            text_by_key = {}
+            for key, text in zip(keys, texts):
+                text_by_key.setdefault(key, text)
+            computed = await self.embedding_port.embed_texts([text_by_key[key] for key in missing])
+            for key, embedding in zip(missing, computed):
+                self._put(key, embedding)
+                found[key] = embedding
+
+        return [found[key] for key in keys]
+
+    def get_metrics(self) -> dict:
+        """Return query cache counters along with the wrapped port metrics.
+
+        Returns:
+            dict: Hits, misses and size of the query cache and the wrapped port metrics.
+        """
+        return {
+            "query_cache": {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)},
+            **self.embedding_port.get_metrics(),
+        }
@@ -0,0 +1,13 @@
+from .in_memory_ingestion_job_repository import InMemoryIngestionJobRepository
+from .ingestion_job_config import IngestionJobConfig, default_ingestion_job_settings
+from .ingestion_pipeline_config import IngestionPipelineConfig, default_ingestion_pipeline_settings
+from .sqlite_ingestion_job_store import SqliteIngestionJobStore
+
+__all__ = [
+    "InMemoryIngestionJobRepository",
+    "IngestionJobConfig",
+    "IngestionPipelineConfig",
+    "SqliteIngestionJobStore",
+    "default_ingestion_job_settings",
+    "default_ingestion_pipeline_settings"
+]
@@ -0,0 +1,55 @@
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.components.rag.application.ports.driven import IngestionJobRepositoryPort
+from src.components.rag.domain.value_objects import IngestionJob, IngestionJobStatus, InputDocument
+
+FINISHED_STATUSES = (IngestionJobStatus.SUCCEEDED, IngestionJobStatus.FAILED)
+
+
+class InMemoryIngestionJobRepository(IngestionJobRepositoryPort):
+    """In-process store of ingestion jobs.
+
+    Active jobs are always kept. Finished jobs are kept in completion order and the
+    oldest ones are evicted beyond `max_finished_jobs`, so that polling clients can
+    read the result for a while without the store growing forever. Nothing survives
+    a restart.
+    """
+
+    def __init__(self, max_finished_jobs: int = 1000):
+        """Initialize the repository.
+
+        Args:
+            max_finished_jobs: Number of finished jobs kept for status polling.
+        """
+        self.max_finished_jobs = max_finished_jobs
+        self._active: Dict[UUID, IngestionJob] = {}
+        self._documents: Dict[UUID, InputDocument] = {}
+        self._finished: OrderedDict[UUID, IngestionJob] = OrderedDict()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def add(self, job: IngestionJob, document: InputDocument) -> None:
+        self._documents[job.id] = document
+        await self.save(job)
+
+    async def save(self, job: IngestionJob) -> None:
+        if job.status not in FINISHED_STATUSES:
+            self._active[job.id] = job
+            return
+
+        self._active.pop(job.id, None)
+        self._documents.pop(job.id, None)
+        self._finished[job.id] = job
+        self._finished.move_to_end(job.id)
+        while len(self._finished) > self.max_finished_jobs:
+            evicted_id, _ = self._finished.popitem(last=False)
+            self.logger.debug(f"save :: Evicted finished job {evicted_id}")
+
+    async def get(self, job_id: UUID) -> Optional[IngestionJob]:
+        return self._active.get(job_id) or self._finished.get(job_id)
+
+    async def list_unfinished(self) -> List[Tuple[IngestionJob, InputDocument]]:
+        jobs = sorted(self._active.values(), key=lambda job: job.created_at)
+        return [(job, self._documents[job.id]) for job in jobs]
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class IngestionJobConfig(BaseSettings):
+    """Configuration of asynchronous document ingestion jobs.
+
+    Attributes:
+        max_workers: Number of documents ingested concurrently.
+        max_queued: Maximum number of submitted jobs waiting for a worker.
+        max_finished_jobs: Number of finished jobs kept for status polling.
+        embedding_group_size: Number of chunks embedded between two progress updates and checkpoints.
+        sqlite_path: Path of the SQLite database persisting jobs and checkpoints, None to keep jobs in memory.
+        spool_dir: Directory where documents submitted as jobs are spooled until ingested.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="INGESTION_JOBS_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra='ignore',
+    )
+
+    max_workers: int = Field(default=2, gt=0, description="Number of documents ingested concurrently")
+    max_queued: int = Field(default=100, gt=0, description="Maximum number of submitted jobs waiting for a worker")
+    max_finished_jobs: int = Field(default=1000, gt=0, description="Number of finished jobs kept for status polling")
+    embedding_group_size: int = Field(default=256, gt=0,
+                                      description="Number of chunks embedded between two progress updates and checkpoints")
+    sqlite_path: Optional[str] = Field(default="data/ingestion_jobs.sqlite3",
+                                       description="Path of the SQLite database persisting jobs and checkpoints, None to keep jobs in memory")
+    spool_dir: str = Field(default="data/ingestion_spool",
+                           description="Directory where documents submitted as jobs are spooled until ingested")
+
+
+default_ingestion_job_settings = IngestionJobConfig()
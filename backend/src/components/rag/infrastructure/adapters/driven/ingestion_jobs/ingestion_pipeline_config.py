@@ -0,0 +1,32 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class IngestionPipelineConfig(BaseSettings):
+    """Configuration of the staged pipeline of bulk ingestions.
+
+    Each concurrency is shared by all the bulk ingestions running at once.
+
+    Attributes:
+        extract_concurrency: Number of documents extracted at once.
+        chunk_concurrency: Number of documents chunked at once.
+        embed_concurrency: Number of documents embedded at once.
+        upsert_concurrency: Number of documents upserted at once.
+        queue_size: Capacity of the queue in front of each stage.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="INGESTION_PIPELINE_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra='ignore',
+    )
+
+    extract_concurrency: int = Field(default=2, gt=0, description="Number of documents extracted at once")
+    chunk_concurrency: int = Field(default=2, gt=0, description="Number of documents chunked at once")
+    embed_concurrency: int = Field(default=2, gt=0, description="Number of documents embedded at once")
+    upsert_concurrency: int = Field(default=2, gt=0, description="Number of documents upserted at once")
+    queue_size: int = Field(default=4, gt=0, description="Capacity of the queue in front of each stage")
+
+
+default_ingestion_pipeline_settings = IngestionPipelineConfig()
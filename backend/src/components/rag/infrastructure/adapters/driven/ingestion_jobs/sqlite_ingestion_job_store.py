@@ -0,0 +1,243 @@
+import asyncio
+import importlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from itertools import chain
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.components.rag.application.ports.driven import IngestionCheckpointPort, IngestionJobRepositoryPort
+from src.components.rag.domain.value_objects import DocumentRetrieval, Embedding, IngestionCheckpoint, \
+    IngestionJob, InputDocument
+from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
+from src.components.rag.infrastructure.adapters.driven.ingestion_jobs.in_memory_ingestion_job_repository import \
+    FINISHED_STATUSES
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS jobs ("
+    "id TEXT PRIMARY KEY, job TEXT NOT NULL, finished INTEGER NOT NULL, "
+    "document TEXT, document_content BLOB, created_at REAL NOT NULL, updated_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finished, updated_at)",
+    "CREATE TABLE IF NOT EXISTS extracted_checkpoints ("
+    "job_id TEXT PRIMARY KEY, content TEXT NOT NULL, document_class TEXT, document TEXT)",
+    "CREATE TABLE IF NOT EXISTS chunk_checkpoints ("
+    "job_id TEXT PRIMARY KEY, chunks TEXT NOT NULL, stored_chunk_ids TEXT)",
+    "CREATE TABLE IF NOT EXISTS embedding_checkpoints ("
+    "job_id TEXT NOT NULL, chunk_offset INTEGER NOT NULL, model TEXT NOT NULL, dimension INTEGER NOT NULL, "
+    "vectors BLOB NOT NULL, PRIMARY KEY (job_id, chunk_offset))",
+)
+_CHECKPOINT_TABLES = ("extracted_checkpoints", "chunk_checkpoints", "embedding_checkpoints")
+# Columns added after the first version of the schema: (table, column, definition)
+_ADDED_COLUMNS = (
+    ("chunk_checkpoints", "stored_chunk_ids", "TEXT"),
+)
+
+
+def _dump_structured_document(document: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Serialize the structured document of extracted content, if it is a pydantic model.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: Import path of its class and its JSON, or (None, None).
+    """
+    if not isinstance(document, BaseModel):
+        return None, None
+    document_class = type(document)
+    return f"{document_class.__module__}:{document_class.__qualname__}", document.model_dump_json()
+
+
+def _load_structured_document(document_class: Optional[str], document: Optional[str]) -> Optional[Any]:
+    """Rebuild a structured document serialized by `_dump_structured_document`."""
+    if document_class is None or document is None:
+        return None
+    module_name, class_name = document_class.split(":")
+    return getattr(importlib.import_module(module_name), class_name).model_validate_json(document)
+
+
+class SqliteIngestionJobStore(IngestionJobRepositoryPort, IngestionCheckpointPort):
+    """SQLite store of ingestion jobs, their queued documents and their checkpoints.
+
+    Jobs and checkpoints survive restarts, so that queued and interrupted jobs are
+    resumed from their last completed stage. Saving a job as finished drops its
+    document and checkpoints in the same transaction, and the oldest finished jobs
+    are deleted beyond `max_finished_jobs`. Embeddings are stored as float32 blobs,
+    the precision Qdrant stores anyway.
+    """
+
+    def __init__(self, sqlite_path: str, max_finished_jobs: int = 1000):
+        """Open the store, creating the database if needed.
+
+        Args:
+            sqlite_path: Path of the SQLite database.
+            max_finished_jobs: Number of finished jobs kept for status polling.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.sqlite_path = sqlite_path
+        self.max_finished_jobs = max_finished_jobs
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(sqlite_path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        for table, column, definition in _ADDED_COLUMNS:
+            columns = {row[1] for row in self._db.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        self._db.commit()
+        self.logger.info(f"__init__ :: Ingestion job store ready (sqlite={sqlite_path})")
+
+    def _write(self, statements: List[Tuple[str, tuple]]) -> None:
+        """Execute statements in a single transaction.
+
+        Like every database access of the async methods, it runs in a worker thread
+        to keep the event loop responsive.
+        """
+        with self._lock, self._db:
+            for sql, parameters in statements:
+                self._db.execute(sql, parameters)
+
+    # Jobs
+
+    async def add(self, job: IngestionJob, document: InputDocument) -> None:
+        now = time.time()
+        await asyncio.to_thread(self._write, [(
+            "INSERT INTO jobs (id, job, finished, document, document_content, created_at, updated_at) "
+            "VALUES (?, ?, 0, ?, ?, ?, ?)",
+            (str(job.id), job.model_dump_json(), document.model_dump_json(exclude={"content"}),
+             document.content, now, now),
+        )])
+
+    async def save(self, job: IngestionJob) -> None:
+        job_id = str(job.id)
+        if job.status not in FINISHED_STATUSES:
+            await asyncio.to_thread(self._write, [(
+                "UPDATE jobs SET job = ?, updated_at = ? WHERE id = ?", (job.model_dump_json(), time.time(), job_id)
+            )])
+            return
+
+        statements = [(
+            "UPDATE jobs SET job = ?, finished = 1, document = NULL, document_content = NULL, updated_at = ? "
+            "WHERE id = ?",
+            (job.model_dump_json(), time.time(), job_id),
+        )]
+        statements += [(f"DELETE FROM {table} WHERE job_id = ?", (job_id,)) for table in _CHECKPOINT_TABLES]
+        statements.append((
+            "DELETE FROM jobs WHERE finished = 1 AND id NOT IN "
+            "(SELECT id FROM jobs WHERE finished = 1 ORDER BY updated_at DESC LIMIT ?)",
+            (self.max_finished_jobs,),
+        ))
+        await asyncio.to_thread(self._write, statements)
+
+    def _get(self, job_id: UUID) -> Optional[IngestionJob]:
+        with self._lock:
+            row = self._db.execute("SELECT job FROM jobs WHERE id = ?", (str(job_id),)).fetchone()
+        return IngestionJob.model_validate_json(row[0]) if row is not None else None
+
+    async def get(self, job_id: UUID) -> Optional[IngestionJob]:
+        return await asyncio.to_thread(self._get, job_id)
+
+    def _list_unfinished(self) -> List[Tuple[IngestionJob, InputDocument]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT job, document, document_content FROM jobs WHERE finished = 0 ORDER BY created_at"
+            ).fetchall()
+        return [
+            (IngestionJob.model_validate_json(job),
+             InputDocument(**json.loads(document) | {"content": content}))
+            for job, document, content in rows
+        ]
+
+    async def list_unfinished(self) -> List[Tuple[IngestionJob, InputDocument]]:
+        return await asyncio.to_thread(self._list_unfinished)
+
+    # Checkpoints
+
+    def _load(self, job_id: UUID) -> IngestionCheckpoint:
+        key = (str(job_id),)
+        with self._lock:
+            extracted_row = self._db.execute(
+                "SELECT content, document_class, document FROM extracted_checkpoints WHERE job_id = ?", key
+            ).fetchone()
+            chunks_row = self._db.execute(
+                "SELECT chunks, stored_chunk_ids FROM chunk_checkpoints WHERE job_id = ?", key
+            ).fetchone()
+            embedding_rows = self._db.execute(
+                "SELECT chunk_offset, model, dimension, vectors FROM embedding_checkpoints "
+                "WHERE job_id = ? ORDER BY chunk_offset", key
+            ).fetchall()
+
+        extracted = None
+        if extracted_row is not None:
+            content, document_class, document = extracted_row
+            extracted = ExtractedContent.model_validate_json(content).model_copy(
+                update={"document": _load_structured_document(document_class, document)})
+
+        chunks = stored_chunk_ids = None
+        if chunks_row is not None:
+            serialized_chunks, serialized_ids = chunks_row
+            chunks = [DocumentRetrieval.model_validate(chunk) for chunk in json.loads(serialized_chunks)]
+            if serialized_ids is not None:
+                stored_chunk_ids = [UUID(chunk_id) for chunk_id in json.loads(serialized_ids)]
+
+        # Only the leading contiguous groups are usable
+        embeddings: List[Embedding] = []
+        for offset, model, dimension, blob in embedding_rows:
+            if offset != len(embeddings):
+                break
+            values = array('f')
+            values.frombytes(blob)
+            embeddings.extend(
+                Embedding(model=model, vector=values[start:start + dimension].tolist())
+                for start in range(0, len(values), dimension)
+            )
+
+        return IngestionCheckpoint(extracted=extracted, chunks=chunks, stored_chunk_ids=stored_chunk_ids,
+                                   embeddings=embeddings)
+
+    async def load(self, job_id: UUID) -> IngestionCheckpoint:
+        return await asyncio.to_thread(self._load, job_id)
+
+    async def save_extracted(self, job_id: UUID, content: ExtractedContent) -> None:
+        document_class, document = _dump_structured_document(content.document)
+        await asyncio.to_thread(self._write, [(
+            "INSERT OR REPLACE INTO extracted_checkpoints (job_id, content, document_class, document) "
+            "VALUES (?, ?, ?, ?)",
+            (str(job_id), content.model_dump_json(), document_class, document),
+        )])
+
+    async def save_chunks(self, job_id: UUID, chunks: List[DocumentRetrieval],
+                          stored_chunk_ids: Sequence[UUID] = ()) -> None:
+        serialized = json.dumps([chunk.model_dump(mode="json") for chunk in chunks])
+        serialized_ids = json.dumps([str(chunk_id) for chunk_id in stored_chunk_ids])
+        # The structured document is no longer needed once chunked
+        await asyncio.to_thread(self._write, [
+            ("INSERT OR REPLACE INTO chunk_checkpoints (job_id, chunks, stored_chunk_ids) VALUES (?, ?, ?)",
+             (str(job_id), serialized, serialized_ids)),
+            ("DELETE FROM extracted_checkpoints WHERE job_id = ?", (str(job_id),)),
+        ])
+
+    async def save_embeddings(self, job_id: UUID, offset: int, embeddings: List[Embedding]) -> None:
+        if not embeddings:
+            return
+        dimension = len(embeddings[0].vector)
+        vectors = array('f', chain.from_iterable(embedding.vector for embedding in embeddings)).tobytes()
+        await asyncio.to_thread(self._write, [(
+            "INSERT OR REPLACE INTO embedding_checkpoints (job_id, chunk_offset, model, dimension, vectors) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (str(job_id), offset, embeddings[0].model, dimension, vectors),
+        )])
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
@@ -1,5 +1,8 @@
+import json
 import logging
-from typing import Optional
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import httpx
 
 from .litellm_config import LiteLLMConfig, default_litellm_settings
 
@@ -10,8 +13,16 @@ class LiteLLMBaseAdapter:
     This class provides a unified interface for making requests to LiteLLM endpoints,
     handling both chat completions and embeddings. It manages authentication,
     error handling, and request configuration.
+
+    Instances share a pooled `httpx.AsyncClient` per process so that keep-alive
+    connections to the LiteLLM proxy are reused across calls. Instances whose
+    configurations ask for different connection pools (limits or HTTP/2) get one
+    client each. Clients are opened lazily (or explicitly at application startup via
+    `open_http_client`) and must be released at shutdown with `close_http_client`.
     """
 
+    _http_clients: Dict[Tuple[int, int, float, bool], httpx.AsyncClient] = {}
+
     def __init__(self, config: Optional[LiteLLMConfig] = default_litellm_settings):
         """Initialize the class with provided configuration or use default configuration.
 
@@ -39,6 +50,68 @@ class LiteLLMBaseAdapter:
         self.logger.debug("__init__ :: Authentication headers configured")
         self.logger.info("__init__ :: LiteLLMBase initialization completed")
 
+    @staticmethod
+    def _pool_key(config: LiteLLMConfig) -> Tuple[int, int, float, bool]:
+        """Return the connection pool settings of a configuration, which identify its shared client.
+
+        The timeout is not part of it, since it is passed with each request.
+        """
+        return config.max_connections, config.max_keepalive_connections, config.keepalive_expiry, config.http2
+
+    @classmethod
+    def open_http_client(cls, config: LiteLLMConfig = default_litellm_settings) -> httpx.AsyncClient:
+        """Return the process-wide HTTP client of the connection pool settings of a configuration.
+
+        Args:
+            config: LiteLLM configuration providing timeout and connection pool limits.
+
+        Returns:
+            httpx.AsyncClient: The shared HTTP client, created if needed.
+        """
+        key = cls._pool_key(config)
+        client = LiteLLMBaseAdapter._http_clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+
+        logger = logging.getLogger(cls.__name__)
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        http2 = config.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("open_http_client :: HTTP/2 requested but `h2` is not installed, falling back to HTTP/1.1")
+                http2 = False
+
+        others = [other for other in LiteLLMBaseAdapter._http_clients if other != key]
+        if others:
+            logger.warning(f"open_http_client :: Creating another shared HTTP client for different connection pool "
+                           f"settings, {len(others)} already open")
+        logger.info(f"open_http_client :: Creating shared HTTP client (http2={http2})")
+        logger.debug(f"open_http_client :: Connection pool limits: {limits}")
+        client = httpx.AsyncClient(timeout=config.timeout, limits=limits, http2=http2)
+        LiteLLMBaseAdapter._http_clients[key] = client
+        return client
+
+    @classmethod
+    async def close_http_client(cls) -> None:
+        """Close the process-wide HTTP clients and release their pooled connections."""
+        clients = list(LiteLLMBaseAdapter._http_clients.values())
+        LiteLLMBaseAdapter._http_clients.clear()
+        for client in clients:
+            if not client.is_closed:
+                logging.getLogger(cls.__name__).info("close_http_client :: Closing shared HTTP client")
+                await client.aclose()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """httpx.AsyncClient: Shared HTTP client of the connection pool settings of the configuration."""
+        return self.open_http_client(self.config)
+
     async def _make_request(self, endpoint: str, payload: dict) -> dict:
         """Make an HTTP request to the specified endpoint.
 
@@ -53,40 +126,77 @@ class LiteLLMBaseAdapter:
             httpx.RequestError: If there's a request error.
             httpx.HTTPStatusError: If there's an HTTP error.
         """
-        import httpx
-        
         url = f"{self.config.base_url.rstrip('/')}/{endpoint}"
         self.logger.info(f"_make_request :: Making request to endpoint: {endpoint}")
         self.logger.debug(f"_make_request :: Request URL: {url}")
         self.logger.debug(f"_make_request :: Request payload: {payload}")
 
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
+        client = self.http_client
+        try:
+            self.logger.debug(f"_make_request :: Sending POST request with timeout: {self.config.timeout}s")
+            response = await client.post(url=url, headers=self.headers, json=payload, timeout=self.config.timeout)
+            response.raise_for_status()
+
+            response_data = response.json()
+            self.logger.info(f"_make_request :: Request to {endpoint} completed successfully")
+            self.logger.debug(f"_make_request :: Response status: {response.status_code}")
+            self.logger.debug(f"_make_request :: Response data: {response_data}")
+
+            return response_data
+
+        except httpx.RequestError as e:
+            self.logger.error(f"_make_request :: Request error for {url}: {e}")
+            raise httpx.RequestError(f"Request error for {url}: {e}")
+        except httpx.HTTPStatusError as e:
+            error_detail = ""
             try:
-                self.logger.debug(f"_make_request :: Sending POST request with timeout: {self.config.timeout}s")
-                response = await client.post(url, headers=self.headers, json=payload)
+                error_detail = response.json()
+            except:
+                error_detail = response.text
+
+            self.logger.error(f"_make_request :: HTTP error {response.status_code} for {url}: {error_detail}")
+            raise
+
+    async def _stream_request(self, endpoint: str, payload: dict) -> AsyncIterator[dict]:
+        """Make a streaming HTTP request and yield each server-sent event payload.
+
+        Args:
+            endpoint: The API endpoint (e.g., "chat/completions").
+            payload: The data to send in the request body.
+
+        Yields:
+            dict: Each JSON chunk sent by the API, until the `[DONE]` marker.
+
+        Raises:
+            httpx.RequestError: If there's a request error.
+            httpx.HTTPStatusError: If there's an HTTP error.
+        """
+        url = f"{self.config.base_url.rstrip('/')}/{endpoint}"
+        self.logger.info(f"_stream_request :: Opening stream to endpoint: {endpoint}")
+        self.logger.debug(f"_stream_request :: Request payload: {payload}")
+
+        try:
+            async with self.http_client.stream("POST", url, headers=self.headers, json=payload,
+                                               timeout=self.config.timeout) as response:
+                if response.is_error:
+                    await response.aread()
+                    self.logger.error(f"_stream_request :: HTTP error {response.status_code} for {url}: {response.text}")
                 response.raise_for_status()
-                
-                response_data = response.json()
-                self.logger.info(f"_make_request :: Request to {endpoint} completed successfully")
-                self.logger.debug(f"_make_request :: Response status: {response.status_code}")
-                self.logger.debug(f"_make_request :: Response data: {response_data}")
-                
-                return response_data
-                
-            except httpx.RequestError as e:
-                self.logger.error(f"_make_request :: Request error for {url}: {e}")
-                raise httpx.RequestError(f"Request error for {url}: {e}")
-            except httpx.HTTPStatusError as e:
-                error_detail = ""
-                try:
-                    error_detail = response.json()
-                except:
-                    error_detail = response.text
-                    
-                self.logger.error(f"_make_request :: HTTP error {response.status_code} for {url}: {error_detail}")
-                raise
 
-    async def chat_completion(
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    yield json.loads(data)
+
+            self.logger.info(f"_stream_request :: Stream from {endpoint} completed")
+        except httpx.RequestError as e:
+            self.logger.error(f"_stream_request :: Request error for {url}: {e}")
+            raise httpx.RequestError(f"Request error for {url}: {e}")
+
+    def _chat_payload(
             self,
             messages: list[dict[str, str]],
             model: Optional[str] = None,
@@ -94,7 +204,7 @@ class LiteLLMBaseAdapter:
             max_tokens: Optional[int] = None,
             **kwargs
     ) -> dict:
-        """Generate chat completion for the given messages.
+        """Build the chat/completions payload, applying configuration defaults.
 
         Args:
             messages: List of conversation messages.
@@ -104,20 +214,18 @@ class LiteLLMBaseAdapter:
             **kwargs: Additional arguments for the API.
 
         Returns:
-            dict: Dictionary containing the chat/completions API response.
+            dict: The request payload.
         """
-        self.logger.info("chat_completion :: Starting chat completion request")
-        
         model_to_use = model or self.default_litellm_chat_model
         temp_to_use = temperature or self.config.temperature
         tokens_to_use = max_tokens or self.config.max_tokens
-        
-        self.logger.debug(f"chat_completion :: Using model: {model_to_use}")
-        self.logger.debug(f"chat_completion :: Using temperature: {temp_to_use}")
-        self.logger.debug(f"chat_completion :: Using max_tokens: {tokens_to_use}")
-        self.logger.debug(f"chat_completion :: Messages count: {len(messages)}")
-        
-        payload = {
+
+        self.logger.debug(f"_chat_payload :: Using model: {model_to_use}")
+        self.logger.debug(f"_chat_payload :: Using temperature: {temp_to_use}")
+        self.logger.debug(f"_chat_payload :: Using max_tokens: {tokens_to_use}")
+        self.logger.debug(f"_chat_payload :: Messages count: {len(messages)}")
+
+        return {
             "model": model_to_use,
             "messages": messages,
             "temperature": temp_to_use,
@@ -125,9 +233,64 @@ class LiteLLMBaseAdapter:
             **kwargs
         }
 
+    async def chat_completion(
+            self,
+            messages: list[dict[str, str]],
+            model: Optional[str] = None,
+            temperature: Optional[float] = None,
+            max_tokens: Optional[int] = None,
+            **kwargs
+    ) -> dict:
+        """Generate chat completion for the given messages.
+
+        Args:
+            messages: List of conversation messages.
+            model: Model to use (default: config.default_chat_model).
+            temperature: Generation temperature (default: config.temperature).
+            max_tokens: Maximum number of tokens (default: config.max_tokens).
+            **kwargs: Additional arguments for the API.
+
+        Returns:
+            dict: Dictionary containing the chat/completions API response.
+        """
+        self.logger.info("chat_completion :: Starting chat completion request")
+
+        payload = self._chat_payload(messages, model=model, temperature=temperature, max_tokens=max_tokens, **kwargs)
+
         result = await self._make_request("chat/completions", payload)
         self.logger.info("chat_completion :: Chat completion request completed")
         return result
+
+    async def chat_completion_stream(
+            self,
+            messages: list[dict[str, str]],
+            model: Optional[str] = None,
+            temperature: Optional[float] = None,
+            max_tokens: Optional[int] = None,
+            **kwargs
+    ) -> AsyncIterator[dict]:
+        """Stream a chat completion for the given messages.
+
+        Usage is requested in the final chunk through `stream_options.include_usage`.
+
+        Args:
+            messages: List of conversation messages.
+            model: Model to use (default: config.default_chat_model).
+            temperature: Generation temperature (default: config.temperature).
+            max_tokens: Maximum number of tokens (default: config.max_tokens).
+            **kwargs: Additional arguments for the API.
+
+        Yields:
+            dict: Each chat.completion.chunk sent by the API.
+        """
+        self.logger.info("chat_completion_stream :: Starting streamed chat completion request")
+
+        payload = self._chat_payload(messages, model=model, temperature=temperature, max_tokens=max_tokens,
+                                     stream=True, stream_options={"include_usage": True}, **kwargs)
+
+        async for chunk in self._stream_request("chat/completions", payload):
+            yield chunk
+        self.logger.info("chat_completion_stream :: Streamed chat completion request completed")
     
     async def embeddings(self, input_text, model: Optional[str] = None, **kwargs) -> dict:
         """Generate embeddings for the given input text.
@@ -163,5 +326,8 @@ class LiteLLMBaseAdapter:
             "default_embedding_model": self.config.default_embedding_model,
             "temperature": self.config.temperature,
             "max_tokens": self.config.max_tokens,
-            "provider": self.config.provider
+            "provider": self.config.provider,
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+            "http2": self.config.http2
         }
@@ -20,6 +20,18 @@ class LiteLLMConfig(BaseSettings):
         default_embedding_model: The default embedding model name to use for embeddings.
         temperature: Temperature parameter for text generation (0.0 to 2.0).
         max_tokens: Maximum number of tokens to generate in responses.
+        max_connections: Maximum number of concurrent connections in the shared HTTP pool.
+        max_keepalive_connections: Maximum number of idle connections kept alive in the pool.
+        keepalive_expiry: Time in seconds an idle connection is kept alive.
+        http2: Whether to negotiate HTTP/2 with the LiteLLM proxy (requires the `h2` package).
+        embedding_batch_size: Maximum number of texts sent in a single embeddings request.
+        embedding_batch_max_tokens: Approximate token budget of a single embeddings request.
+        embedding_initial_concurrency: Number of embeddings requests in flight at start.
+        embedding_max_concurrency: Maximum number of embeddings requests in flight.
+        embedding_target_latency_ms: Request latency above which the embedding batch size is reduced.
+        embedding_max_retries: Number of retries of a throttled or failed embeddings request.
+        embedding_retry_backoff: Base delay in seconds before retrying an embeddings request.
+        embedding_adaptive: Whether to tune embedding concurrency and batch size from observed latency and errors.
     """
 
     model_config = SettingsConfigDict(
@@ -42,6 +54,35 @@ class LiteLLMConfig(BaseSettings):
                                description="Temperature parameter for text generation (0.0 to 2.0)")
     max_tokens: int = Field(default=2048, gt=0, description="Maximum number of tokens to generate in responses")
 
+    # HTTP connection pool settings
+    max_connections: int = Field(default=100, gt=0,
+                                 description="Maximum number of concurrent connections in the shared HTTP pool")
+    max_keepalive_connections: int = Field(default=20, ge=0,
+                                           description="Maximum number of idle connections kept alive in the pool")
+    keepalive_expiry: float = Field(default=30.0, ge=0.0,
+                                    description="Time in seconds an idle connection is kept alive")
+    http2: bool = Field(default=False,
+                        description="Whether to negotiate HTTP/2 with the LiteLLM proxy (requires the `h2` package)")
+
+    # Embedding batching settings
+    embedding_batch_size: int = Field(default=64, gt=0,
+                                      description="Maximum number of texts sent in a single embeddings request")
+    embedding_batch_max_tokens: int = Field(default=8192, gt=0,
+                                            description="Approximate token budget of a single embeddings request")
+    embedding_initial_concurrency: int = Field(default=2, gt=0,
+                                               description="Number of embeddings requests in flight at start")
+    embedding_max_concurrency: int = Field(default=4, gt=0,
+                                           description="Maximum number of embeddings requests in flight")
+    embedding_target_latency_ms: float = Field(default=2000.0, gt=0.0,
+                                               description="Request latency above which the embedding batch size is reduced")
+    embedding_max_retries: int = Field(default=3, ge=0,
+                                       description="Number of retries of a throttled or failed embeddings request")
+    embedding_retry_backoff: float = Field(default=0.5, ge=0.0,
+                                           description="Base delay in seconds before retrying an embeddings request")
+    embedding_adaptive: bool = Field(default=True,
+                                     description="Whether to tune embedding concurrency and batch size from observed "
+                                                 "latency and errors")
+
 
 def load_litellm_config() -> LiteLLMConfig:
     """Load LiteLLM configuration from environment variables and .env file.
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+from src.components.rag.domain.value_objects import Embedding
+
+EmbedBatch = Callable[[List[str]], Awaitable[List[Embedding]]]
+
+
+class AdaptiveEmbeddingScheduler:
+    """Fan out embedding batches with bounded, self-tuning concurrency.
+
+    The scheduler keeps up to `concurrency` batches in flight and adapts both the
+    concurrency and the batch size with an AIMD policy (additive increase,
+    multiplicative decrease):
+
+    - a fast successful batch (latency under target) adds one slot of concurrency,
+      or grows the batch size back towards its maximum;
+    - a slow batch halves the batch size;
+    - a throttled (HTTP 429) or failed batch halves both and is retried.
+
+    The limit applies to the batches of all the concurrent calls of `run` together,
+    e.g. of several documents ingested at once, since it protects a single embedding
+    backend. For the same reason the tuned settings are shared by the calls and persist
+    across them, so that following documents start from the last known good operating
+    point.
+    """
+
+    def __init__(
+            self,
+            max_batch_size: int,
+            max_batch_tokens: int,
+            initial_concurrency: int = 2,
+            max_concurrency: int = 4,
+            min_batch_size: int = 1,
+            target_latency_ms: float = 2000.0,
+            max_retries: int = 3,
+            retry_backoff: float = 0.5,
+            adaptive: bool = True,
+            estimate_tokens: Callable[[str], int] = lambda text: max(1, len(text) // 4),
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_batch_size: Upper bound on the number of texts per batch.
+            max_batch_tokens: Approximate token budget of a single batch.
+            initial_concurrency: Number of batches in flight at start.
+            max_concurrency: Upper bound on the number of batches in flight.
+            min_batch_size: Lower bound on the number of texts per batch.
+            target_latency_ms: Batch latency above which the batch size is reduced.
+            max_retries: Number of retries of a failed batch before giving up.
+            retry_backoff: Base delay in seconds before retrying a failed batch.
+            adaptive: Whether to tune concurrency and batch size from observations.
+            estimate_tokens: Function estimating the token count of a text.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.max_batch_size = max_batch_size
+        self.min_batch_size = min(min_batch_size, max_batch_size)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max_concurrency
+        self.target_latency_ms = target_latency_ms
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.adaptive = adaptive
+        self.estimate_tokens = estimate_tokens
+
+        self.concurrency = max(1, min(initial_concurrency, max_concurrency))
+        self.batch_size = max_batch_size
+
+        self._batches = 0
+        self._retries = 0
+        self._throttled = 0
+        self._errors = 0
+        self._latency_ewma_ms: Optional[float] = None
+
+        # Batches in flight across all the calls of `run`, bounded by `concurrency`
+        self._in_flight = 0
+        self._slot_released = asyncio.Condition()
+
+    @staticmethod
+    def is_throttled(error: Exception) -> bool:
+        """Return True if the error is a rate limiting response (HTTP 429)."""
+        return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Return True if the batch may succeed when retried (throttling, server or transport errors)."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code == 429 or error.response.status_code >= 500
+        return isinstance(error, (httpx.RequestError, asyncio.TimeoutError))
+
+    def _take_batch(self, pending: Deque[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        """Pop the next batch from the pending texts honouring batch size and token budget.
+
+        Args:
+            pending: Queue of (position, text) waiting to be embedded.
+
+        Returns:
+            List[Tuple[int, str]]: The batch, at least one text long.
+        """
+        batch: List[Tuple[int, str]] = []
+        tokens = 0
+        while pending and len(batch) < self.batch_size:
+            cost = self.estimate_tokens(pending[0][1])
+            if batch and tokens + cost > self.max_batch_tokens:
+                break
+            batch.append(pending.popleft())
+            tokens += cost
+        return batch
+
+    def _on_success(self, latency_ms: float) -> None:
+        """Update the settings after a successful batch."""
+        self._batches += 1
+        self._latency_ewma_ms = latency_ms if self._latency_ewma_ms is None \
+            else 0.8 * self._latency_ewma_ms + 0.2 * latency_ms
+        if not self.adaptive:
+            return
+
+        if latency_ms > self.target_latency_ms:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+            self.logger.debug(f"_on_success :: Slow batch ({latency_ms:.0f}ms), batch size -> {self.batch_size}")
+        elif self.batch_size < self.max_batch_size:
+            self.batch_size = min(self.max_batch_size, self.batch_size + max(1, self.max_batch_size // 8))
+            self.logger.debug(f"_on_success :: Fast batch, batch size -> {self.batch_size}")
+        elif self.concurrency < self.max_concurrency:
+            self.concurrency += 1
+            self.logger.debug(f"_on_success :: Fast batch, concurrency -> {self.concurrency}")
+
+    def _on_failure(self, error: Exception) -> None:
+        """Update the settings after a failed batch."""
+        self._errors += 1
+        if self.is_throttled(error):
+            self._throttled += 1
+        if not self.adaptive:
+            return
+
+        self.concurrency = max(1, self.concurrency // 2)
+        self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        self.logger.warning(
+            f"_on_failure :: Batch failed ({error}), concurrency -> {self.concurrency}, batch size -> {self.batch_size}")
+
+    async def _timed(self, embed_batch: EmbedBatch, batch: List[Tuple[int, str]], delay: float) -> Tuple[List[Embedding], float]:
+        """Run one batch, after an optional delay, once a slot is free, and measure its latency."""
+        if delay:
+            await asyncio.sleep(delay)
+        async with self._slot_released:
+            # Waiting batches check again at each release; they only wait while other batches
+            # are in flight, so a release always follows
+            await self._slot_released.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+        try:
+            start = time.perf_counter()
+            embeddings = await embed_batch([text for _, text in batch])
+            return embeddings, (time.perf_counter() - start) * 1000
+        finally:
+            async with self._slot_released:
+                self._in_flight -= 1
+                self._slot_released.notify_all()
+
+    async def run(self, texts: List[str], embed_batch: EmbedBatch) -> List[Embedding]:
+        """Embed all texts, keeping up to `concurrency` batches in flight across the concurrent calls.
+
+        Args:
+            texts: Texts to embed.
+            embed_batch: Coroutine function embedding one batch of texts.
+
+        Returns:
+            List[Embedding]: Embeddings in the same order as the input texts.
+
+        Raises:
+            Exception: The last error of a batch that still fails after `max_retries` retries.
+        """
+        results: List[Optional[Embedding]] = [None] * len(texts)
+        pending: Deque[Tuple[int, str]] = deque(enumerate(texts))
+        retry_queue: Deque[Tuple[List[Tuple[int, str]], int]] = deque()
+        in_flight: Dict[asyncio.Task, Tuple[List[Tuple[int, str]], int]] = {}
+
+        try:
+            while pending or retry_queue or in_flight:
+                while (pending or retry_queue) and len(in_flight) < self.concurrency:
+                    if retry_queue:
+                        batch, attempt = retry_queue.popleft()
+                    else:
+                        batch, attempt = self._take_batch(pending), 0
+                    delay = self.retry_backoff * attempt
+                    task = asyncio.create_task(self._timed(embed_batch, batch, delay))
+                    in_flight[task] = (batch, attempt)
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                failure: Optional[Exception] = None
+                for task in done:
+                    batch, attempt = in_flight.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        embeddings, latency_ms = task.result()
+                        for (position, _), embedding in zip(batch, embeddings):
+                            results[position] = embedding
+                        self._on_success(latency_ms)
+                        continue
+
+                    self._on_failure(error)
+                    if not self.is_retryable(error) or attempt >= self.max_retries:
+                        self.logger.error(f"run :: Giving up on batch of {len(batch)} texts after {attempt} retries")
+                        # The other completed batches are still collected, so that no exception is left unread
+                        failure = failure or error
+                        continue
+                    self._retries += 1
+                    # Re-split the batch so that the retry honours the reduced batch size
+                    for start in range(0, len(batch), self.batch_size):
+                        retry_queue.append((batch[start:start + self.batch_size], attempt + 1))
+                if failure is not None:
+                    raise failure
+        finally:
+            for task in in_flight:
+                task.cancel()
+            # Wait for the cancelled batches to release their slots, and read their outcome
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+        return results
+
+    def get_metrics(self) -> dict:
+        """Return the current settings and counters of the scheduler.
+
+        Returns:
+            dict: Concurrency, batch size, and batch/retry/throttling counters.
+        """
+        return {
+            "concurrency": self.concurrency,
+            "batch_size": self.batch_size,
+            "max_concurrency": self.max_concurrency,
+            "max_batch_size": self.max_batch_size,
+            "batches": self._batches,
+            "retries": self._retries,
+            "throttled": self._throttled,
+            "errors": self._errors,
+            "avg_batch_latency_ms": round(self._latency_ewma_ms, 1) if self._latency_ewma_ms is not None else None,
+        }
@@ -1,9 +1,10 @@
 import time
-from typing import Optional
+from typing import List, Optional
 
 from src.components.rag.application.ports.driven import EmbeddingPort
 from src.components.rag.domain.value_objects import Embedding
 from src.components.rag.infrastructure.adapters.driven.litellm_proxy import LiteLLMBaseAdapter
+from src.components.rag.infrastructure.adapters.driven.llm.embedding_scheduler import AdaptiveEmbeddingScheduler
 from src.components.rag.infrastructure.adapters.driven.litellm_proxy import LiteLLMConfig, \
     default_litellm_settings
 
@@ -23,6 +24,18 @@ class LiteLLMEmbeddingAdapter(LiteLLMBaseAdapter, EmbeddingPort):
         """
         # Initialize base class that handles all configuration
         super().__init__(config)
+        self.model = self.default_litellm_embedding_model
+        self.scheduler = AdaptiveEmbeddingScheduler(
+            max_batch_size=self.config.embedding_batch_size,
+            max_batch_tokens=self.config.embedding_batch_max_tokens,
+            initial_concurrency=self.config.embedding_initial_concurrency,
+            max_concurrency=self.config.embedding_max_concurrency,
+            target_latency_ms=self.config.embedding_target_latency_ms,
+            max_retries=self.config.embedding_max_retries,
+            retry_backoff=self.config.embedding_retry_backoff,
+            adaptive=self.config.embedding_adaptive,
+            estimate_tokens=self._estimate_tokens,
+        )
         self.logger.info("LiteLLMAdapter initialized successfully")
         self.logger.debug(f"Configuration: {self.get_config_summary()}")
 
@@ -74,6 +87,104 @@ class LiteLLMEmbeddingAdapter(LiteLLMBaseAdapter, EmbeddingPort):
 
         return await self._format_response(api_response, processing_time_ms)
 
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Roughly estimate the number of tokens of a text (about 4 characters per token).
+
+        Args:
+            text: Text to measure.
+
+        Returns:
+            int: Estimated number of tokens, at least 1.
+        """
+        return max(1, len(text) // 4)
+
+    async def _format_batch_response(self, api_response: dict, processing_time_ms: int) -> List[Embedding]:
+        """Format a batched embeddings API response into domain Embedding objects.
+
+        Args:
+            api_response: Response from embeddings API for a list input
+            processing_time_ms: Processing time of the whole batch in milliseconds
+
+        Returns:
+            List[Embedding]: Embeddings ordered like the request input
+        """
+        data = sorted(api_response['data'], key=lambda item: item.get('index', 0))
+        usage = api_response.get('usage') or {}
+        single = len(data) == 1
+        self.logger.debug(f"_format_batch_response :: Formatting {len(data)} embeddings, usage={usage}")
+
+        return [
+            Embedding(
+                model=api_response['model'],
+                vector=item['embedding'],
+                # Token usage is reported per request, it can only be attributed to a single input
+                prompt_tokens=usage.get('prompt_tokens') if single else None,
+                completion_tokens=usage.get('completion_tokens') if single else None,
+                provider=self.config.provider,
+                processing_time_ms=processing_time_ms
+            )
+            for item in data
+        ]
+
+    async def _embed_batch(self, batch: List[str], model: Optional[str] = None) -> List[Embedding]:
+        """Embed one batch of texts with a single embeddings request.
+
+        Args:
+            batch: Texts to embed together.
+            model: The embedding model to use. Defaults to config model if None.
+
+        Returns:
+            List[Embedding]: Embeddings ordered like the batch.
+
+        Raises:
+            ValueError: If the API does not return one embedding per input text.
+        """
+        start = time.time()
+        api_response = await self.embeddings(input_text=batch, model=model)
+        processing_time_ms = int((time.time() - start) * 1000)
+
+        embeddings = await self._format_batch_response(api_response, processing_time_ms)
+        if len(embeddings) != len(batch):
+            raise ValueError(f"Embeddings API returned {len(embeddings)} vectors for {len(batch)} inputs")
+        return embeddings
+
+    async def embed_texts(self, texts: List[str], model: str = None) -> List[Embedding]:
+        """
+        Generate embeddings for several texts using batched embeddings requests.
+
+        Batches are bounded by `embedding_batch_size` and `embedding_batch_max_tokens`
+        and several of them are kept in flight by the adaptive scheduler.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            model (str, optional): The embedding model to use. Defaults to config model if None.
+
+        Returns:
+            List[Embedding]: The embeddings, in the same order as the input texts.
+        """
+        if not texts:
+            return []
+
+        self.logger.info(f"embed_texts :: Generating {len(texts)} embeddings")
+
+        async def embed_batch(batch: List[str]) -> List[Embedding]:
+            return await self._embed_batch(batch, model=model)
+
+        embeddings = await self.scheduler.run(texts, embed_batch)
+
+        self.logger.info(f"embed_texts :: Generated {len(embeddings)} embeddings")
+        self.logger.debug(f"embed_texts :: Scheduler state: {self.scheduler.get_metrics()}")
+        return embeddings
+
+    def get_metrics(self) -> dict:
+        """Return the current embedding scheduler settings and counters.
+
+        Returns:
+            dict: Concurrency, batch size and batch counters of the scheduler.
+        """
+        return {"scheduler": self.scheduler.get_metrics()}
+
 
 if __name__ == "__main__":
     import asyncio
@@ -1,8 +1,8 @@
 import time
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from src.components.rag.application.ports.driven import LLMPort
-from src.components.rag.domain.value_objects import Response, Message
+from src.components.rag.domain.value_objects import Response, Message, ResponseChunk
 from src.components.rag.infrastructure.adapters.driven.litellm_proxy import LiteLLMBaseAdapter, LiteLLMConfig, \
     default_litellm_settings
 
@@ -106,6 +106,49 @@ class LiteLLMAdapter(LiteLLMBaseAdapter, LLMPort):
         
         return response
 
+    async def stream_response(self, messages: list[Message]) -> AsyncIterator[ResponseChunk]:
+        """Stream a response using chat/completions with `stream=True` via LiteLLMBase.
+
+        Implementation required by LLMPort interface.
+
+        Args:
+            messages: List of conversation messages
+
+        Yields:
+            ResponseChunk: Content deltas, then token usage on the final chunk
+
+        Raises:
+            Exception: If the API call fails
+        """
+        self.logger.info(f"stream_response :: Starting streamed response for {len(messages)} messages")
+
+        messages_dict = [
+            {"role": message.role, "content": message.content}
+            for message in messages
+        ]
+
+        chunk_count = 0
+        async for api_chunk in self.chat_completion_stream(messages_dict):
+            usage = api_chunk.get('usage') or {}
+            choices = api_chunk.get('choices') or []
+            delta = choices[0].get('delta', {}) if choices else {}
+            content = delta.get('content') or ""
+            finish_reason = choices[0].get('finish_reason') if choices else None
+
+            if not content and not finish_reason and not usage:
+                continue
+
+            chunk_count += 1
+            yield ResponseChunk(
+                content=content,
+                finish_reason=finish_reason,
+                model_used=self.config.default_chat_model,
+                input_tokens=usage.get('prompt_tokens'),
+                output_tokens=usage.get('completion_tokens')
+            )
+
+        self.logger.info(f"stream_response :: Streamed response completed with {chunk_count} chunks")
+
 
 if __name__ == "__main__":
     import asyncio
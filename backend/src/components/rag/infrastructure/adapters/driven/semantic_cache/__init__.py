@@ -0,0 +1,8 @@
+from .in_memory_semantic_cache_adapter import InMemorySemanticCacheAdapter
+from .semantic_cache_config import SemanticCacheConfig, default_semantic_cache_settings
+
+__all__ = [
+    "InMemorySemanticCacheAdapter",
+    "SemanticCacheConfig",
+    "default_semantic_cache_settings"
+]
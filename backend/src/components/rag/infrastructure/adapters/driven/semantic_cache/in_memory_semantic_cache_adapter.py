@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from src.components.rag.application.ports.driven import SemanticCachePort
+from src.components.rag.domain.value_objects import RAGResponse
+
+
+class InMemorySemanticCacheAdapter(SemanticCachePort):
+    """In-process semantic answer cache backed by a matrix of normalized query vectors.
+
+    A lookup is a single matrix-vector product over the cached queries; the best
+    match is served if its cosine similarity reaches the configured threshold.
+    Entries expire after a TTL and the oldest ones are evicted beyond capacity.
+    """
+
+    def __init__(
+            self,
+            similarity_threshold: float = 0.95,
+            max_entries: int = 512,
+            ttl_seconds: float = 86400.0,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the semantic cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a cached answer to be served.
+            max_entries: Maximum number of cached answers.
+            ttl_seconds: Time in seconds a cached answer stays valid.
+            clock: Monotonic clock returning seconds, overridable for tests.
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+
+        self._vectors: Optional[np.ndarray] = None
+        self._responses: List[RAGResponse] = []
+        self._expires_at: List[float] = []
+        self._invalidated_at = datetime.min.replace(tzinfo=timezone.utc)
+        self._lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.info(f"__init__ :: Semantic cache ready (threshold={similarity_threshold}, max={max_entries})")
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> Optional[np.ndarray]:
+        """Return the unit vector of a query, or None for a null vector."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        if norm == 0:
+            return None
+        return array / norm
+
+    def _drop(self, keep: np.ndarray) -> None:
+        """Keep only the entries selected by the boolean mask."""
+        self._vectors = self._vectors[keep] if keep.any() else None
+        self._responses = [r for r, k in zip(self._responses, keep) if k]
+        self._expires_at = [e for e, k in zip(self._expires_at, keep) if k]
+
+    async def lookup(self, query_vector: List[float]) -> Optional[RAGResponse]:
+        """Return the cached answer of the most similar query above the threshold.
+
+        Args:
+            query_vector: Embedding vector of the incoming query.
+
+        Returns:
+            Optional[RAGResponse]: The cached answer marked as a cache hit, or None.
+        """
+        query = self._normalize(query_vector)
+        async with self._lock:
+            if query is None or self._vectors is None or self._vectors.shape[1] != query.shape[0]:
+                self.misses += 1
+                return None
+
+            expired = np.asarray(self._expires_at) <= self.clock()
+            if expired.any():
+                self._drop(~expired)
+                if self._vectors is None:
+                    self.misses += 1
+                    return None
+
+            similarities = self._vectors @ query
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.similarity_threshold:
+                self.misses += 1
+                self.logger.debug(f"lookup :: Miss, best similarity {similarity:.4f}")
+                return None
+
+            self.hits += 1
+            self.logger.info(f"lookup :: Hit with similarity {similarity:.4f}")
+            return self._responses[best].model_copy(update={"cached": True, "cache_similarity": similarity})
+
+    async def store(self, query_vector: List[float], response: RAGResponse, retrieved_at: datetime) -> None:
+        """Store the answer of a query unless the knowledge base changed since retrieval.
+
+        Args:
+            query_vector: Embedding vector of the query.
+            response: The generated answer with its sources.
+            retrieved_at: UTC time at which the sources were retrieved.
+        """
+        query = self._normalize(query_vector)
+        async with self._lock:
+            if query is None or retrieved_at < self._invalidated_at:
+                self.logger.debug("store :: Answer not cached, sources may be outdated")
+                return
+            if self._vectors is not None and self._vectors.shape[1] != query.shape[0]:
+                self._vectors, self._responses, self._expires_at = None, [], []
+
+            row = query[np.newaxis, :]
+            self._vectors = row if self._vectors is None else np.vstack([self._vectors, row])
+            self._responses.append(response)
+            self._expires_at.append(self.clock() + self.ttl_seconds)
+
+            if len(self._responses) > self.max_entries:
+                keep = np.zeros(len(self._responses), dtype=bool)
+                keep[-self.max_entries:] = True
+                self._drop(keep)
+
+    async def invalidate(self) -> None:
+        """Drop every cached answer."""
+        async with self._lock:
+            self._invalidated_at = datetime.now(timezone.utc)
+            count = len(self._responses)
+            self._vectors, self._responses, self._expires_at = None, [], []
+        self.logger.info(f"invalidate :: Dropped {count} cached answers")
+
+    def get_metrics(self) -> dict:
+        """Return hit/miss counters and size of the cache.
+
+        Returns:
+            dict: Hits, misses and number of cached answers.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._responses)}
@@ -0,0 +1,29 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SemanticCacheConfig(BaseSettings):
+    """Configuration for the semantic answer cache of the chat endpoint.
+
+    Attributes:
+        enabled: Whether answers are cached and served by query similarity.
+        similarity_threshold: Minimum cosine similarity for a cached answer to be served.
+        max_entries: Maximum number of cached answers.
+        ttl_seconds: Time in seconds a cached answer stays valid.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="SEMANTIC_CACHE_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra='ignore',
+    )
+
+    enabled: bool = Field(default=False, description="Whether answers are cached and served by query similarity")
+    similarity_threshold: float = Field(default=0.95, gt=0.0, le=1.0,
+                                        description="Minimum cosine similarity for a cached answer to be served")
+    max_entries: int = Field(default=512, gt=0, description="Maximum number of cached answers")
+    ttl_seconds: float = Field(default=86400.0, gt=0.0, description="Time in seconds a cached answer stays valid")
+
+
+default_semantic_cache_settings = SemanticCacheConfig()
@@ -1,37 +1,35 @@
 import logging
-from io import BytesIO
-from typing import List
+from typing import List, Optional
 
-from docling.document_converter import DocumentConverter
-from docling.chunking import HybridChunker
-from docling.datamodel.base_models import DocumentStream
+from docling_core.types import DoclingDocument
 
 from src.components.rag.application.ports.driven.text_chunking_port import TextChunkingPort
 from src.components.rag.domain.value_objects import DocumentRetrieval
 from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
+from src.components.rag.infrastructure.adapters.driven.docling_pool import DoclingProcessPool
+from src.components.rag.infrastructure.adapters.driven.docling_pool.docling_worker import chunk_document, \
+    chunk_markdown, init_worker
 
 
 class DoclingTextChunkingAdapter(TextChunkingPort):
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
+    """
+    Adapter for text chunking using Docling's HybridChunker.
+
+    Chunking is CPU-bound and runs in the worker processes of a DoclingProcessPool,
+    off the event loop. When the extracted content carries the DoclingDocument built
+    by the extraction, it is chunked directly; otherwise the text is parsed first.
+    """
 
-    @staticmethod
-    def _create_document_stream_from_string(content: str, filename: str) -> DocumentStream:
+    def __init__(self, pool: Optional[DoclingProcessPool] = None):
         """
-        Creates a DocumentStream from a string content.
+        Initialize the adapter.
 
         Args:
-            content (str): The text content to convert to stream.
-            filename (str): The filename for the document.
-
-        Returns:
-            DocumentStream: Document stream containing the encoded content.
+            pool (Optional[DoclingProcessPool]): Process pool running the chunking. If None,
+                the adapter uses a single-worker pool of its own.
         """
-        # Convert string to bytes and create a BytesIO
-        bytes_content = content.encode('utf-8')
-        stream = BytesIO(bytes_content)
-
-        return DocumentStream(name=filename, stream=stream)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.pool = pool if pool is not None else DoclingProcessPool(max_workers=1, initializer=init_worker)
 
     async def chunk_text(self, extracted_content: ExtractedContent) -> List[DocumentRetrieval]:
         """
@@ -44,43 +42,37 @@ class DoclingTextChunkingAdapter(TextChunkingPort):
             List[DocumentRetrieval]: List of chunked documents with metadata.
         """
         self.logger.info("chunk_text :: Starting text chunking process")
-        
-        # Convert string to Docling document
         self.logger.debug(f"chunk_text :: Processing content from file: {extracted_content.metadata.get('filename', 'unknown.txt')}")
-        converter = DocumentConverter()
-
-        # Format filename for DocumentStream with content already extracted
-        extracted_filename, type_ = extracted_content.metadata.get("filename", "unknown.txt").split(".")
-        extraction_type = extracted_content.metadata.get("format", "md")
-        extracted_filename = f"{extracted_filename}_extracted.{extraction_type}"  # TODO TO CHANGE here
-        document_stream = self._create_document_stream_from_string(
-            content=extracted_content.text,
-            filename=extracted_filename
-        )
-        doc = converter.convert(
-            source=document_stream,
-        ).document
-
-        # Instantiate and apply HybridChunker
-        self.logger.info("chunk_text :: Applying HybridChunker to document")
-        chunker = HybridChunker()
-        chunks = list(chunker.chunk(dl_doc=doc))
+
+        if isinstance(extracted_content.document, DoclingDocument):
+            # Chunk the structured document built by the extraction, without parsing the text again
+            self.logger.info("chunk_text :: Applying HybridChunker to extracted document")
+            chunks = await self.pool.run(chunk_document, extracted_content.document)
+        else:
+            # Format filename for the Markdown document with content already extracted
+            extracted_filename, type_ = extracted_content.metadata.get("filename", "unknown.txt").split(".")
+            extraction_type = extracted_content.metadata.get("format", "md")
+            extracted_filename = f"{extracted_filename}_extracted.{extraction_type}"  # TODO TO CHANGE here
+
+            # Convert the text to a Docling document and apply HybridChunker in a worker process
+            self.logger.info("chunk_text :: Applying HybridChunker to document text")
+            chunks = await self.pool.run(chunk_markdown, extracted_filename, extracted_content.text)
         self.logger.debug(f"chunk_text :: Generated {len(chunks)} chunks")
 
         # Convert chunks to DocumentRetrieval
         document_retrievals: List[DocumentRetrieval] = []
 
-        for i, chunk in enumerate(chunks):
+        for i, (chunk_text, chunk_type) in enumerate(chunks):
             # Create metadata for this chunk
             chunk_metadata = {
                 **extracted_content.metadata,  # Inherit metadata from original document
                 "chunk_index": i,
-                "chunk_type": type(chunk).__name__,
+                "chunk_type": chunk_type,
             }
 
             # Create DocumentRetrieval
             doc_retrieval = DocumentRetrieval(
-                content=chunk.text,
+                content=chunk_text,
                 metadata=chunk_metadata
             )
 
@@ -1,11 +1,13 @@
 import logging
-from io import BytesIO
-from annotated_types import doc
-from docling.datamodel.base_models import DocumentStream, InputFormat
-from docling.document_converter import DocumentConverter, PdfFormatOption
+from typing import Optional
+
+from docling.datamodel.base_models import DocumentStream
 from docling.datamodel.pipeline_options import PdfPipelineOptions, smolvlm_picture_description
 from docling_core.types import DoclingDocument
 from src.components.rag.application.ports.driven.text_extraction_port import TextExtractionPort
+from src.components.rag.infrastructure.adapters.driven.docling_pool import DoclingProcessPool
+from src.components.rag.infrastructure.adapters.driven.docling_pool.docling_worker import convert_document, \
+    get_converter, init_worker
 from src.components.rag.domain.value_objects import InputDocument
 from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
 
@@ -15,11 +17,20 @@ class DoclingTextExtractionAdapter(TextExtractionPort):
     Adapter for text extraction using Docling library.
     
     Implements TextExtractionPort to extract text content from documents
-    using the Docling document converter.
+    using the Docling document converter. Conversion is CPU-bound and runs in
+    the worker processes of a DoclingProcessPool, off the event loop.
     """
 
-    def __init__(self):
+    def __init__(self, pool: Optional[DoclingProcessPool] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            pool (Optional[DoclingProcessPool]): Process pool running the conversions. If None,
+                the adapter uses a single-worker pool of its own.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.pool = pool if pool is not None else DoclingProcessPool(max_workers=1, initializer=init_worker)
 
     async def extract_text(self, document: InputDocument) -> ExtractedContent:
         """
@@ -33,9 +44,6 @@ class DoclingTextExtractionAdapter(TextExtractionPort):
         """
         self.logger.info("extract_text :: Starting text extraction")
         
-        buf = BytesIO(document.content)
-        source = DocumentStream(name=document.filename, stream=buf)
-
         self.logger.debug(f"extract_text :: Processing document: {document.filename}")
 
         # if document.type == "application/pdf" or ".pdf":  TODO improve PDF with images handling ?
@@ -47,9 +55,8 @@ class DoclingTextExtractionAdapter(TextExtractionPort):
         #     converter = DocumentConverter()
         #     docling_document: DoclingDocument = converter.convert(source).document
 
-        converter = DocumentConverter()
-        docling_document: DoclingDocument = converter.convert(source).document
-        extracted_text = docling_document.export_to_markdown()
+        extracted_text, docling_document = await self.pool.run(convert_document, document.filename,
+                                                               document.content, document.path)
         self.logger.debug(f"extract_text :: Extracted text length: {len(extracted_text)}")
         
         result = ExtractedContent(
@@ -58,7 +65,8 @@ class DoclingTextExtractionAdapter(TextExtractionPort):
                 "filename": document.filename,
                 "source_format": "docling",
                 "format": "md",
-            } # TODO standardize metadata across the application
+            }, # TODO standardize metadata across the application
+            document=docling_document
         )
         
         self.logger.info("extract_text :: Text extraction completed")
@@ -87,11 +95,4 @@ class DoclingTextExtractionAdapter(TextExtractionPort):
         pipeline_options.images_scale = 2.0
         pipeline_options.generate_picture_images = True
 
-        converter = DocumentConverter(
-            format_options={
-                InputFormat.PDF: PdfFormatOption(
-                    pipeline_options=pipeline_options,
-                )
-            }
-        )
-        return converter.convert(source).document
+        return get_converter(pipeline_options=pipeline_options).convert(source).document
@@ -1,3 +1,4 @@
+from .lifespan import rag_lifespan
 from .v1.rag_routes import rag_router
 
 # Export routers as actual APIRouter objects
@@ -5,4 +6,4 @@ __routers__ = [
     rag_router
 ]
 
-__all__ = ["__routers__"]
+__all__ = ["__routers__", "rag_lifespan"]
@@ -0,0 +1,69 @@
+import logging
+from typing import Optional
+
+from src.components.rag.application.ports.driven import EmbeddingPort
+from src.components.rag.infrastructure.adapters.driven.embedding_cache import CachedEmbeddingAdapter, \
+    EmbeddingCacheConfig, EmbeddingCacheStore, QueryEmbeddingCacheAdapter, default_embedding_cache_settings
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+def build_embedding_cache_store(
+        cache_config: EmbeddingCacheConfig = default_embedding_cache_settings) -> Optional[EmbeddingCacheStore]:
+    """
+    Create the embedding cache store, or None when the embedding cache is disabled.
+
+    Args:
+        cache_config (EmbeddingCacheConfig): Embedding cache configuration.
+
+    Returns:
+        Optional[EmbeddingCacheStore]: Cache store of embedding vectors.
+    """
+    if not cache_config.enabled:
+        logger.debug("build_embedding_cache_store :: Embedding cache disabled")
+        return None
+    logger.info("build_embedding_cache_store :: Creating embedding cache store")
+    return EmbeddingCacheStore(
+        memory_max_bytes=cache_config.memory_max_bytes,
+        sqlite_path=cache_config.sqlite_path,
+    )
+
+
+def build_embedding_adapter(embedding_adapter: EmbeddingPort, store: Optional[EmbeddingCacheStore]) -> EmbeddingPort:
+    """
+    Wrap the embedding adapter used for document ingestion by the embedding cache, if any.
+
+    Args:
+        embedding_adapter (EmbeddingPort): Embedding adapter calling the embedding model.
+        store (Optional[EmbeddingCacheStore]): Embedding cache store, None when disabled.
+
+    Returns:
+        EmbeddingPort: Embedding port used for document ingestion.
+    """
+    if store is None:
+        return embedding_adapter
+    return CachedEmbeddingAdapter(embedding_port=embedding_adapter, store=store)
+
+
+def build_query_embedding_adapter(embedding_adapter: EmbeddingPort,
+                                  cache_config: EmbeddingCacheConfig = default_embedding_cache_settings) -> EmbeddingPort:
+    """
+    Wrap the embedding adapter used for user queries by a TTL + LRU query embedding cache when enabled.
+
+    Args:
+        embedding_adapter (EmbeddingPort): Embedding adapter calling the embedding model.
+        cache_config (EmbeddingCacheConfig): Embedding cache configuration.
+
+    Returns:
+        EmbeddingPort: Embedding port used on the query path.
+    """
+    if not cache_config.query_cache_enabled:
+        logger.debug("build_query_embedding_adapter :: Query embedding cache disabled")
+        return embedding_adapter
+    logger.info("build_query_embedding_adapter :: Creating query embedding cache")
+    return QueryEmbeddingCacheAdapter(
+        embedding_port=embedding_adapter,
+        max_entries=cache_config.query_cache_max_entries,
+        ttl_seconds=cache_config.query_cache_ttl_seconds,
+    )
@@ -0,0 +1,193 @@
+import logging
+from functools import partial
+from typing import Optional
+
+from fastapi import Request
+from qdrant_client import AsyncQdrantClient
+
+from src.components.rag.application.handlers.document_store_handler import DocumentStoreHandler
+from src.components.rag.application.handlers.query_handler import QueryHandler
+from src.components.rag.application.ports.driven import EmbeddingPort, LLMPort, SemanticCachePort, \
+    TextChunkingPort, VectorRetrieverPort, VectorStorePort
+from src.components.rag.application.ports.driven.text_extraction_port import TextExtractionPort
+from src.components.rag.config import RAGConfig
+from src.components.rag.domain.services.bulk_ingestion_service import BulkIngestionService
+from src.components.rag.domain.services.document_store_service import DocumentStoreService
+from src.components.rag.domain.services.ingestion_job_service import IngestionJobService
+from src.components.rag.domain.services.query_service import QueryService
+from src.components.rag.infrastructure.adapters.driven import DoclingTextChunkingAdapter, \
+    DoclingTextExtractionAdapter
+from src.components.rag.infrastructure.adapters.driven.docling_pool import DoclingPoolConfig, DoclingProcessPool, \
+    default_docling_pool_settings
+from src.components.rag.infrastructure.adapters.driven.docling_pool.docling_worker import init_worker
+from src.components.rag.infrastructure.adapters.driven.embedding_cache import EmbeddingCacheConfig, \
+    default_embedding_cache_settings
+from src.components.rag.infrastructure.adapters.driven.ingestion_jobs import IngestionJobConfig, \
+    IngestionPipelineConfig, InMemoryIngestionJobRepository, SqliteIngestionJobStore, \
+    default_ingestion_job_settings, default_ingestion_pipeline_settings
+from src.components.rag.infrastructure.adapters.driven.litellm_proxy import LiteLLMBaseAdapter, LiteLLMConfig, \
+    default_litellm_settings
+from src.components.rag.infrastructure.adapters.driven.llm import LiteLLMAdapter, LiteLLMEmbeddingAdapter
+from src.components.rag.infrastructure.adapters.driven.semantic_cache import SemanticCacheConfig, \
+    default_semantic_cache_settings
+from src.components.rag.infrastructure.api.di.embedding_di import build_embedding_adapter, \
+    build_embedding_cache_store, build_query_embedding_adapter
+from src.components.rag.infrastructure.api.di.semantic_cache_di import build_semantic_cache
+from src.components.rag.infrastructure.api.v1.upload_spool import UploadConfig, discard_spooled_upload, \
+    default_upload_settings
+from src.components.rag.infrastructure.persistence import QdrantVectorRetrieverAdapter, QdrantVectorStoreAdapter
+from src.components.rag.infrastructure.persistence.qdrant_vector_base import QdrantVectorBase
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant that provides accurate information based on the provided context. If the context does not contain the answer, respond with 'I don't know'."
+
+
+class RAGContainer:
+    """Application-scoped adapters, services and handlers of the RAG component.
+
+    Everything is built once at application startup and shared by all requests:
+    one LiteLLM HTTP connection pool, one Qdrant client (and gRPC channel) shared
+    by the store and retriever adapters, one embedding adapter whose adaptive
+    scheduler keeps its tuning across documents, one process pool running
+    Docling, and the workers of the background ingestion jobs, whose queue and
+    checkpoints are kept in SQLite so that they resume after a restart. `close`
+    releases the clients, pools and caches at shutdown.
+    """
+
+    def __init__(
+            self,
+            litellm_config: LiteLLMConfig = default_litellm_settings,
+            embedding_cache_config: EmbeddingCacheConfig = default_embedding_cache_settings,
+            semantic_cache_config: SemanticCacheConfig = default_semantic_cache_settings,
+            docling_pool_config: DoclingPoolConfig = default_docling_pool_settings,
+            ingestion_job_config: IngestionJobConfig = default_ingestion_job_settings,
+            ingestion_pipeline_config: IngestionPipelineConfig = default_ingestion_pipeline_settings,
+            qdrant_client: Optional[AsyncQdrantClient] = None,
+    ):
+        """Build the adapters, services and handlers.
+
+        Args:
+            litellm_config: LiteLLM configuration of the chat and embedding adapters.
+            embedding_cache_config: Embedding cache configuration.
+            semantic_cache_config: Semantic answer cache configuration.
+            docling_pool_config: Configuration of the process pool running Docling.
+            ingestion_job_config: Configuration of the background ingestion jobs.
+            ingestion_pipeline_config: Configuration of the staged pipeline of bulk ingestions.
+            qdrant_client: Qdrant client to share. If None, one is created from the repository settings.
+        """
+        logger.info("RAGContainer :: Building application-scoped RAG dependencies")
+
+        self.rag_config = RAGConfig(system_prompt=DEFAULT_SYSTEM_PROMPT)
+
+        # Shared clients
+        LiteLLMBaseAdapter.open_http_client(litellm_config)
+        self.qdrant_client: AsyncQdrantClient = qdrant_client if qdrant_client is not None \
+            else QdrantVectorBase.create_client()
+
+        # Driven adapters
+        self.llm_adapter: LLMPort = LiteLLMAdapter(config=litellm_config)
+        self.embedding_adapter: EmbeddingPort = LiteLLMEmbeddingAdapter(config=litellm_config)
+        self.embedding_cache_store = build_embedding_cache_store(embedding_cache_config)
+        self.ingestion_embedding_adapter: EmbeddingPort = build_embedding_adapter(self.embedding_adapter,
+                                                                                  self.embedding_cache_store)
+        self.query_embedding_adapter: EmbeddingPort = build_query_embedding_adapter(self.embedding_adapter,
+                                                                                    embedding_cache_config)
+        self.semantic_cache: Optional[SemanticCachePort] = build_semantic_cache(semantic_cache_config)
+        vector_store = QdrantVectorStoreAdapter(client=self.qdrant_client)
+        self.vector_store: VectorStorePort = vector_store
+        # The storage tier is changed through the store, and applies to the collections the retriever creates
+        self.vector_retriever: VectorRetrieverPort = QdrantVectorRetrieverAdapter(
+            client=self.qdrant_client, collection_parameters=vector_store.collection_parameters)
+        self.docling_warmup = docling_pool_config.warmup
+        self.docling_pool = DoclingProcessPool(
+            max_workers=docling_pool_config.max_workers,
+            max_pending=docling_pool_config.max_pending,
+            task_timeout_seconds=docling_pool_config.task_timeout_seconds,
+            initializer=init_worker,
+            initargs=(tuple(docling_pool_config.warmup_formats),) if docling_pool_config.warmup else (),
+            enabled=docling_pool_config.enabled,
+        )
+        self.text_extraction: TextExtractionPort = DoclingTextExtractionAdapter(pool=self.docling_pool)
+        self.text_chunking: TextChunkingPort = DoclingTextChunkingAdapter(pool=self.docling_pool)
+
+        # Services and handlers
+        self.query_handler = QueryHandler(query_service=QueryService(
+            vector_retriever_port=self.vector_retriever,
+            llm_port=self.llm_adapter,
+            embedding_port=self.query_embedding_adapter,
+            rag_config=self.rag_config,
+            semantic_cache_port=self.semantic_cache,
+        ))
+        self.ingestion_job_store: Optional[SqliteIngestionJobStore] = None
+        if ingestion_job_config.sqlite_path:
+            self.ingestion_job_store = SqliteIngestionJobStore(
+                sqlite_path=ingestion_job_config.sqlite_path,
+                max_finished_jobs=ingestion_job_config.max_finished_jobs,
+            )
+        document_store_service = DocumentStoreService(
+            vector_store_port=self.vector_store,
+            embedding_port=self.ingestion_embedding_adapter,
+            text_extraction_port=self.text_extraction,
+            text_chunking_port=self.text_chunking,
+            semantic_cache_port=self.semantic_cache,
+            embedding_group_size=ingestion_job_config.embedding_group_size,
+            checkpoint_port=self.ingestion_job_store,
+        )
+        self.ingestion_job_service = IngestionJobService(
+            document_store_service=document_store_service,
+            job_repository=self.ingestion_job_store or InMemoryIngestionJobRepository(
+                max_finished_jobs=ingestion_job_config.max_finished_jobs),
+            max_workers=ingestion_job_config.max_workers,
+            max_queued=ingestion_job_config.max_queued,
+            release_document=partial(discard_spooled_upload, spool_dir=ingestion_job_config.spool_dir),
+        )
+        # Job uploads are spooled where the jobs resumed at startup find them
+        self.job_upload_config: UploadConfig = default_upload_settings.model_copy(
+            update={"spool_dir": ingestion_job_config.spool_dir})
+        self.document_store_handler = DocumentStoreHandler(
+            document_store_service=document_store_service,
+            ingestion_job_service=self.ingestion_job_service,
+            bulk_ingestion_service=BulkIngestionService(
+                document_store_service=document_store_service,
+                extract_concurrency=ingestion_pipeline_config.extract_concurrency,
+                chunk_concurrency=ingestion_pipeline_config.chunk_concurrency,
+                embed_concurrency=ingestion_pipeline_config.embed_concurrency,
+                upsert_concurrency=ingestion_pipeline_config.upsert_concurrency,
+                queue_size=ingestion_pipeline_config.queue_size,
+            ),
+        )
+
+        logger.info("RAGContainer :: RAG dependencies built")
+
+    async def start(self) -> None:
+        """Start the ingestion workers and warm up the resources that are slow to load, when enabled."""
+        if self.docling_warmup:
+            await self.docling_pool.start()
+        await self.ingestion_job_service.start()
+
+    async def close(self) -> None:
+        """Close the shared clients and caches."""
+        logger.info("close :: Closing application-scoped RAG dependencies")
+        await self.ingestion_job_service.close()
+        await LiteLLMBaseAdapter.close_http_client()
+        await self.qdrant_client.close()
+        self.docling_pool.close()
+        if self.embedding_cache_store is not None:
+            self.embedding_cache_store.close()
+        if self.ingestion_job_store is not None:
+            self.ingestion_job_store.close()
+
+
+def get_rag_container(request: Request) -> RAGContainer:
+    """
+    Return the RAG container built by the application lifespan.
+
+    Args:
+        request (Request): The current request.
+
+    Returns:
+        RAGContainer: The application-scoped RAG dependencies.
+    """
+    return request.app.state.rag_container
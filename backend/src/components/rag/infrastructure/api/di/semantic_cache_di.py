@@ -0,0 +1,32 @@
+import logging
+from typing import Optional
+
+from src.components.rag.application.ports.driven import SemanticCachePort
+from src.components.rag.infrastructure.adapters.driven.semantic_cache import InMemorySemanticCacheAdapter, \
+    SemanticCacheConfig, default_semantic_cache_settings
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+def build_semantic_cache(
+        cache_config: SemanticCacheConfig = default_semantic_cache_settings) -> Optional[SemanticCachePort]:
+    """
+    Create the semantic answer cache, or None when disabled.
+
+    Args:
+        cache_config (SemanticCacheConfig): Semantic cache configuration.
+
+    Returns:
+        Optional[SemanticCachePort]: Semantic cache of chat answers.
+    """
+    if not cache_config.enabled:
+        logger.debug("build_semantic_cache :: Semantic answer cache disabled")
+        return None
+
+    logger.info("build_semantic_cache :: Creating semantic answer cache")
+    return InMemorySemanticCacheAdapter(
+        similarity_threshold=cache_config.similarity_threshold,
+        max_entries=cache_config.max_entries,
+        ttl_seconds=cache_config.ttl_seconds,
+    )
@@ -0,0 +1,31 @@
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from src.components.rag.infrastructure.api.di.rag_container import RAGContainer
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def rag_lifespan(app: FastAPI):
+    """
+    Manage long-lived resources of the RAG component for the application lifetime.
+
+    Builds the application-scoped RAG container at startup, so that requests reuse warm
+    HTTP and gRPC connections instead of building adapters per request, optionally warms
+    up the Docling workers, and closes it at shutdown.
+
+    Args:
+        app (FastAPI): The FastAPI application.
+    """
+    logger.info("rag_lifespan :: Starting RAG component resources")
+    app.state.rag_container = RAGContainer()
+    await app.state.rag_container.start()
+    try:
+        yield
+    finally:
+        logger.info("rag_lifespan :: Releasing RAG component resources")
+        await app.state.rag_container.close()
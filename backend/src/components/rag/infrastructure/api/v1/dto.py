@@ -1,7 +1,8 @@
+import json
 from typing import Union
 from datetime import datetime
 
-from src.components.rag.domain.value_objects import Response, RAGResponse, DocumentRetrieval
+from src.components.rag.domain.value_objects import Response, RAGResponse, DocumentRetrieval, RAGStreamEvent
 
 
 async def rag_response_to_dto(response: Union[Response, RAGResponse]) -> dict:
@@ -36,3 +37,28 @@ async def rag_response_to_dto(response: Union[Response, RAGResponse]) -> dict:
     if isinstance(dto.get("generated_at"), datetime):
         dto["generated_at"] = dto["generated_at"].isoformat()
     return dto
+
+
+def sse_event(event: str, data: dict) -> str:
+    """Formats a Server-Sent Event frame.
+
+    Args:
+        event (str): The event name.
+        data (dict): The JSON-compatible event payload.
+
+    Returns:
+        str: The `event:`/`data:` frame terminated by a blank line.
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def rag_stream_event_to_sse(event: RAGStreamEvent) -> str:
+    """Converts a streamed RAG event to a Server-Sent Event frame.
+
+    Args:
+        event (RAGStreamEvent): The sources, token or completed event.
+
+    Returns:
+        str: The SSE frame, named after the event and carrying its fields as JSON.
+    """
+    return sse_event(event.event, event.model_dump(mode="json", exclude={"event"}))
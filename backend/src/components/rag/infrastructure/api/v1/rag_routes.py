@@ -1,20 +1,26 @@
 import logging
-from typing import List, Any, Coroutine
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import List, Any, Coroutine, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Query as QueryParameter
+from fastapi.responses import StreamingResponse
 
 from src.components.rag.application.handlers.document_store_handler import DocumentStoreHandler
 from src.components.rag.application.handlers.query_handler import QueryHandler
-from src.components.rag.application.ports.driven import TextChunkingPort
-from src.components.rag.domain.value_objects import Query, RAGResponse, InputDocument, DocumentRetrieval, \
-    DocumentRetrievalVector, StoreDocumentResult, Embedding
+from src.components.rag.domain.value_objects import Query, RAGResponse, DocumentRetrieval, \
+    DocumentRetrievalVector, StoreDocumentResult, Embedding, IngestionJob, BulkIngestionReport, DeleteDocumentResult, \
+    SearchFilter, SearchOptions, CollectionStorage, StorageTier
+from src.components.rag.domain.services.document_store_service import DocumentConflictError
+from src.components.rag.domain.services.ingestion_job_service import IngestionQueueFullError
 from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
-from src.components.rag.infrastructure.adapters.driven import DoclingTextExtractionAdapter, DoclingTextChunkingAdapter, \
-    LiteLLMEmbeddingAdapter
 from src.components.rag.infrastructure.api.di.document_store_di import get_document_store_handler
 from src.components.rag.infrastructure.api.di.query_di import get_query_handler
-from src.components.rag.infrastructure.api.v1.dto import rag_response_to_dto
-from src.components.rag.infrastructure.persistence import QdrantVectorStoreAdapter
+from src.components.rag.infrastructure.api.di.rag_container import RAGContainer, get_rag_container
+from src.components.rag.infrastructure.api.v1.dto import rag_response_to_dto, rag_stream_event_to_sse, sse_event
+from src.components.rag.infrastructure.api.v1.upload_spool import UploadTooLargeError, spool_upload, \
+    spool_upload_to_disk, discard_spooled_upload
 
 # Create a router for RAG endpoints
 rag_router = APIRouter(prefix="/rag", tags=["rag"])
@@ -23,13 +29,67 @@ rag_router = APIRouter(prefix="/rag", tags=["rag"])
 logger = logging.getLogger(__name__)
 
 
+def get_search_filter(
+        filename: Optional[List[str]] = QueryParameter(None, description="Only search these documents"),
+        document_type: Optional[List[str]] = QueryParameter(None,
+                                                            description="Only search documents of these MIME types"),
+        ingested_after: Optional[datetime] = QueryParameter(None, description="Only search documents ingested since"),
+        ingested_before: Optional[datetime] = QueryParameter(None, description="Only search documents ingested until"),
+) -> Optional[SearchFilter]:
+    """
+    Build the metadata filter of a chat request from its query parameters.
+
+    Repeated `filename` or `document_type` parameters match any of their values.
+
+    Returns:
+        Optional[SearchFilter]: The filter, or None if no parameter is given.
+
+    Raises:
+        HTTPException: If the ingestion time range is empty.
+    """
+    try:
+        search_filter = SearchFilter(filenames=filename, document_types=document_type,
+                                     ingested_after=ingested_after, ingested_before=ingested_before)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return None if search_filter.is_empty else search_filter
+
+
+def get_search_options(
+        hnsw_ef: Optional[int] = QueryParameter(None, ge=1, description="Candidates explored in the HNSW graph"),
+        exact: Optional[bool] = QueryParameter(None, description="Search exhaustively instead of through the index"),
+        score_threshold: Optional[float] = QueryParameter(None, description="Minimum score of a source"),
+        indexed_only: Optional[bool] = QueryParameter(None, description="Skip the documents not indexed yet"),
+        oversampling: Optional[float] = QueryParameter(None, ge=1,
+                                                       description="Candidates fetched with quantized vectors"),
+        rescore: Optional[bool] = QueryParameter(None, description="Rescore candidates with the original vectors"),
+) -> Optional[SearchOptions]:
+    """
+    Build the search options of a chat request from its query parameters.
+
+    Unset parameters use the defaults of the vector retriever, so that each client
+    chooses its trade-off, e.g. a small `hnsw_ef` for fast suggestions or `exact`
+    for evaluation runs.
+
+    Returns:
+        Optional[SearchOptions]: The options, or None if no parameter is given.
+    """
+    search_options = SearchOptions(hnsw_ef=hnsw_ef, exact=exact, score_threshold=score_threshold,
+                                   indexed_only=indexed_only, oversampling=oversampling, rescore=rescore)
+    return None if search_options.is_empty else search_options
+
+
 @rag_router.post("/chat", response_model=RAGResponse)
-async def chat(request: str, handler: QueryHandler = Depends(get_query_handler)) -> dict:
+async def chat(request: str, search_filter: Optional[SearchFilter] = Depends(get_search_filter),
+               search_options: Optional[SearchOptions] = Depends(get_search_options),
+               handler: QueryHandler = Depends(get_query_handler)) -> dict:
     """
     Process a user query through the RAG system.
     
     Args:
         request (str): The query request containing the user's question.
+        search_filter (Optional[SearchFilter]): Restricts the retrieval to matching documents.
+        search_options (Optional[SearchOptions]): Recall and latency trade-off of the retrieval.
         handler (QueryHandler): The query handler dependency.
     
     Returns:
@@ -43,7 +103,7 @@ async def chat(request: str, handler: QueryHandler = Depends(get_query_handler))
 
     try:
         # Create domain query object from request
-        query = Query(content=request)
+        query = Query(content=request, search_filter=search_filter, search_options=search_options)
 
         # Process the query
         response = await handler.query(query)
@@ -59,6 +119,60 @@ async def chat(request: str, handler: QueryHandler = Depends(get_query_handler))
         raise HTTPException(status_code=500, detail="An error occurred while processing the query")
 
 
+@rag_router.post("/chat/stream", response_class=StreamingResponse)
+async def chat_stream(request: str, search_filter: Optional[SearchFilter] = Depends(get_search_filter),
+                      search_options: Optional[SearchOptions] = Depends(get_search_options),
+                      handler: QueryHandler = Depends(get_query_handler)) -> StreamingResponse:
+    """
+    Process a user query through the RAG system and stream the answer as Server-Sent Events.
+
+    The stream emits a `sources` event with the retrieved documents, one `token` event per
+    generated text fragment, and a final `done` event with token usage and timings. An
+    `error` event is emitted instead if generation fails mid-stream.
+
+    Args:
+        request (str): The query request containing the user's question.
+        search_filter (Optional[SearchFilter]): Restricts the retrieval to matching documents.
+        search_options (Optional[SearchOptions]): Recall and latency trade-off of the retrieval.
+        handler (QueryHandler): The query handler dependency.
+
+    Returns:
+        StreamingResponse: The `text/event-stream` response.
+
+    Raises:
+        HTTPException: If an error occurs before the first event is produced.
+    """
+    logger.info("chat_stream :: Processing new streamed chat request")
+    logger.debug(f"chat_stream :: Query content: {request}")
+
+    try:
+        query = Query(content=request, search_filter=search_filter, search_options=search_options)
+        events = handler.stream_query(query)
+        # Wait for the first event so that validation and retrieval errors map to HTTP status codes
+        first_event = await anext(events)
+    except ValueError as e:
+        logger.error(f"chat_stream :: Validation error: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"chat_stream :: Error during query processing: {str(e)}")
+        raise HTTPException(status_code=500, detail="An error occurred while processing the query")
+
+    async def event_stream():
+        yield rag_stream_event_to_sse(first_event)
+        try:
+            async for event in events:
+                yield rag_stream_event_to_sse(event)
+            logger.info("chat_stream :: Query streamed successfully")
+        except Exception as e:
+            logger.error(f"chat_stream :: Error during streaming: {str(e)}")
+            yield sse_event("error", {"detail": "An error occurred while processing the query"})
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 @rag_router.post("/store_document", response_model=StoreDocumentResult)
 async def add_document(file: UploadFile = File(...), handler: DocumentStoreHandler = Depends(get_document_store_handler)) -> StoreDocumentResult:
     """
@@ -72,24 +186,27 @@ async def add_document(file: UploadFile = File(...), handler: DocumentStoreHandl
         StoreDocumentResult: Result of the document storage operation.
     
     Raises:
-        HTTPException: If an error occurs during document storage.
+        HTTPException: If another document is stored under the same filename, or an error occurs
+            during document storage.
     """
     logger.info("add_document :: Processing new document storage request")
     logger.debug(f"add_document :: File details - name: {file.filename}, type: {file.content_type}")
     
     try:
-        contents = b""
-        while chunk := await file.read(1024):  # read 1 KB at a time
-            contents += chunk
-        document: InputDocument = InputDocument(content=contents, filename=file.filename, type=file.content_type)
-
-        # Process the document
-        response: StoreDocumentResult = await handler.add_document(document)
+        async with spool_upload(file) as document:
+            # Process the document
+            response: StoreDocumentResult = await handler.add_document(document)
 
         logger.info("add_document :: Document stored successfully")
         logger.debug(f"add_document :: Storage result: {response}")
         return response
-    
+
+    except UploadTooLargeError as e:
+        logger.error(f"add_document :: Upload too large: {str(e)}")
+        raise HTTPException(status_code=413, detail=str(e))
+    except DocumentConflictError as e:
+        logger.error(f"add_document :: Filename conflict: {str(e)}")
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         logger.error(f"add_document :: Validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -98,13 +215,226 @@ async def add_document(file: UploadFile = File(...), handler: DocumentStoreHandl
         raise HTTPException(status_code=500, detail="An error occurred while storing the document")
 
 
+@rag_router.post("/store_documents", response_model=BulkIngestionReport)
+async def add_documents(files: List[UploadFile] = File(...),
+                        replace: bool = QueryParameter(
+                            False, description="Replace the different documents stored under the filenames"),
+                        handler: DocumentStoreHandler = Depends(get_document_store_handler)) -> BulkIngestionReport:
+    """
+    Store several documents in the RAG system, ingesting them concurrently.
+
+    A document that fails does not fail the request; its error is reported with its
+    result, along with the throughput of the run. A document uploaded under the
+    filename of a different stored document is reported as a conflict, unless
+    `replace` is set.
+
+    Args:
+        files (List[UploadFile]): The uploaded files to be stored.
+        replace (bool): Whether each document supersedes a different document stored under its filename.
+        handler (DocumentStoreHandler): The document store handler dependency.
+
+    Returns:
+        BulkIngestionReport: Outcome of each document and throughput of the ingestion.
+
+    Raises:
+        HTTPException: If an upload is rejected or the ingestion cannot run.
+    """
+    logger.info(f"add_documents :: Processing new bulk storage request with {len(files)} documents")
+
+    try:
+        async with AsyncExitStack() as stack:
+            documents = [await stack.enter_async_context(spool_upload(file)) for file in files]
+            report: BulkIngestionReport = await handler.add_documents(documents, replace)
+
+        logger.info(f"add_documents :: Stored {report.succeeded}/{len(report.documents)} documents")
+        return report
+
+    except UploadTooLargeError as e:
+        logger.error(f"add_documents :: Upload too large: {str(e)}")
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        logger.error(f"add_documents :: Validation error: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"add_documents :: Error during bulk document storage: {str(e)}")
+        raise HTTPException(status_code=500, detail="An error occurred while storing the documents")
+
+
+@rag_router.put("/documents/{filename:path}", response_model=StoreDocumentResult)
+async def replace_document(filename: str, file: UploadFile = File(...),
+                           all_versions: bool = QueryParameter(
+                               False, description="Replace every document stored under the filename"),
+                           handler: DocumentStoreHandler = Depends(get_document_store_handler)) -> StoreDocumentResult:
+    """
+    Replace a stored document with a new version.
+
+    The document is identified by the filename of the path, whatever the name of the
+    upload. Only the changed chunks are embedded, and every chunk of the previous
+    version that is not part of the new one is deleted. A filename holding several
+    stored documents, e.g. uploaded before filenames were checked, is rejected unless
+    `all_versions` is set.
+
+    Args:
+        filename (str): Name of the document to replace.
+        file (UploadFile): The uploaded new version of the document.
+        all_versions (bool): Whether to replace every document stored under the filename.
+        handler (DocumentStoreHandler): The document store handler dependency.
+
+    Returns:
+        StoreDocumentResult: Result of the ingestion of the new version.
+
+    Raises:
+        HTTPException: If several documents are stored under the filename, or an error occurs
+            during document replacement.
+    """
+    logger.info(f"replace_document :: Processing replacement request for {filename}")
+
+    try:
+        async with spool_upload(file) as document:
+            response: StoreDocumentResult = await handler.replace_document(
+                document.model_copy(update={"filename": filename}), all_versions)
+
+        logger.info("replace_document :: Document replaced successfully")
+        return response
+
+    except UploadTooLargeError as e:
+        logger.error(f"replace_document :: Upload too large: {str(e)}")
+        raise HTTPException(status_code=413, detail=str(e))
+    except DocumentConflictError as e:
+        logger.error(f"replace_document :: Ambiguous filename: {str(e)}")
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        logger.error(f"replace_document :: Validation error: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"replace_document :: Error during document replacement: {str(e)}")
+        raise HTTPException(status_code=500, detail="An error occurred while replacing the document")
+
+
+@rag_router.delete("/documents/{filename:path}", response_model=DeleteDocumentResult)
+async def delete_document(filename: str,
+                          all_versions: bool = QueryParameter(
+                              False, description="Delete every document stored under the filename"),
+                          handler: DocumentStoreHandler = Depends(get_document_store_handler)) -> DeleteDocumentResult:
+    """
+    Delete every stored chunk of a document.
+
+    A filename holding several stored documents, e.g. uploaded before filenames were
+    checked, is rejected unless `all_versions` is set.
+
+    Args:
+        filename (str): Name of the document to delete.
+        all_versions (bool): Whether to delete every document stored under the filename.
+        handler (DocumentStoreHandler): The document store handler dependency.
+
+    Returns:
+        DeleteDocumentResult: The number of chunks deleted.
+
+    Raises:
+        HTTPException: If the document is unknown, several documents are stored under the filename,
+            or the deletion fails.
+    """
+    logger.info(f"delete_document :: Processing deletion request for {filename}")
+
+    try:
+        result: DeleteDocumentResult = await handler.delete_document(filename, all_versions)
+    except DocumentConflictError as e:
+        logger.error(f"delete_document :: Ambiguous filename: {str(e)}")
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error(f"delete_document :: Error during document deletion: {str(e)}")
+        raise HTTPException(status_code=500, detail="An error occurred while deleting the document")
+
+    if result.deleted_chunks == 0:
+        logger.debug(f"delete_document :: Unknown document {filename}")
+        raise HTTPException(status_code=404, detail=f"Document {filename} not found")
+    logger.info(f"delete_document :: Deleted {result.deleted_chunks} chunks of {filename}")
+    return result
+
+
+@rag_router.post("/jobs", response_model=IngestionJob, status_code=202)
+async def submit_document(file: UploadFile = File(...),
+                          replace: bool = QueryParameter(
+                              False, description="Replace a different document stored under the filename"),
+                          handler: DocumentStoreHandler = Depends(get_document_store_handler),
+                          container: RAGContainer = Depends(get_rag_container)) -> IngestionJob:
+    """
+    Queue a document for ingestion in the background.
+
+    The upload is spooled to the job spool directory and the job is returned immediately;
+    its stage, chunk counters and final result are polled with `GET /rag/jobs/{job_id}`.
+    The spooled file is deleted once the job is finished.
+
+    Args:
+        file (UploadFile): The uploaded file to be stored.
+        replace (bool): Whether the document supersedes a different document stored under its filename.
+        handler (DocumentStoreHandler): The document store handler dependency.
+        container (RAGContainer): The application-scoped RAG dependencies, with the job upload configuration.
+
+    Returns:
+        IngestionJob: The queued job.
+
+    Raises:
+        HTTPException: If the upload is rejected or the ingestion queue is full.
+    """
+    logger.info("submit_document :: Processing new document ingestion job request")
+    logger.debug(f"submit_document :: File details - name: {file.filename}, type: {file.content_type}")
+
+    try:
+        document = await spool_upload_to_disk(file, container.job_upload_config)
+    except UploadTooLargeError as e:
+        logger.error(f"submit_document :: Upload too large: {str(e)}")
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        logger.error(f"submit_document :: Error spooling upload: {str(e)}")
+        raise HTTPException(status_code=500, detail="An error occurred while receiving the document")
+
+    try:
+        job: IngestionJob = await handler.submit_document(document, replace)
+    except IngestionQueueFullError as e:
+        discard_spooled_upload(document)
+        logger.error(f"submit_document :: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    except Exception as e:
+        discard_spooled_upload(document)
+        logger.error(f"submit_document :: Error queuing document: {str(e)}")
+        raise HTTPException(status_code=500, detail="An error occurred while queuing the document")
+
+    logger.info(f"submit_document :: Document queued as job {job.id}")
+    return job
+
+
+@rag_router.get("/jobs/{job_id}", response_model=IngestionJob)
+async def get_job(job_id: UUID, handler: DocumentStoreHandler = Depends(get_document_store_handler)) -> IngestionJob:
+    """
+    Return the status, progress and result of an ingestion job.
+
+    Args:
+        job_id (UUID): Identifier of the job.
+        handler (DocumentStoreHandler): The document store handler dependency.
+
+    Returns:
+        IngestionJob: The current state of the job.
+
+    Raises:
+        HTTPException: If the job is unknown.
+    """
+    job = await handler.get_job(job_id)
+    if job is None:
+        logger.debug(f"get_job :: Unknown job {job_id}")
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
 @rag_router.post("/admin/extract_text", response_model=ExtractedContent)
-async def extract_text(file: UploadFile = File(...)) -> ExtractedContent:
+async def extract_text(file: UploadFile = File(...),
+                       container: RAGContainer = Depends(get_rag_container)) -> ExtractedContent:
     """
     Extract text content from an uploaded document.
 
     Args:
         file (UploadFile): The uploaded file from which to extract text.
+        container (RAGContainer): The application-scoped RAG dependencies.
 
     Returns:
         ExtractedContent: Response containing the extracted text content.
@@ -115,19 +445,17 @@ async def extract_text(file: UploadFile = File(...)) -> ExtractedContent:
     logger.info("extract_text :: Processing new text extraction request")
     logger.debug(f"extract_text :: File details - name: {file.filename}, type: {file.content_type}")
     
-    contents = b""
-    while chunk := await file.read(1024):  # read 1 KB at a time
-        contents += chunk
-    document: InputDocument = InputDocument(content=contents, filename=file.filename, type=file.content_type)
-
-    docling_text_extraction_adapter = DoclingTextExtractionAdapter()
     try:
-        result: ExtractedContent = await docling_text_extraction_adapter.extract_text(document)
+        async with spool_upload(file) as document:
+            result: ExtractedContent = await container.text_extraction.extract_text(document)
 
         logger.info("extract_text :: Text extraction completed successfully")
-        logger.debug(f"extract_text :: Extracted content length: {len(result.content) if result.content else 0}")
+        logger.debug(f"extract_text :: Extracted content length: {len(result.text)}")
         return result
 
+    except UploadTooLargeError as e:
+        logger.error(f"extract_text :: Upload too large: {str(e)}")
+        raise HTTPException(status_code=413, detail=str(e))
     except ValueError as e:
         logger.error(f"extract_text :: Validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -137,12 +465,14 @@ async def extract_text(file: UploadFile = File(...)) -> ExtractedContent:
 
 
 @rag_router.post("/admin/chunk_text", response_model=List[DocumentRetrieval])
-async def chunk_text(content: ExtractedContent) -> list[DocumentRetrieval]:
+async def chunk_text(content: ExtractedContent,
+                     container: RAGContainer = Depends(get_rag_container)) -> list[DocumentRetrieval]:
     """
     Chunk the provided text into smaller segments.
 
     Args:
         content (ExtractedContent): The text content to be chunked.
+        container (RAGContainer): The application-scoped RAG dependencies.
 
     Returns:
         List[DocumentRetrieval]: List of chunked text segments.
@@ -154,8 +484,7 @@ async def chunk_text(content: ExtractedContent) -> list[DocumentRetrieval]:
     logger.debug(f"chunk_text :: Input content length: {len(content.content) if content.content else 0}")
 
     try:
-        docling_text_chunking_adapter: TextChunkingPort = DoclingTextChunkingAdapter()
-        result: List[DocumentRetrieval] = await docling_text_chunking_adapter.chunk_text(content)
+        result: List[DocumentRetrieval] = await container.text_chunking.chunk_text(content)
 
         logger.info("chunk_text :: Text chunking completed successfully")
         logger.debug(f"chunk_text :: Generated {len(result)} chunks")
@@ -170,12 +499,14 @@ async def chunk_text(content: ExtractedContent) -> list[DocumentRetrieval]:
 
 
 @rag_router.post("/admin/chunk_embed", response_model=List[DocumentRetrievalVector])
-async def embed_chunk(documents: list[DocumentRetrieval]) -> list[DocumentRetrievalVector]:
+async def embed_chunk(documents: list[DocumentRetrieval],
+                      container: RAGContainer = Depends(get_rag_container)) -> list[DocumentRetrievalVector]:
     """
     Generate embeddings for document chunks.
 
     Args:
         documents (List[DocumentRetrieval]): List of document chunks to embed.
+        container (RAGContainer): The application-scoped RAG dependencies.
 
     Returns:
         List[DocumentRetrievalVector]: List of document chunks with embeddings.
@@ -187,12 +518,12 @@ async def embed_chunk(documents: list[DocumentRetrieval]) -> list[DocumentRetrie
     logger.debug(f"embed_chunk :: Number of documents to embed: {len(documents)}")
     
     try:
-        embedding = LiteLLMEmbeddingAdapter()
-        docs = []
-        for doc in documents:
-            vector: Embedding = await embedding.embed_text(doc.content)
-            doc_vector: DocumentRetrievalVector = DocumentRetrievalVector(**doc.model_dump(), vector=vector.vector)
-            docs.append(doc_vector)
+        vectors: List[Embedding] = await container.ingestion_embedding_adapter.embed_texts(
+            [doc.content for doc in documents])
+        docs = [
+            DocumentRetrievalVector(**doc.model_dump(), vector=vector.vector)
+            for doc, vector in zip(documents, vectors)
+        ]
         
         logger.info("embed_chunk :: Embedding generation completed successfully")
         logger.debug(f"embed_chunk :: Generated embeddings for {len(docs)} documents")
@@ -207,12 +538,14 @@ async def embed_chunk(documents: list[DocumentRetrieval]) -> list[DocumentRetrie
 
 
 @rag_router.post("/admin/upsert_documents", response_model=StoreDocumentResult)
-async def upsert_documents(documents: List[DocumentRetrievalVector]) -> StoreDocumentResult:
+async def upsert_documents(documents: List[DocumentRetrievalVector],
+                           container: RAGContainer = Depends(get_rag_container)) -> StoreDocumentResult:
     """
     Upsert documents with embeddings into the vector store.
 
     Args:
         documents (List[DocumentRetrievalVector]): List of documents with embeddings to upsert.
+        container (RAGContainer): The application-scoped RAG dependencies.
 
     Returns:
         StoreDocumentResult: Result of the upsert operation.
@@ -224,9 +557,11 @@ async def upsert_documents(documents: List[DocumentRetrievalVector]) -> StoreDoc
     logger.debug(f"upsert_documents :: Number of documents to upsert: {len(documents)}")
     
     try:
-        vector_store = QdrantVectorStoreAdapter()
-        result: StoreDocumentResult = await vector_store.upsert(documents)
-        
+        result: StoreDocumentResult = await container.vector_store.upsert(documents)
+
+        if container.semantic_cache is not None:
+            await container.semantic_cache.invalidate()
+
         logger.info("upsert_documents :: Document upsert completed successfully")
         logger.debug(f"upsert_documents :: Upsert result: {result}")
         return result
@@ -236,3 +571,56 @@ async def upsert_documents(documents: List[DocumentRetrievalVector]) -> StoreDoc
     except Exception as e:
         logger.error(f"upsert_documents :: Error during upsert operation: {str(e)}")
         raise HTTPException(status_code=500, detail="An error occurred while upserting documents")
+
+
+@rag_router.get("/admin/storage", response_model=CollectionStorage)
+async def get_storage(container: RAGContainer = Depends(get_rag_container)) -> CollectionStorage:
+    """
+    Describe where the vector collection stores its vectors, payloads and HNSW graph.
+
+    Args:
+        container (RAGContainer): The application-scoped RAG dependencies.
+
+    Returns:
+        CollectionStorage: The storage layout and tier of the collection.
+
+    Raises:
+        HTTPException: If the collection cannot be read.
+    """
+    logger.info("get_storage :: Processing new storage request")
+
+    try:
+        return await container.vector_store.get_storage()
+    except Exception as e:
+        logger.error(f"get_storage :: Error reading the collection storage: {str(e)}")
+        raise HTTPException(status_code=500, detail="An error occurred while reading the collection storage")
+
+
+@rag_router.post("/admin/storage_tier", response_model=CollectionStorage)
+async def set_storage_tier(tier: StorageTier,
+                           container: RAGContainer = Depends(get_rag_container)) -> CollectionStorage:
+    """
+    Move the vector collection to a storage tier: hot (in RAM) or warm (memory-mapped from disk).
+
+    The move completes in the background: the collection stays searchable and reports
+    `optimizing` until its data is rewritten, which can be polled on `/rag/admin/storage`.
+
+    Args:
+        tier (StorageTier): The target tier.
+        container (RAGContainer): The application-scoped RAG dependencies.
+
+    Returns:
+        CollectionStorage: The storage layout of the collection after the change was accepted.
+
+    Raises:
+        HTTPException: If the collection cannot be updated.
+    """
+    logger.info(f"set_storage_tier :: Processing new storage tier request (tier={tier.value})")
+
+    try:
+        result = await container.vector_store.set_storage_tier(tier)
+        logger.info(f"set_storage_tier :: Storage tier change accepted (optimizing={result.optimizing})")
+        return result
+    except Exception as e:
+        logger.error(f"set_storage_tier :: Error changing the storage tier: {str(e)}")
+        raise HTTPException(status_code=500, detail="An error occurred while changing the collection storage tier")
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, BinaryIO, Optional
+
+from fastapi import UploadFile
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from src.components.rag.domain.value_objects import InputDocument
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class UploadConfig(BaseSettings):
+    """Configuration of document uploads.
+
+    Attributes:
+        max_size_bytes: Maximum size of an uploaded document.
+        spool_dir: Directory where uploads are spooled. None uses the system temporary directory.
+        copy_chunk_bytes: Size of the chunks copied from the request body to the spool file.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="UPLOAD_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra='ignore',
+    )
+
+    max_size_bytes: int = Field(default=100 * 1024 * 1024, gt=0, description="Maximum size of an uploaded document")
+    spool_dir: Optional[str] = Field(default=None, description="Directory where uploads are spooled")
+    copy_chunk_bytes: int = Field(default=1024 * 1024, gt=0,
+                                  description="Size of the chunks copied from the request body to the spool file")
+
+
+default_upload_settings = UploadConfig()
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an uploaded document exceeds the configured maximum size."""
+
+
+def _copy_capped(source: BinaryIO, destination: BinaryIO, max_size_bytes: int, chunk_bytes: int) -> int:
+    """Copy a file object chunk by chunk, failing once the size cap is exceeded.
+
+    Args:
+        source: File object to read from.
+        destination: File object to write to.
+        max_size_bytes: Maximum number of bytes to copy.
+        chunk_bytes: Size of each chunk.
+
+    Returns:
+        int: Number of bytes copied.
+
+    Raises:
+        UploadTooLargeError: If the source is larger than `max_size_bytes`.
+    """
+    size = 0
+    while chunk := source.read(chunk_bytes):
+        size += len(chunk)
+        if size > max_size_bytes:
+            raise UploadTooLargeError(f"Document exceeds the maximum size of {max_size_bytes} bytes")
+        destination.write(chunk)
+    return size
+
+
+async def spool_upload_to_disk(file: UploadFile, config: UploadConfig = default_upload_settings) -> InputDocument:
+    """Spool an uploaded file to a local path and return an InputDocument referencing it.
+
+    The upload is copied once, in fixed-size chunks and off the event loop, into a
+    private temporary directory under its original name, so that extraction backends
+    can open it by path and detect its format. The caller owns the spooled file and
+    must remove it with `discard_spooled_upload`.
+
+    Args:
+        file (UploadFile): The uploaded file.
+        config (UploadConfig): Upload configuration.
+
+    Returns:
+        InputDocument: The document, referencing the spooled file by path.
+
+    Raises:
+        UploadTooLargeError: If the upload exceeds `config.max_size_bytes`.
+    """
+    if file.size is not None and file.size > config.max_size_bytes:
+        raise UploadTooLargeError(f"Document exceeds the maximum size of {config.max_size_bytes} bytes")
+
+    if config.spool_dir:
+        os.makedirs(config.spool_dir, exist_ok=True)
+    spool_dir = tempfile.mkdtemp(prefix="upload-", dir=config.spool_dir or None)
+    try:
+        filename = os.path.basename(file.filename or "") or "document"
+        path = os.path.join(spool_dir, filename)
+
+        def spool() -> int:
+            file.file.seek(0)
+            with open(path, "wb") as destination:
+                return _copy_capped(file.file, destination, config.max_size_bytes, config.copy_chunk_bytes)
+
+        size = await asyncio.to_thread(spool)
+        logger.debug(f"spool_upload_to_disk :: Spooled {size} bytes of {filename} to {path}")
+
+        return InputDocument(path=path, filename=file.filename or filename, type=file.content_type or "application/octet-stream")
+    except BaseException:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+        raise
+
+
+def discard_spooled_upload(document: InputDocument, spool_dir: Optional[str] = None) -> None:
+    """Remove the temporary directory of a document spooled by `spool_upload_to_disk`.
+
+    Args:
+        document (InputDocument): The spooled document.
+        spool_dir (Optional[str]): If set, documents that were not spooled under this directory are left alone.
+    """
+    if document.path is None:
+        return
+    directory = os.path.dirname(os.path.abspath(document.path))
+    if spool_dir is not None and os.path.dirname(directory) != os.path.abspath(spool_dir):
+        return
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@asynccontextmanager
+async def spool_upload(file: UploadFile, config: UploadConfig = default_upload_settings) -> AsyncIterator[InputDocument]:
+    """Spool an uploaded file to a local path for the duration of the context.
+
+    See `spool_upload_to_disk`. The spooled file is removed on exit.
+
+    Args:
+        file (UploadFile): The uploaded file.
+        config (UploadConfig): Upload configuration.
+
+    Yields:
+        InputDocument: The document, referencing the spooled file by path.
+
+    Raises:
+        UploadTooLargeError: If the upload exceeds `config.max_size_bytes`.
+    """
+    document = await spool_upload_to_disk(file, config)
+    try:
+        yield document
+    finally:
+        discard_spooled_upload(document)
@@ -1,11 +1,16 @@
 """Base class for Qdrant vector database interactions."""
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Awaitable, Callable, TypeVar
 
+import grpc
 from src.components.rag.application.ports.driven import EmbeddingPort
 from src.components.rag.infrastructure.persistence.repositories_settings import repo_settings
 from qdrant_client import AsyncQdrantClient
 from qdrant_client import models
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+T = TypeVar("T")
 
 
 class QdrantVectorBase:
@@ -13,14 +18,54 @@ class QdrantVectorBase:
     
     This class provides common functionality for interacting with a Qdrant vector database,
     including client initialization, collection management, and base operations.
+
+    A client can be injected so that several adapters share one gRPC channel; the
+    owner of an injected client is responsible for closing it. The collection
+    parameters can be shared the same way, so that a change made through one adapter,
+    e.g. of the storage tier, applies to the collections the others create.
+
+    The existence of the collection is verified once, on first use, and then
+    remembered. It is checked again only if an operation reports the collection
+    as missing (e.g. after it was deleted).
+
+    The payload fields the adapters filter on are indexed at the same time, so that
+    Qdrant resolves the filters from an index instead of scanning the payloads.
+
+    A new collection is created with the configured quantization profile: `scalar`
+    stores each dimension as int8 (4x smaller), `binary` as one bit (32x smaller,
+    for high-dimensional embeddings) and `product` as product codes (up to 64x).
+    The quantized vectors are searched first, and the best candidates rescored with
+    the original vectors. An existing collection keeps the profile it was created with.
+    Its HNSW graph is built with `hnsw_m` edges per node and `hnsw_ef_construct`
+    candidates, trading memory and indexing time for recall.
+
+    The storage tier sets where a new collection keeps its data: `hot` holds the
+    vectors, payloads and HNSW graph in RAM, `warm` memory-maps them from disk and
+    leaves their caching to the OS, for rarely queried collections. Quantized vectors
+    stay in RAM in both tiers unless `quantization_always_ram` is disabled.
     """
 
+    # Payload fields filtered on by the adapters, with their index type
+    payload_indexes: Dict[str, models.PayloadSchemaType] = {
+        "metadata.document_hash": models.PayloadSchemaType.KEYWORD,
+        "metadata.document_id": models.PayloadSchemaType.KEYWORD,
+        "metadata.filename": models.PayloadSchemaType.KEYWORD,
+        "metadata.document_type": models.PayloadSchemaType.KEYWORD,
+        "metadata.ingested_at": models.PayloadSchemaType.DATETIME,
+    }
+
     def __init__(self,
                  fallback_dimension: int = repo_settings.fallback_dimension,
                  collection_name: str = repo_settings.collection_name,
                  host: str = repo_settings.base_url,
                  port: int = repo_settings.grpc_port,
-                 distance: models.Distance = models.Distance.COSINE
+                 distance: models.Distance = models.Distance.COSINE,
+                 client: Optional[AsyncQdrantClient] = None,
+                 quantization: str = repo_settings.quantization,
+                 storage_tier: str = repo_settings.storage_tier,
+                 hnsw_m: Optional[int] = repo_settings.hnsw_m,
+                 hnsw_ef_construct: Optional[int] = repo_settings.hnsw_ef_construct,
+                 collection_parameters: Optional[Dict[str, Any]] = None,
                  ):
         """Initialize the Qdrant Vector Base.
         
@@ -30,27 +75,168 @@ class QdrantVectorBase:
             host: Hostname of the Qdrant server.
             port: gRPC port of the Qdrant server.
             distance: Distance metric to use for vector similarity.
+            client: Shared Qdrant client. If None, a dedicated client is created from host and port.
+            quantization: Quantization profile of a new collection: none, scalar, binary or product.
+            storage_tier: Storage tier of a new collection: hot or warm. The on-disk overrides
+                of the repository settings apply on top of it.
+            hnsw_m: Edges per node of the HNSW graph of a new collection. If None, Qdrant's default applies.
+            hnsw_ef_construct: Candidates considered while building the HNSW graph of a new collection.
+                If None, Qdrant's default applies.
+            collection_parameters: Parameters of the collection of another adapter, shared with it. If None,
+                they are built from the arguments above, otherwise those are ignored.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info(
             f"QdrantVectorBase :: Initializing with host={host}, port={port}, collection={collection_name}")
 
-        self.client = AsyncQdrantClient(
+        self.client = client if client is not None else self.create_client(host=host, port=port)
+        if collection_parameters is None:
+            collection_parameters = {
+                "name": collection_name,
+                "distance": distance,
+                "vector_size": fallback_dimension,
+                "quantization": quantization,
+                "storage": self.storage_layout(storage_tier),
+                "hnsw": {"m": hnsw_m, "ef_construct": hnsw_ef_construct},
+            }
+            # Fail at startup rather than on the first collection creation
+            self.quantization_config(quantization)
+        self.collection_parameters = collection_parameters
+
+        self._collection_ready = False
+        self._collection_lock = asyncio.Lock()
+
+        self.logger.debug(f"QdrantVectorBase :: Collection parameters: {self.collection_parameters}")
+
+    @staticmethod
+    def create_client(host: str = repo_settings.base_url, port: int = repo_settings.grpc_port) -> AsyncQdrantClient:
+        """Create a Qdrant client talking gRPC to the given server.
+
+        Args:
+            host: Hostname of the Qdrant server.
+            port: gRPC port of the Qdrant server.
+
+        Returns:
+            AsyncQdrantClient: A new client, with its own gRPC channel.
+        """
+        return AsyncQdrantClient(
             host=host,
             grpc_port=port,
             prefer_grpc=True,
         )
-        self.collection_parameters = {
-            "name": collection_name,
-            "distance": distance,
-            "vector_size": fallback_dimension
+
+    @staticmethod
+    def quantization_config(profile: str,
+                            always_ram: bool = repo_settings.quantization_always_ram,
+                            scalar_quantile: float = repo_settings.scalar_quantile,
+                            product_compression: str = repo_settings.product_compression,
+                            ) -> Optional[models.QuantizationConfig]:
+        """Build the quantization configuration of a collection from a profile.
+
+        Args:
+            profile: Quantization profile: none, scalar, binary or product.
+            always_ram: Whether the quantized vectors stay in RAM.
+            scalar_quantile: Share of the values kept in the int8 range by scalar quantization.
+            product_compression: Compression ratio of product quantization, e.g. x16.
+
+        Returns:
+            Optional[models.QuantizationConfig]: The configuration, or None for the none profile.
+
+        Raises:
+            ValueError: If the profile is unknown.
+        """
+        if profile == "none":
+            return None
+        if profile == "scalar":
+            return models.ScalarQuantization(scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8, quantile=scalar_quantile, always_ram=always_ram))
+        if profile == "binary":
+            return models.BinaryQuantization(binary=models.BinaryQuantizationConfig(always_ram=always_ram))
+        if profile == "product":
+            return models.ProductQuantization(product=models.ProductQuantizationConfig(
+                compression=models.CompressionRatio(product_compression), always_ram=always_ram))
+        raise ValueError(f"Unknown quantization profile '{profile}', expected none, scalar, binary or product")
+
+    @staticmethod
+    def storage_layout(tier: str,
+                       vectors_on_disk: Optional[bool] = repo_settings.vectors_on_disk,
+                       payload_on_disk: Optional[bool] = repo_settings.payload_on_disk,
+                       hnsw_on_disk: Optional[bool] = repo_settings.hnsw_on_disk,
+                       ) -> Dict[str, bool]:
+        """Resolve where the data of a collection is stored from a tier and per-structure overrides.
+
+        Args:
+            tier: Storage tier: hot (in RAM) or warm (memory-mapped from disk).
+            vectors_on_disk: Whether the original vectors are on disk. If None, the tier decides.
+            payload_on_disk: Whether the payloads are on disk. If None, the tier decides.
+            hnsw_on_disk: Whether the HNSW graph is on disk. If None, the tier decides.
+
+        Returns:
+            Dict[str, bool]: The `vectors_on_disk`, `payload_on_disk` and `hnsw_on_disk` flags.
+
+        Raises:
+            ValueError: If the tier is unknown.
+        """
+        if tier not in ("hot", "warm"):
+            raise ValueError(f"Unknown storage tier '{tier}', expected hot or warm")
+        on_disk = tier == "warm"
+        return {
+            "vectors_on_disk": on_disk if vectors_on_disk is None else vectors_on_disk,
+            "payload_on_disk": on_disk if payload_on_disk is None else payload_on_disk,
+            "hnsw_on_disk": on_disk if hnsw_on_disk is None else hnsw_on_disk,
         }
 
-        self.logger.debug(f"QdrantVectorBase :: Collection parameters: {self.collection_parameters}")
+    @staticmethod
+    def _is_collection_not_found(error: Exception) -> bool:
+        """Return True if the error reports a missing collection (gRPC NOT_FOUND or HTTP 404)."""
+        if isinstance(error, grpc.aio.AioRpcError):
+            return error.code() == grpc.StatusCode.NOT_FOUND
+        return isinstance(error, UnexpectedResponse) and error.status_code == 404
 
     async def _ensure_collection_exists(self) -> None:
         """Ensure the collection exists, create it if it doesn't.
-        
+
+        The check runs once; later calls return immediately without any RPC.
+        Concurrent first calls are serialized so that only one of them checks.
+
+        Raises:
+            Exception: If there's an error creating or checking the collection.
+        """
+        if self._collection_ready:
+            return
+        async with self._collection_lock:
+            if self._collection_ready:
+                return
+            await self._check_or_create_collection()
+            self._collection_ready = True
+
+    async def _run_on_collection(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run an operation on the collection, ensuring it exists.
+
+        If the operation fails because the collection is missing, its existence is
+        checked again (re-creating it if needed) and the operation is retried once.
+
+        Args:
+            operation: Coroutine function performing the Qdrant call.
+
+        Returns:
+            T: The result of the operation.
+        """
+        await self._ensure_collection_exists()
+        try:
+            return await operation()
+        except Exception as e:
+            if not self._is_collection_not_found(e):
+                raise
+            self.logger.warning(f"_run_on_collection :: Collection '{self.collection_parameters['name']}' not found, "
+                                f"checking it again")
+            self._collection_ready = False
+            await self._ensure_collection_exists()
+            return await operation()
+
+    async def _check_or_create_collection(self) -> None:
+        """Check whether the collection exists and create it if it doesn't.
+
         Raises:
             Exception: If there's an error creating or checking the collection.
         """
@@ -62,18 +248,35 @@ class QdrantVectorBase:
             collection_exists = await self.client.collection_exists(collection_name)
 
             if not collection_exists:
-                self.logger.info(f"QdrantVectorBase :: Collection '{collection_name}' does not exist, creating it")
+                storage = self.collection_parameters['storage']
+                self.logger.info(f"QdrantVectorBase :: Collection '{collection_name}' does not exist, creating it "
+                                 f"(quantization={self.collection_parameters['quantization']}, storage={storage}, "
+                                 f"hnsw={self.collection_parameters['hnsw']})")
                 # Collection doesn't exist, create it
                 await self.client.create_collection(
                     collection_name=self.collection_parameters['name'],
                     vectors_config=models.VectorParams(
                         size=self.collection_parameters['vector_size'],
-                        distance=self.collection_parameters['distance']
+                        distance=self.collection_parameters['distance'],
+                        on_disk=storage['vectors_on_disk'],
                     ),
+                    on_disk_payload=storage['payload_on_disk'],
+                    hnsw_config=models.HnswConfigDiff(on_disk=storage['hnsw_on_disk'],
+                                                      **self.collection_parameters['hnsw']),
+                    quantization_config=self.quantization_config(self.collection_parameters['quantization']),
                 )
                 self.logger.info(f"QdrantVectorBase :: Successfully created collection '{collection_name}'")
             else:
                 self.logger.debug(f"QdrantVectorBase :: Collection '{collection_name}' already exists")
+
+            # Creating an existing index is a no-op, which also indexes collections created before it
+            for field_name, field_schema in self.payload_indexes.items():
+                await self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                )
+            self.logger.debug(f"QdrantVectorBase :: Payload indexes ready on {list(self.payload_indexes)}")
         except Exception as e:
             self.logger.error(f"QdrantVectorBase :: Failed to ensure collection exists: {e}")
             raise
\ No newline at end of file
@@ -1,35 +1,105 @@
 """Qdrant implementation of the VectorRetrieverPort."""
 import logging
-from typing import List
+from typing import List, Optional
+
+from qdrant_client import models
 
 from src.components.rag.application.ports.driven import VectorRetrieverPort, EmbeddingPort
-from src.components.rag.domain.value_objects import DocumentRetrieval
+from src.components.rag.domain.value_objects import DocumentRetrieval, SearchFilter, SearchOptions
 from src.components.rag.infrastructure.persistence.qdrant_vector_base import QdrantVectorBase
+from src.components.rag.infrastructure.persistence.repositories_settings import repo_settings
 
 
 class QdrantVectorRetrieverAdapter(VectorRetrieverPort, QdrantVectorBase):
     """Implementation of VectorRetrieverPort using Qdrant.
     
     This adapter handles retrieving vectorized documents from the Qdrant vector database.
+
+    The recall and latency of a search are tuned by its `SearchOptions`, whose unset
+    fields fall back to the defaults of the adapter, then to those of Qdrant: `hnsw_ef`
+    sizes the candidate list of the HNSW traversal, `exact` bypasses the index, and
+    on a quantized collection Qdrant fetches `top_k * oversampling` candidates with the
+    quantized vectors and, if `rescore` is set, reorders them with the original vectors.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self,
+                 search_options: SearchOptions = SearchOptions(
+                     hnsw_ef=repo_settings.search_hnsw_ef,
+                     exact=repo_settings.search_exact,
+                     score_threshold=repo_settings.search_score_threshold,
+                     indexed_only=repo_settings.search_indexed_only,
+                     oversampling=repo_settings.search_oversampling,
+                     rescore=repo_settings.search_rescore,
+                 ),
+                 **kwargs):
         """Initialize the Qdrant Vector Retriever Adapter.
         
         Args:
+            search_options: Default options of the searches. Unset options use the Qdrant defaults.
             **kwargs: Additional arguments to pass to the QdrantVectorBase constructor.
         """
         super().__init__(**kwargs)
+        self.search_options = search_options
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.info("QdrantVectorRetrieverAdapter :: Initialized")
+        self.logger.info(f"QdrantVectorRetrieverAdapter :: Initialized (search_options="
+                         f"{search_options.model_dump(exclude_none=True)})")
+
+    @staticmethod
+    def _search_params(options: SearchOptions) -> Optional[models.SearchParams]:
+        """Build the Qdrant search parameters of a query.
+
+        Args:
+            options: Options of the query, merged with the adapter defaults.
+
+        Returns:
+            Optional[models.SearchParams]: The parameters, or None to use the server defaults.
+        """
+        params = {"hnsw_ef": options.hnsw_ef, "exact": options.exact, "indexed_only": options.indexed_only}
+        if options.oversampling is not None or options.rescore is not None:
+            params["quantization"] = models.QuantizationSearchParams(oversampling=options.oversampling,
+                                                                     rescore=options.rescore)
+        # Unset parameters are left out, for Qdrant to apply its defaults
+        params = {name: value for name, value in params.items() if value is not None}
+        return models.SearchParams(**params) if params else None
+
+    @staticmethod
+    def _to_qdrant_filter(search_filter: Optional[SearchFilter]) -> Optional[models.Filter]:
+        """Translate a search filter into a Qdrant filter on the indexed metadata fields.
 
-    async def search(self, query: list[float], top_k: int = 5, *args, **kwargs) -> List[DocumentRetrieval]:
+        Args:
+            search_filter: The filter to translate.
+
+        Returns:
+            Optional[models.Filter]: The Qdrant filter, or None if there is nothing to filter on.
+        """
+        if search_filter is None or search_filter.is_empty:
+            return None
+        conditions = []
+        if search_filter.filenames:
+            conditions.append(models.FieldCondition(key="metadata.filename",
+                                                    match=models.MatchAny(any=search_filter.filenames)))
+        if search_filter.document_types:
+            conditions.append(models.FieldCondition(key="metadata.document_type",
+                                                    match=models.MatchAny(any=search_filter.document_types)))
+        if search_filter.ingested_after is not None or search_filter.ingested_before is not None:
+            conditions.append(models.FieldCondition(key="metadata.ingested_at", range=models.DatetimeRange(
+                gte=search_filter.ingested_after, lte=search_filter.ingested_before)))
+        return models.Filter(must=conditions)
+
+    async def search(self, query: list[float], top_k: int = 5, *args, search_filter: Optional[SearchFilter] = None,
+                     options: Optional[SearchOptions] = None, **kwargs) -> List[DocumentRetrieval]:
         """Search for the most relevant documents given a query vector.
+
+        The filter is applied by Qdrant while traversing the index, on payload indexes
+        created with the collection, so `top_k` results are returned from the matching
+        chunks rather than filtered out of the global top `top_k`.
         
         Args:
             query: Vector representation of the query
             top_k: Maximum number of results to return
             *args: Additional positional arguments
+            search_filter: Restricts the search to the chunks whose metadata match
+            options: Recall and latency trade-off of the search, overriding the adapter defaults
             **kwargs: Additional keyword arguments
             
         Returns:
@@ -38,18 +108,23 @@ class QdrantVectorRetrieverAdapter(VectorRetrieverPort, QdrantVectorBase):
         Raises:
             Exception: If there's an error during the search operation
         """
-        self.logger.info(f"QdrantVectorRetrieverAdapter :: Searching for documents (top_k={top_k})")
-        await self._ensure_collection_exists()
-
+        query_filter = self._to_qdrant_filter(search_filter)
+        options = options.with_defaults(self.search_options) if options is not None else self.search_options
+        search_params = self._search_params(options)
+        self.logger.info(f"QdrantVectorRetrieverAdapter :: Searching for documents (top_k={top_k}, "
+                         f"filtered={query_filter is not None}, options={options.model_dump(exclude_none=True)})")
         try:
             # Perform search using Qdrant
-            search_result = await self.client.search(
+            search_result = (await self._run_on_collection(lambda: self.client.query_points(
                 collection_name=self.collection_parameters['name'],
-                query_vector=query,
+                query=query,
+                query_filter=query_filter,
+                search_params=search_params,
+                score_threshold=options.score_threshold,
                 limit=top_k,
                 with_payload=True,
                 with_vectors=False
-            )
+            ))).points
 
         except Exception as e:
             self.logger.error(f"search :: Error during search operation: {e}")
@@ -1,13 +1,20 @@
 """Qdrant implementation of the VectorStorePort."""
+import asyncio
 import logging
 import time
-from typing import List
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+from uuid import UUID
 
 from src.components.rag.application.ports.driven import VectorStorePort, EmbeddingPort
-from src.components.rag.domain.value_objects import DocumentRetrievalVector, StoreDocumentResult
+from src.components.rag.domain.value_objects import DocumentRetrieval, DocumentRetrievalVector, StoreDocumentResult, \
+    CollectionStorage, StorageTier
 from src.components.rag.domain.value_objects.input_document import StoreDocumentStatus
 from src.components.rag.infrastructure.persistence.qdrant_vector_base import QdrantVectorBase
-from qdrant_client.models import PointStruct
+from src.components.rag.infrastructure.persistence.repositories_settings import repo_settings
+from qdrant_client.models import CollectionParamsDiff, CollectionStatus, FieldCondition, Filter, FilterSelector, \
+    HasIdCondition, HnswConfigDiff, IsEmptyCondition, MatchAny, MatchValue, PayloadField, PointIdsList, PointStruct, \
+    SetPayload, SetPayloadOperation, UpdateStatus, VectorParamsDiff
 
 
 class QdrantVectorStoreAdapter(VectorStorePort, QdrantVectorBase):
@@ -16,62 +23,432 @@ class QdrantVectorStoreAdapter(VectorStorePort, QdrantVectorBase):
     This adapter handles storing vectorized documents in the Qdrant vector database.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self,
+                 batch_size: int = repo_settings.upsert_batch_size,
+                 max_concurrency: int = repo_settings.upsert_max_concurrency,
+                 wait: bool = repo_settings.upsert_wait,
+                 confirm_timeout: float = repo_settings.upsert_confirm_timeout,
+                 **kwargs):
         """Initialize the Qdrant Vector Store Adapter.
         
         Args:
-            embedding_port: The embedding port instance for text vectorization.
+            batch_size: Number of points sent in a single upsert request.
+            max_concurrency: Maximum number of upsert requests in flight for one call.
+            wait: Whether Qdrant should apply the points before answering. With False,
+                Qdrant answers as soon as the batch is acknowledged, and the points are
+                confirmed once all the batches are sent (fire-and-confirm).
+            confirm_timeout: Seconds to wait for acknowledged points to be applied.
             **kwargs: Additional arguments to pass to the QdrantVectorBase constructor.
         """
         super().__init__(**kwargs)
-        self.logger.info("QdrantVectorStoreAdapter :: Initialized")
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.wait = wait
+        self.confirm_timeout = confirm_timeout
+        self.logger.info(f"QdrantVectorStoreAdapter :: Initialized (batch_size={self.batch_size}, "
+                         f"max_concurrency={self.max_concurrency}, wait={self.wait})")
 
-    async def upsert(self, vector_documents: List[DocumentRetrievalVector]) -> StoreDocumentResult:
+    async def _upsert_batch(self, points: List[PointStruct], semaphore: asyncio.Semaphore,
+                            on_batch: Optional[Callable[[int], Awaitable[None]]] = None) -> UpdateStatus:
+        """Send one batch of points, bounded by the semaphore.
+
+        Args:
+            points: The points of the batch.
+            semaphore: Semaphore bounding the number of requests in flight.
+            on_batch: Called with the number of points of the batch once applied.
+
+        Returns:
+            UpdateStatus: `completed` when applied, `acknowledged` when `wait` is False.
+        """
+        async with semaphore:
+            result = await self._run_on_collection(lambda: self.client.upsert(
+                collection_name=self.collection_parameters['name'],
+                points=points,
+                wait=self.wait
+            ))
+        # Acknowledged points are reported once confirmed
+        if on_batch is not None and result.status == UpdateStatus.COMPLETED:
+            await on_batch(len(points))
+        return result.status
+
+    async def _confirm_applied(self, points: List[PointStruct]) -> int:
+        """Wait until acknowledged points are applied, counting them until they are all found.
+
+        A point counts once it is stored with the `metadata.document_hash` it was sent
+        with, if any, so that the previous version of an updated chunk is not taken for
+        the new one. The points are counted by content hash, and counted again with a
+        growing delay until they are all applied or `confirm_timeout` has elapsed.
+
+        Args:
+            points: The acknowledged points.
+
+        Returns:
+            int: Number of points still not applied when giving up, 0 once all are confirmed.
+        """
+        unconfirmed: Dict[Optional[str], List[str]] = defaultdict(list)
+        for point in points:
+            unconfirmed[(point.payload.get("metadata") or {}).get("document_hash")].append(point.id)
+
+        deadline = time.monotonic() + self.confirm_timeout
+        delay = 0.05
+        while True:
+            for document_hash, point_ids in list(unconfirmed.items()):
+                conditions = [HasIdCondition(has_id=point_ids)]
+                if document_hash is not None:
+                    conditions.append(FieldCondition(key="metadata.document_hash",
+                                                     match=MatchValue(value=document_hash)))
+                applied = (await self._run_on_collection(lambda: self.client.count(
+                    collection_name=self.collection_parameters['name'],
+                    count_filter=Filter(must=conditions),
+                    exact=True
+                ))).count
+                if applied >= len(point_ids):
+                    del unconfirmed[document_hash]
+
+            missing = sum(len(point_ids) for point_ids in unconfirmed.values())
+            if not missing or time.monotonic() + delay > deadline:
+                return missing
+            self.logger.debug(f"_confirm_applied :: {missing} points not applied yet, counting again in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+    async def upsert(self, vector_documents: List[DocumentRetrievalVector],
+                     on_batch: Optional[Callable[[int], Awaitable[None]]] = None) -> StoreDocumentResult:
         """Insert or update documents in the vector storage.
+
+        Points are sent in batches of `batch_size`, with up to `max_concurrency` batches
+        in flight. A failed batch does not stop the others: its points are counted in
+        `failed_chunks` and the status is PARTIAL (or ERROR if every batch failed).
+        Without `wait`, the points of the acknowledged batches are only counted as
+        ingested once confirmed by `_confirm_applied`; those still not applied after
+        `confirm_timeout` are counted as failed.
         
         Args:
             vector_documents: List of documents with their vectors
+            on_batch: Called with the number of points of each batch once applied, and of the
+                acknowledged batches together once confirmed.
             
         Returns:
-            InputDocumentResult: Result object containing IDs of successfully inserted documents
-            
-        Raises:
-            Exception: If there's an error during the upsert operation
+            StoreDocumentResult: Result with the number of ingested and failed chunks
         """
         self.logger.info(f"upsert :: Upserting {len(vector_documents)} documents")
+        start_time = time.time()
 
-        try:
-            await self._ensure_collection_exists()  # Check if collection exists before upserting
-            start_time = time.time()
-            points = [
-                PointStruct(
-                    id=str(doc.id),
-                    vector=doc.vector,
-                    payload={
-                        "content": doc.content,
-                        "metadata": doc.metadata or {}
-                    }
-                )
-                for doc in vector_documents
-            ]
-            self.logger.debug(f"QdrantVectorStoreAdapter :: Created {len(points)} points for upsert")
-            await self.client.upsert(
-                collection_name=self.collection_parameters['name'],
-                points=points
+        points = [
+            PointStruct(
+                id=str(doc.id),
+                vector=doc.vector,
+                payload={
+                    "content": doc.content,
+                    "metadata": doc.metadata or {}
+                }
             )
+            for doc in vector_documents
+        ]
+        batches = [points[i:i + self.batch_size] for i in range(0, len(points), self.batch_size)]
+        self.logger.debug(f"upsert :: Created {len(points)} points in {len(batches)} batches")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        outcomes = await asyncio.gather(*(self._upsert_batch(batch, semaphore, on_batch) for batch in batches),
+                                        return_exceptions=True)
 
-            self.logger.info(f"QdrantVectorStoreAdapter :: Successfully upserted {len(points)} documents")
+        failed_chunks = 0
+        errors = []
+        acknowledged: List[PointStruct] = []
+        acknowledged_batches = 0
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.error(f"upsert :: Batch of {len(batch)} points failed: {outcome}")
+                failed_chunks += len(batch)
+                errors.append(str(outcome))
+            elif outcome == UpdateStatus.ACKNOWLEDGED:
+                acknowledged_batches += 1
+                acknowledged.extend(batch)
+        failed_batches = len(errors)
 
-            # Return InputDocumentResult with successful IDs
-            return StoreDocumentResult(
-                total_chunks=len(points),
-                ingested_chunks=len(points),
-                status=StoreDocumentStatus.SUCCESS,
-                failed_chunks=0,  # Qdrant do not provide partially failed
-                metrics={"processing_time_ms": (time.time() - start_time) * 1000}
-              )
-        except Exception as e:
-            self.logger.error(f"QdrantVectorStoreAdapter :: Error during upsert operation: {e}")
-            raise Exception(f"Error during upsert operation: {e}")
+        unconfirmed_chunks = 0
+        if acknowledged:
+            try:
+                unconfirmed_chunks = await self._confirm_applied(acknowledged)
+                if unconfirmed_chunks:
+                    errors.append(f"{unconfirmed_chunks} acknowledged points were not applied "
+                                  f"within {self.confirm_timeout:.0f}s")
+            except Exception as e:
+                unconfirmed_chunks = len(acknowledged)
+                errors.append(f"Confirming the acknowledged points failed: {e}")
+            if unconfirmed_chunks:
+                self.logger.error(f"upsert :: {unconfirmed_chunks} acknowledged points are not confirmed: {errors[-1]}")
+                failed_chunks += unconfirmed_chunks
+            if on_batch is not None and unconfirmed_chunks < len(acknowledged):
+                await on_batch(len(acknowledged) - unconfirmed_chunks)
 
+        ingested_chunks = len(points) - failed_chunks
+        if failed_chunks == 0:
+            status = StoreDocumentStatus.SUCCESS
+        elif ingested_chunks > 0:
+            status = StoreDocumentStatus.PARTIAL
+        else:
+            status = StoreDocumentStatus.ERROR
+        self.logger.info(f"upsert :: Upserted {ingested_chunks}/{len(points)} documents ({status.value})")
 
+        metrics = {
+            "processing_time_ms": (time.time() - start_time) * 1000,
+            "batches": len(batches),
+            "failed_batches": failed_batches,
+            "acknowledged_batches": acknowledged_batches,
+            "unconfirmed_chunks": unconfirmed_chunks,
+        }
+        if errors:
+            metrics["errors"] = errors
+        return StoreDocumentResult(
+            total_chunks=len(points),
+            ingested_chunks=ingested_chunks,
+            failed_chunks=failed_chunks,
+            status=status,
+            metrics=metrics
+        )
+
+    async def is_document_stored(self, document_id: UUID, document_hash: str) -> bool:
+        """Check whether every chunk of a version of a document is stored.
+
+        One point of the version gives its chunk count, which is compared with the
+        number of points of the version; both are filtered on the indexed
+        `metadata.document_id` and `metadata.document_hash` payload fields. A partially
+        upserted document is reported as not stored, so that it is ingested again.
+
+        Args:
+            document_id: Identifier of the document.
+            document_hash: Content hash of the version of the document.
+
+        Returns:
+            bool: True if all the chunks of the version are stored.
+        """
+        collection_name = self.collection_parameters['name']
+        document_filter = Filter(must=[
+            FieldCondition(key="metadata.document_id", match=MatchValue(value=str(document_id))),
+            FieldCondition(key="metadata.document_hash", match=MatchValue(value=document_hash)),
+        ])
+
+        points, _ = await self._run_on_collection(lambda: self.client.scroll(
+            collection_name=collection_name,
+            scroll_filter=document_filter,
+            limit=1,
+            with_payload=["metadata.chunk_count"],
+            with_vectors=False
+        ))
+        if not points:
+            return False
+        chunk_count = (points[0].payload.get("metadata") or {}).get("chunk_count")
+        if chunk_count is None:
+            return False
+
+        stored = (await self._run_on_collection(lambda: self.client.count(
+            collection_name=collection_name,
+            count_filter=document_filter,
+            exact=True
+        ))).count
+        self.logger.debug(f"is_document_stored :: {stored}/{chunk_count} chunks stored for document {document_id} "
+                          f"({document_hash})")
+        return stored >= chunk_count
+
+    async def list_document_versions(self, document_id: UUID, filename: Optional[str] = None) -> List[Optional[str]]:
+        """List the versions of a document with stored chunks.
+
+        Rather than scrolling through every chunk of the document, one point is read
+        per version: each request excludes the content hashes found so far. The points
+        are selected like in `delete_document`, by the indexed `metadata.document_id`
+        payload field or `metadata.filename` if given.
+
+        Args:
+            document_id: Identifier of the document.
+            filename: Name of the document, matching the chunks stored without document id.
+
+        Returns:
+            List[Optional[str]]: Content hashes of the stored versions, None for the chunks stored without one.
+        """
+        conditions = [FieldCondition(key="metadata.document_id", match=MatchValue(value=str(document_id)))]
+        if filename is not None:
+            conditions.append(FieldCondition(key="metadata.filename", match=MatchValue(value=filename)))
+
+        versions: List[Optional[str]] = []
+        while True:
+            found_hashes = [version for version in versions if version is not None]
+            excluded = []
+            if found_hashes:
+                excluded.append(FieldCondition(key="metadata.document_hash", match=MatchAny(any=found_hashes)))
+            if None in versions:
+                excluded.append(IsEmptyCondition(is_empty=PayloadField(key="metadata.document_hash")))
+            version_filter = Filter(should=conditions, must_not=excluded or None)
+
+            points, _ = await self._run_on_collection(lambda: self.client.scroll(
+                collection_name=self.collection_parameters['name'],
+                scroll_filter=version_filter,
+                limit=1,
+                with_payload=["metadata.document_hash"],
+                with_vectors=False
+            ))
+            if not points:
+                break
+            versions.append((points[0].payload.get("metadata") or {}).get("document_hash"))
+        self.logger.debug(f"list_document_versions :: Found {len(versions)} versions of document {document_id}")
+        return versions
+
+    async def list_chunk_ids(self, document_id: UUID) -> List[UUID]:
+        """List the ids of the stored chunks of a document.
+
+        The points are scrolled page by page without payload nor vector, filtered on
+        the indexed `metadata.document_id` payload field.
+
+        Args:
+            document_id: Identifier of the document.
+
+        Returns:
+            List[UUID]: Ids of the chunks of the document.
+        """
+        collection_name = self.collection_parameters['name']
+        document_filter = Filter(must=[
+            FieldCondition(key="metadata.document_id", match=MatchValue(value=str(document_id)))
+        ])
+
+        chunk_ids: List[UUID] = []
+        offset = None
+        while True:
+            points, offset = await self._run_on_collection(lambda: self.client.scroll(
+                collection_name=collection_name,
+                scroll_filter=document_filter,
+                limit=self.batch_size,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False
+            ))
+            chunk_ids.extend(UUID(str(point.id)) for point in points)
+            if offset is None:
+                break
+        self.logger.debug(f"list_chunk_ids :: Found {len(chunk_ids)} chunks for document {document_id}")
+        return chunk_ids
+
+    async def update_chunk_metadata(self, chunks: List[DocumentRetrieval]) -> None:
+        """Replace the metadata of stored chunks, keeping their vectors.
+
+        The updates are sent in batches of `batch_size` operations, one request per batch.
+
+        Args:
+            chunks: Stored chunks, with their new metadata.
+        """
+        self.logger.info(f"update_chunk_metadata :: Updating the metadata of {len(chunks)} chunks")
+        operations = [
+            SetPayloadOperation(set_payload=SetPayload(payload={"metadata": chunk.metadata or {}},
+                                                       points=[str(chunk.id)]))
+            for chunk in chunks
+        ]
+        for start in range(0, len(operations), self.batch_size):
+            batch = operations[start:start + self.batch_size]
+            await self._run_on_collection(lambda: self.client.batch_update_points(
+                collection_name=self.collection_parameters['name'],
+                update_operations=batch,
+                wait=self.wait
+            ))
+
+    async def delete_chunks(self, chunk_ids: List[UUID]) -> None:
+        """Delete stored chunks by id, in batches of `batch_size` ids.
+
+        Args:
+            chunk_ids: Ids of the chunks to delete.
+        """
+        self.logger.info(f"delete_chunks :: Deleting {len(chunk_ids)} chunks")
+        for start in range(0, len(chunk_ids), self.batch_size):
+            batch = [str(chunk_id) for chunk_id in chunk_ids[start:start + self.batch_size]]
+            await self._run_on_collection(lambda: self.client.delete(
+                collection_name=self.collection_parameters['name'],
+                points_selector=PointIdsList(points=batch),
+                wait=self.wait
+            ))
+
+    async def delete_document(self, document_id: UUID, filename: Optional[str] = None,
+                              keep: Sequence[UUID] = ()) -> int:
+        """Delete the stored chunks of a document with a server-side filter.
+
+        The points are selected by the indexed `metadata.document_id` payload field, or
+        `metadata.filename` if given, so that Qdrant deletes them in a single request
+        without the client scrolling through them. They are counted first, with the same
+        filter.
+
+        Args:
+            document_id: Identifier of the document.
+            filename: Name of the document, matching the chunks stored without document id.
+            keep: Ids of chunks of the document to keep.
+
+        Returns:
+            int: Number of chunks deleted.
+        """
+        collection_name = self.collection_parameters['name']
+        conditions = [FieldCondition(key="metadata.document_id", match=MatchValue(value=str(document_id)))]
+        if filename is not None:
+            conditions.append(FieldCondition(key="metadata.filename", match=MatchValue(value=filename)))
+        document_filter = Filter(
+            should=conditions,
+            must_not=[HasIdCondition(has_id=[str(chunk_id) for chunk_id in keep])] if keep else None,
+        )
+
+        deleted = (await self._run_on_collection(lambda: self.client.count(
+            collection_name=collection_name,
+            count_filter=document_filter,
+            exact=True
+        ))).count
+        if deleted:
+            await self._run_on_collection(lambda: self.client.delete(
+                collection_name=collection_name,
+                points_selector=FilterSelector(filter=document_filter),
+                wait=self.wait
+            ))
+        self.logger.info(f"delete_document :: Deleted {deleted} chunks of document {document_id}")
+        return deleted
+
+    async def get_storage(self) -> CollectionStorage:
+        """Read the storage layout of the collection from its configuration.
+
+        Returns:
+            CollectionStorage: Where the vectors, payloads and HNSW graph are stored, and whether
+                the optimizers are still rewriting the collection.
+        """
+        collection_name = self.collection_parameters['name']
+        info = await self._run_on_collection(lambda: self.client.get_collection(collection_name))
+        vectors = info.config.params.vectors
+        # The adapters store a single unnamed vector
+        if isinstance(vectors, dict):
+            vectors = vectors.get("")
+        return CollectionStorage(
+            collection_name=collection_name,
+            vectors_on_disk=bool(vectors is not None and vectors.on_disk),
+            payload_on_disk=bool(info.config.params.on_disk_payload),
+            hnsw_on_disk=bool(info.config.hnsw_config.on_disk),
+            points_count=info.points_count,
+            optimizing=info.status != CollectionStatus.GREEN,
+        )
+
+    async def set_storage_tier(self, tier: StorageTier) -> CollectionStorage:
+        """Move the vectors, payloads and HNSW graph of the collection to a storage tier.
+
+        Qdrant accepts the new configuration at once and rewrites the segments with its
+        optimizers, so the collection reports `optimizing` until the move is complete.
+        The tier applies to all three structures, regardless of the on-disk overrides of
+        the repository settings. A collection created later, e.g. after a deletion, uses
+        the same tier, including by the adapters sharing the collection parameters.
+
+        Args:
+            tier: Target storage tier.
+
+        Returns:
+            CollectionStorage: The storage layout of the collection after the update.
+        """
+        collection_name = self.collection_parameters['name']
+        storage = self.storage_layout(tier.value, vectors_on_disk=None, payload_on_disk=None, hnsw_on_disk=None)
+        self.logger.info(f"set_storage_tier :: Moving collection '{collection_name}' to the {tier.value} tier")
+        await self._run_on_collection(lambda: self.client.update_collection(
+            collection_name=collection_name,
+            vectors_config={"": VectorParamsDiff(on_disk=storage['vectors_on_disk'])},
+            collection_params=CollectionParamsDiff(on_disk_payload=storage['payload_on_disk']),
+            hnsw_config=HnswConfigDiff(on_disk=storage['hnsw_on_disk']),
+        ))
+        self.collection_parameters['storage'] = storage
+        return await self.get_storage()
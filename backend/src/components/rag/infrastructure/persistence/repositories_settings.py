@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -12,9 +14,40 @@ class RepositorySettings(BaseSettings):
     collection_name: str = "documents"
     fallback_dimension: int = 768  # nomic-embed-text-v1.5 dimension
 
+    # Upsert settings
+    upsert_batch_size: int = 256  # Points per upsert request
+    upsert_max_concurrency: int = 4  # Upsert requests in flight per document
+    upsert_wait: bool = True  # Wait for points to be applied; False only waits for Qdrant to acknowledge them
+    upsert_confirm_timeout: float = 30.0  # Seconds to wait for acknowledged points to be applied
+
+    # Quantization settings, applied when the collection is created
+    quantization: Literal["none", "scalar", "binary", "product"] = "none"  # int8, 1 bit or product codes per vector
+    quantization_always_ram: bool = True  # Keep the quantized vectors in RAM whatever the storage of the originals
+    scalar_quantile: float = 0.99  # Share of the values kept in the int8 range, the rest are clipped
+    product_compression: Literal["x4", "x8", "x16", "x32", "x64"] = "x16"  # Compression ratio of product quantization
+
+    # Storage settings, applied when the collection is created: "hot" holds vectors, payloads and HNSW graph
+    # in RAM, "warm" memory-maps them from disk
+    storage_tier: Literal["hot", "warm"] = "hot"
+    vectors_on_disk: Optional[bool] = None  # Overrides the storage tier for the original vectors
+    payload_on_disk: Optional[bool] = None  # Overrides the storage tier for the payloads
+    hnsw_on_disk: Optional[bool] = None  # Overrides the storage tier for the HNSW graph
+
+    # HNSW settings, applied when the collection is created (None uses the Qdrant defaults)
+    hnsw_m: Optional[int] = None  # Edges per node: more improves recall at the cost of memory and indexing time
+    hnsw_ef_construct: Optional[int] = None  # Candidates considered while building: more improves the graph quality
+
+    # Default search settings, overridable per query (None uses the Qdrant defaults)
+    search_hnsw_ef: Optional[int] = None  # Candidates explored per search: more improves recall at the cost of latency
+    search_exact: Optional[bool] = None  # Search exhaustively instead of through the index
+    search_score_threshold: Optional[float] = None  # Minimum score of a result
+    search_indexed_only: Optional[bool] = None  # Skip the points not indexed yet, e.g. during a bulk ingestion
+    search_oversampling: Optional[float] = None  # Candidates fetched with quantized vectors: top_k * oversampling
+    search_rescore: Optional[bool] = None  # Rescore the candidates with the original vectors
+
     class Config:
         """Pydantic configuration."""
-        env_prefix = "QDRANT"  # Environment variables with QDRANT_ prefix
+        env_prefix = "QDRANT_"  # Environment variables with QDRANT_ prefix
         case_sensitive = False
 
 repo_settings = RepositorySettings()
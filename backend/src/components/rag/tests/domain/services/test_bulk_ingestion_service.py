@@ -0,0 +1,264 @@
+import asyncio
+import time
+import unittest
+from collections import Counter
+from unittest.mock import AsyncMock
+from uuid import NAMESPACE_URL, uuid4, uuid5
+
+from src.components.rag.application.ports.driven import EmbeddingPort, TextChunkingPort, VectorStorePort
+from src.components.rag.application.ports.driven.text_extraction_port import TextExtractionPort
+from src.components.rag.domain.services.bulk_ingestion_service import BulkIngestionService, STAGES
+from src.components.rag.domain.services.document_store_service import DocumentConflictError, DocumentStoreService
+from src.components.rag.domain.value_objects import DocumentRetrieval, Embedding, InputDocument, StoreDocumentResult
+from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
+from src.components.rag.domain.value_objects.input_document import StoreDocumentStatus
+
+
+class TestBulkIngestionService(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the staged bulk ingestion pipeline."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.mock_document_store_service = AsyncMock(spec=DocumentStoreService)
+        self.delay = 0.01
+        self.running = Counter()
+        self.peak = Counter()
+
+        async def run_stage(stage):
+            self.running[stage] += 1
+            self.peak[stage] = max(self.peak[stage], self.running[stage])
+            await asyncio.sleep(self.delay)
+            self.running[stage] -= 1
+
+        async def find_unchanged(document, document_hash):
+            if document_hash == "unchanged":
+                return StoreDocumentResult(total_chunks=0, ingested_chunks=0, failed_chunks=0,
+                                           status=StoreDocumentStatus.UNCHANGED)
+            return None
+
+        async def extract_document(document, document_hash):
+            await run_stage("extract")
+            if document.filename == "broken.pdf":
+                raise ValueError("unsupported document")
+            return ExtractedContent(text=document.filename, metadata={"filename": document.filename})
+
+        async def chunk_document(extracted):
+            await run_stage("chunk")
+            return [DocumentRetrieval(id=uuid5(NAMESPACE_URL, f"{extracted.text} {i}"),
+                                      content=f"{extracted.text} {i}", metadata=extracted.metadata)
+                    for i in range(5)]
+
+        async def embed_chunks(chunks):
+            await run_stage("embed")
+            return [Embedding(model="test-model", vector=[0.1, 0.2]) for _ in chunks]
+
+        async def store_chunks(chunks, embeddings, kept, vanished):
+            await run_stage("upsert")
+            return StoreDocumentResult(total_chunks=len(chunks) + len(kept),
+                                       ingested_chunks=len(embeddings) + len(kept), failed_chunks=0,
+                                       status=StoreDocumentStatus.SUCCESS)
+
+        self.mock_document_store_service.fingerprint_document.side_effect = \
+            lambda document: "unchanged" if document.filename.startswith("unchanged") else document.filename
+        self.mock_document_store_service.find_unchanged.side_effect = find_unchanged
+        self.mock_document_store_service.extract_document.side_effect = extract_document
+        self.mock_document_store_service.chunk_document.side_effect = chunk_document
+        self.mock_document_store_service.list_stored_chunk_ids.return_value = []
+        self.mock_document_store_service.diff_chunks.side_effect = DocumentStoreService.diff_chunks
+        self.mock_document_store_service.embed_chunks.side_effect = embed_chunks
+        self.mock_document_store_service.store_chunks.side_effect = store_chunks
+
+    def _documents(self, count: int, size: int = 1024):
+        return [InputDocument(filename=f"{i}.pdf", content=b"x" * size, type="application/pdf") for i in range(count)]
+
+    async def test_ingest_bounds_documents_in_each_stage(self):
+        """Test that each stage runs concurrently, never beyond its own budget."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service, extract_concurrency=3,
+                                       chunk_concurrency=1, embed_concurrency=2, upsert_concurrency=1)
+
+        # Act
+        report = await service.ingest(self._documents(10))
+
+        # Assert: the first stage is fed faster than it drains, so it reaches its budget
+        budgets = {"extract": 3, "chunk": 1, "embed": 2, "upsert": 1}
+        for stage, budget in budgets.items():
+            self.assertLessEqual(self.peak[stage], budget, stage)
+        self.assertEqual(self.peak["extract"], 3)
+        self.assertEqual(report.succeeded, 10)
+        self.assertEqual(report.ingested_chunks, 50)
+        self.assertEqual([document.filename for document in report.documents], [f"{i}.pdf" for i in range(10)])
+
+    async def test_stages_overlap_across_documents(self):
+        """Test that the run takes about the time of one stage per document, not the sum of the stages."""
+        # Arrange
+        self.delay = 0.05
+        service = BulkIngestionService(self.mock_document_store_service, extract_concurrency=1,
+                                       chunk_concurrency=1, embed_concurrency=1, upsert_concurrency=1)
+
+        # Act
+        started = time.perf_counter()
+        await service.ingest(self._documents(6))
+        elapsed = time.perf_counter() - started
+
+        # Assert: sequential stages would take 6 * 4 * 0.05 = 1.2 s, a full pipeline (6 + 3) * 0.05 = 0.45 s
+        self.assertLess(elapsed, 0.8)
+
+    async def test_budget_is_shared_across_concurrent_runs(self):
+        """Test that two bulk ingestions running at once share the budget of each stage."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service, extract_concurrency=2,
+                                       chunk_concurrency=2, embed_concurrency=2, upsert_concurrency=2)
+
+        # Act
+        await asyncio.gather(service.ingest(self._documents(4)), service.ingest(self._documents(4)))
+
+        # Assert
+        self.assertEqual(max(self.peak.values()), 2)
+
+    async def test_failed_document_is_reported_without_stopping_the_run(self):
+        """Test that a stage error is recorded on its document, which leaves the pipeline."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service)
+        documents = self._documents(2) + [InputDocument(filename="broken.pdf", content=b"x", type="application/pdf")]
+
+        # Act
+        report = await service.ingest(documents)
+
+        # Assert
+        self.assertEqual((report.succeeded, report.failed), (2, 1))
+        self.assertEqual(report.documents[2].error, "unsupported document")
+        self.assertEqual(report.ingested_chunks, 10)
+        self.assertEqual(self.mock_document_store_service.chunk_document.await_count, 2)
+
+    async def test_unchanged_document_leaves_the_pipeline_after_extract(self):
+        """Test that a document whose content is already stored is counted but never chunked."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service)
+        documents = self._documents(2) + [InputDocument(filename="unchanged.pdf", content=b"x", type="application/pdf")]
+
+        # Act
+        report = await service.ingest(documents)
+
+        # Assert
+        self.assertEqual((report.succeeded, report.unchanged, report.failed), (3, 1, 0))
+        self.assertEqual(report.ingested_chunks, 10)
+        self.assertEqual(self.mock_document_store_service.chunk_document.await_count, 2)
+        self.assertEqual(report.documents[2].result.status, StoreDocumentStatus.UNCHANGED)
+
+    async def test_only_new_chunks_are_embedded(self):
+        """Test that the chunks already stored for a document are kept instead of embedded again."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service)
+        vanished_id = uuid4()
+        self.mock_document_store_service.list_stored_chunk_ids.return_value = [uuid5(NAMESPACE_URL, "0.pdf 0"),
+                                                                               vanished_id]
+
+        # Act
+        report = await service.ingest(self._documents(1))
+
+        # Assert
+        embedded = self.mock_document_store_service.embed_chunks.await_args.args[0]
+        self.assertEqual(len(embedded), 4)
+        _, _, kept, vanished = self.mock_document_store_service.store_chunks.await_args.args
+        # Without replacement, the stored chunks absent from the document are left in place
+        self.assertEqual((len(kept), vanished), (1, []))
+        self.mock_document_store_service.purge_replaced.assert_not_called()
+        self.assertEqual(report.ingested_chunks, 5)
+
+    async def test_replacement_deletes_the_chunks_absent_from_the_new_version(self):
+        """Test that a replacing run deletes the vanished chunks and purges the rest of the replaced document."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service)
+        vanished_id = uuid4()
+        self.mock_document_store_service.list_stored_chunk_ids.return_value = [uuid5(NAMESPACE_URL, "0.pdf 0"),
+                                                                               vanished_id]
+        self.mock_document_store_service.purge_replaced.side_effect = lambda document, chunk_ids, result: result
+
+        # Act
+        report = await service.ingest(self._documents(1), replace=True)
+
+        # Assert
+        self.mock_document_store_service.check_unambiguous.assert_awaited_once_with("0.pdf")
+        self.mock_document_store_service.check_filename_available.assert_not_called()
+        _, _, _, vanished = self.mock_document_store_service.store_chunks.await_args.args
+        self.assertEqual(vanished, [vanished_id])
+        _, chunk_ids, _ = self.mock_document_store_service.purge_replaced.await_args.args
+        self.assertEqual(set(chunk_ids), {uuid5(NAMESPACE_URL, f"0.pdf {i}") for i in range(5)})
+        self.assertEqual(report.ingested_chunks, 5)
+
+    async def test_different_document_with_a_stored_filename_is_a_conflict(self):
+        """Test that a document reusing the filename of another stored document is rejected, deleting nothing."""
+        # Arrange
+        vector_store_port = AsyncMock(spec=VectorStorePort)
+        vector_store_port.is_document_stored.return_value = False
+        vector_store_port.list_document_versions.return_value = ["hash-of-the-stored-document"]
+        vector_store_port.list_chunk_ids.return_value = [uuid4()]
+        text_extraction_port = AsyncMock(spec=TextExtractionPort)
+        service = BulkIngestionService(DocumentStoreService(
+            vector_store_port=vector_store_port,
+            embedding_port=AsyncMock(spec=EmbeddingPort),
+            text_extraction_port=text_extraction_port,
+            text_chunking_port=AsyncMock(spec=TextChunkingPort),
+        ))
+
+        # Act
+        report = await service.ingest(self._documents(1))
+
+        # Assert
+        self.assertEqual((report.failed, report.conflicts), (1, 1))
+        self.assertTrue(report.documents[0].conflict)
+        text_extraction_port.extract_text.assert_not_called()
+        vector_store_port.upsert.assert_not_called()
+        vector_store_port.delete_chunks.assert_not_called()
+        vector_store_port.delete_document.assert_not_called()
+
+    async def test_conflict_is_reported_apart_from_other_failures(self):
+        """Test that only the documents rejected for their filename are counted as conflicts."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service)
+        self.mock_document_store_service.check_filename_available.side_effect = [
+            None, DocumentConflictError("Another document is already stored as 1.pdf"), None]
+        documents = self._documents(2) + [InputDocument(filename="broken.pdf", content=b"x", type="application/pdf")]
+
+        # Act
+        report = await service.ingest(documents)
+
+        # Assert
+        self.assertEqual((report.succeeded, report.failed, report.conflicts), (1, 2, 1))
+        self.assertEqual([document.conflict for document in report.documents], [False, True, False])
+
+    async def test_report_includes_stage_metrics(self):
+        """Test that the report counts the documents, failures and utilisation of each stage."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service, embed_concurrency=1)
+        documents = self._documents(3) + [InputDocument(filename="broken.pdf", content=b"x", type="application/pdf")]
+
+        # Act
+        report = await service.ingest(documents)
+
+        # Assert
+        self.assertEqual([metrics.stage for metrics in report.stages], list(STAGES))
+        extract, chunk, embed, upsert = report.stages
+        self.assertEqual((extract.documents, extract.failed), (4, 1))
+        self.assertEqual((upsert.documents, upsert.failed), (3, 0))
+        self.assertEqual(embed.workers, 1)
+        for metrics in report.stages:
+            self.assertGreater(metrics.busy_seconds, 0)
+            self.assertGreater(metrics.utilisation, 0)
+            self.assertLessEqual(metrics.utilisation, 1)
+
+    async def test_report_computes_throughput(self):
+        """Test that the report derives document, chunk and byte rates from the elapsed time."""
+        # Arrange
+        service = BulkIngestionService(self.mock_document_store_service)
+
+        # Act
+        report = (await service.ingest(self._documents(4, size=1024 * 1024))).model_copy(update={"elapsed_seconds": 2.0})
+
+        # Assert
+        self.assertEqual(report.total_bytes, 4 * 1024 * 1024)
+        self.assertEqual(report.documents_per_second, 2.0)
+        self.assertEqual(report.chunks_per_second, 10.0)
+        self.assertEqual(report.megabytes_per_second, 2.0)
+        self.assertEqual(report.model_dump()["chunks_per_second"], 10.0)
@@ -0,0 +1,383 @@
+import hashlib
+import unittest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.components.rag.application.ports.driven import EmbeddingPort, VectorStorePort, TextChunkingPort, \
+    IngestionCheckpointPort, SemanticCachePort
+from src.components.rag.application.ports.driven.text_extraction_port import TextExtractionPort
+from src.components.rag.domain.services.document_store_service import DocumentConflictError, DocumentStoreService, \
+    derive_chunk_id, derive_document_id
+from src.components.rag.domain.value_objects import DocumentRetrieval, Embedding, InputDocument, StoreDocumentResult, \
+    IngestionStage, IngestionCheckpoint
+from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
+from src.components.rag.domain.value_objects.input_document import StoreDocumentStatus
+
+
+class TestDocumentStoreService(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for DocumentStoreService.
+
+    These tests focus on verifying the ingestion workflow while mocking
+    external dependencies to ensure isolated testing.
+    """
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.mock_vector_store_port = AsyncMock(spec=VectorStorePort)
+        self.mock_embedding_port = AsyncMock(spec=EmbeddingPort)
+        self.mock_text_extraction_port = AsyncMock(spec=TextExtractionPort)
+        self.mock_text_chunking_port = AsyncMock(spec=TextChunkingPort)
+
+        self.chunks = [
+            DocumentRetrieval(content=f"Chunk {i} content", metadata={"chunk_index": i})
+            for i in range(3)
+        ]
+
+        self.mock_text_extraction_port.extract_text.return_value = ExtractedContent(
+            text="# Title\n\nSome text", metadata={"filename": "doc.pdf"}
+        )
+        self.mock_text_chunking_port.chunk_text.return_value = self.chunks
+        self.mock_embedding_port.embed_texts.side_effect = lambda texts: [
+            Embedding(model="test-model", vector=[float(i), 0.5]) for i, _ in enumerate(texts)
+        ]
+        self.mock_vector_store_port.is_document_stored.return_value = False
+        self.mock_vector_store_port.list_document_versions.return_value = []
+        self.mock_vector_store_port.list_chunk_ids.return_value = []
+        self.mock_vector_store_port.delete_document.return_value = 0
+        self.mock_vector_store_port.upsert.side_effect = self._upsert
+
+        self.input_document = InputDocument(filename="doc.pdf", content=b"%PDF", type="application/pdf")
+
+        self.service = DocumentStoreService(
+            vector_store_port=self.mock_vector_store_port,
+            embedding_port=self.mock_embedding_port,
+            text_extraction_port=self.mock_text_extraction_port,
+            text_chunking_port=self.mock_text_chunking_port,
+        )
+
+    @staticmethod
+    async def _upsert(vectors, on_batch=None):
+        """Fake vector store storing the vectors in batches of two."""
+        for start in range(0, len(vectors), 2):
+            if on_batch is not None:
+                await on_batch(len(vectors[start:start + 2]))
+        return StoreDocumentResult(
+            total_chunks=len(vectors),
+            ingested_chunks=len(vectors),
+            failed_chunks=0,
+            status=StoreDocumentStatus.SUCCESS,
+        )
+
+    async def test_ingest_document_embeds_chunks_in_one_batch_call(self):
+        """Test that all chunks are embedded through a single batched call."""
+        # Act
+        result = await self.service.ingest_document(self.input_document)
+
+        # Assert
+        self.mock_embedding_port.embed_texts.assert_awaited_once_with([chunk.content for chunk in self.chunks])
+        self.mock_embedding_port.embed_text.assert_not_called()
+        self.assertEqual(result.ingested_chunks, 3)
+
+    async def test_ingest_document_pairs_vectors_with_chunks(self):
+        """Test that each stored vector matches its chunk."""
+        # Act
+        await self.service.ingest_document(self.input_document)
+
+        # Assert
+        vectors = self.mock_vector_store_port.upsert.await_args.args[0]
+        self.assertEqual([v.content for v in vectors], [chunk.content for chunk in self.chunks])
+        self.assertEqual([v.vector[0] for v in vectors], [0.0, 1.0, 2.0])
+        self.assertEqual([v.id for v in vectors], self._chunk_ids(self.chunks))
+
+    def _chunk_ids(self, chunks):
+        document_id = derive_document_id(self.input_document.filename)
+        return [derive_chunk_id(document_id, hashlib.sha256(chunk.content.encode()).hexdigest()) for chunk in chunks]
+
+    async def test_ingest_document_derives_chunk_ids_from_document_and_chunk_text(self):
+        """Test that the chunk ids depend on the document and the chunk text, recorded with the document hash."""
+        # Arrange
+        self.mock_text_chunking_port.chunk_text.return_value = self.chunks + [self.chunks[0]]
+
+        # Act
+        await self.service.ingest_document(self.input_document)
+        await self.service.ingest_document(self.input_document.model_copy(update={"filename": "other.pdf"}))
+
+        # Assert
+        first, second = [call.args[0] for call in self.mock_vector_store_port.upsert.await_args_list]
+        self.assertEqual([v.id for v in first[:3]], self._chunk_ids(self.chunks))
+        self.assertEqual(len({v.id for v in first}), 4)
+        self.assertTrue({v.id for v in first}.isdisjoint(v.id for v in second))
+        self.assertEqual(first[0].metadata["document_id"], str(derive_document_id("doc.pdf")))
+        self.assertEqual(first[0].metadata["document_hash"], self.input_document.content_hash())
+        self.assertEqual(first[0].metadata["chunk_count"], 4)
+
+    async def test_ingest_document_embeds_only_the_changed_chunks_of_a_new_version(self):
+        """Test that a new version reuses its unchanged chunks, embeds the changed one and deletes the vanished one."""
+        # Arrange
+        vanished_id = uuid4()
+        self.mock_vector_store_port.list_chunk_ids.return_value = self._chunk_ids(self.chunks[:2]) + [vanished_id]
+
+        # Act
+        result = await self.service.replace_document(self.input_document)
+
+        # Assert
+        self.mock_vector_store_port.list_chunk_ids.assert_awaited_once_with(derive_document_id("doc.pdf"))
+        self.mock_embedding_port.embed_texts.assert_awaited_once_with([self.chunks[2].content])
+        self.assertEqual([v.content for v in self.mock_vector_store_port.upsert.await_args.args[0]],
+                         [self.chunks[2].content])
+        kept = self.mock_vector_store_port.update_chunk_metadata.await_args.args[0]
+        self.assertEqual([chunk.id for chunk in kept], self._chunk_ids(self.chunks[:2]))
+        self.assertEqual(kept[0].metadata["document_hash"], self.input_document.content_hash())
+        self.mock_vector_store_port.delete_chunks.assert_awaited_once_with([vanished_id])
+        self.assertEqual((result.total_chunks, result.ingested_chunks), (3, 3))
+        self.assertEqual(result.metrics["chunks"], {"new": 1, "kept": 2, "deleted": 1})
+
+    async def test_different_document_with_the_same_filename_is_rejected(self):
+        """Test that a different document uploaded under a stored filename leaves the stored one untouched."""
+        # Arrange
+        self.mock_vector_store_port.list_document_versions.return_value = ["hash-of-the-stored-doc.pdf"]
+        self.mock_vector_store_port.list_chunk_ids.return_value = self._chunk_ids(self.chunks)
+
+        # Act
+        with self.assertRaises(DocumentConflictError):
+            await self.service.ingest_document(self.input_document)
+
+        # Assert
+        self.mock_vector_store_port.list_document_versions.assert_awaited_once_with(
+            derive_document_id("doc.pdf"), "doc.pdf")
+        self.mock_text_extraction_port.extract_text.assert_not_called()
+        self.mock_vector_store_port.upsert.assert_not_called()
+        self.mock_vector_store_port.update_chunk_metadata.assert_not_called()
+        self.mock_vector_store_port.delete_chunks.assert_not_called()
+        self.mock_vector_store_port.delete_document.assert_not_called()
+
+    async def test_ingestion_without_replacement_deletes_no_stored_chunk(self):
+        """Test that resuming a partial ingestion of the same content reuses the stored chunks but deletes none."""
+        # Arrange
+        self.mock_vector_store_port.list_document_versions.return_value = [self.input_document.content_hash()]
+        self.mock_vector_store_port.list_chunk_ids.return_value = self._chunk_ids(self.chunks[:2]) + [uuid4()]
+
+        # Act
+        result = await self.service.ingest_document(self.input_document)
+
+        # Assert
+        self.mock_embedding_port.embed_texts.assert_awaited_once_with([self.chunks[2].content])
+        self.mock_vector_store_port.delete_chunks.assert_not_called()
+        self.mock_vector_store_port.delete_document.assert_not_called()
+        self.assertEqual(result.metrics["chunks"], {"new": 1, "kept": 2, "deleted": 0})
+
+    async def test_failed_upsert_leaves_the_previous_version(self):
+        """Test that the stored chunks are neither updated nor deleted when no new chunk could be stored."""
+        # Arrange
+        self.mock_vector_store_port.list_chunk_ids.return_value = self._chunk_ids(self.chunks[:1]) + [uuid4()]
+        self.mock_vector_store_port.upsert.side_effect = lambda vectors, on_batch=None: StoreDocumentResult(
+            total_chunks=len(vectors), ingested_chunks=0, failed_chunks=len(vectors),
+            status=StoreDocumentStatus.ERROR,
+        )
+
+        # Act
+        result = await self.service.replace_document(self.input_document)
+
+        # Assert
+        self.assertEqual(result.status, StoreDocumentStatus.ERROR)
+        self.mock_vector_store_port.update_chunk_metadata.assert_not_called()
+        self.mock_vector_store_port.delete_chunks.assert_not_called()
+        self.mock_vector_store_port.delete_document.assert_not_called()
+
+    async def test_ingest_document_skips_unchanged_document_before_extraction(self):
+        """Test that a document whose content is already stored is neither extracted nor upserted."""
+        # Arrange
+        self.mock_vector_store_port.is_document_stored.return_value = True
+
+        # Act
+        result = await self.service.ingest_document(self.input_document)
+
+        # Assert
+        self.mock_vector_store_port.is_document_stored.assert_awaited_once_with(
+            derive_document_id("doc.pdf"), self.input_document.content_hash())
+        self.mock_text_extraction_port.extract_text.assert_not_called()
+        self.mock_vector_store_port.upsert.assert_not_called()
+        self.assertEqual(result.status, StoreDocumentStatus.UNCHANGED)
+        self.assertEqual(result.ingested_chunks, 0)
+
+    async def test_replace_document_ingests_unchanged_content_and_purges_other_chunks(self):
+        """Test that a replacement skips the unchanged check and deletes every chunk outside the new version."""
+        # Arrange
+        self.mock_vector_store_port.is_document_stored.return_value = True
+        self.mock_vector_store_port.delete_document.return_value = 2
+
+        # Act
+        result = await self.service.replace_document(self.input_document)
+
+        # Assert
+        self.mock_vector_store_port.is_document_stored.assert_not_called()
+        self.mock_vector_store_port.delete_document.assert_awaited_once_with(
+            derive_document_id("doc.pdf"), "doc.pdf", keep=self._chunk_ids(self.chunks))
+        self.assertEqual(result.status, StoreDocumentStatus.SUCCESS)
+        self.assertEqual(result.metrics["chunks"]["deleted"], 2)
+
+    async def test_delete_document_deletes_by_document_and_invalidates_cache(self):
+        """Test that deleting a document removes its chunks and invalidates the answer cache."""
+        # Arrange
+        self.service.semantic_cache_port = AsyncMock(spec=SemanticCachePort)
+        self.mock_vector_store_port.delete_document.return_value = 3
+
+        # Act
+        result = await self.service.delete_document("doc.pdf")
+
+        # Assert
+        self.mock_vector_store_port.delete_document.assert_awaited_once_with(derive_document_id("doc.pdf"), "doc.pdf")
+        self.service.semantic_cache_port.invalidate.assert_awaited_once()
+        self.assertEqual((result.filename, result.deleted_chunks), ("doc.pdf", 3))
+
+    async def test_ambiguous_filename_is_neither_replaced_nor_deleted(self):
+        """Test that a filename holding several documents is rejected unless all of them are meant."""
+        # Arrange
+        self.mock_vector_store_port.list_document_versions.return_value = ["first-hash", "second-hash"]
+
+        # Act
+        with self.assertRaises(DocumentConflictError):
+            await self.service.replace_document(self.input_document)
+        with self.assertRaises(DocumentConflictError):
+            await self.service.delete_document("doc.pdf")
+
+        # Assert
+        self.mock_text_extraction_port.extract_text.assert_not_called()
+        self.mock_vector_store_port.delete_document.assert_not_called()
+
+    async def test_all_versions_replaces_and_deletes_an_ambiguous_filename(self):
+        """Test that every document stored under the filename is superseded when asked for."""
+        # Arrange
+        self.mock_vector_store_port.list_document_versions.return_value = ["first-hash", "second-hash"]
+        self.mock_vector_store_port.delete_document.return_value = 5
+
+        # Act
+        replaced = await self.service.replace_document(self.input_document, all_versions=True)
+        deleted = await self.service.delete_document("doc.pdf", all_versions=True)
+
+        # Assert
+        self.assertEqual(replaced.status, StoreDocumentStatus.SUCCESS)
+        self.assertEqual(deleted.deleted_chunks, 5)
+        self.assertEqual(self.mock_vector_store_port.delete_document.await_count, 2)
+
+    async def test_ingest_document_reports_embedding_metrics(self):
+        """Test that embedding backend metrics are reported in the result."""
+        # Arrange
+        self.mock_embedding_port.get_metrics.return_value = {"scheduler": {"concurrency": 3, "batch_size": 32}}
+
+        # Act
+        result = await self.service.ingest_document(self.input_document)
+
+        # Assert
+        self.assertEqual(result.metrics["embedding"], {"scheduler": {"concurrency": 3, "batch_size": 32}})
+
+    async def test_ingest_document_passes_structured_document_to_chunking(self):
+        """Test that the structured document built by the extraction reaches the chunker."""
+        # Arrange
+        structured_document = object()
+        self.mock_text_extraction_port.extract_text.return_value = ExtractedContent(
+            text="# Title\n\nSome text", metadata={"filename": "doc.pdf"}, document=structured_document
+        )
+
+        # Act
+        await self.service.ingest_document(self.input_document)
+
+        # Assert
+        chunked_content = self.mock_text_chunking_port.chunk_text.await_args.args[0]
+        self.assertIs(chunked_content.document, structured_document)
+        self.assertEqual(chunked_content.metadata["document_type"], "application/pdf")
+
+    async def test_ingest_document_reports_progress_per_stage_and_batch(self):
+        """Test that progress is reported at each stage, and after each group of embedded and batch of stored chunks."""
+        # Arrange
+        self.service.embedding_group_size = 2
+        reports = []
+
+        async def on_progress(progress):
+            reports.append(progress)
+
+        # Act
+        await self.service.ingest_document(self.input_document, on_progress=on_progress)
+
+        # Assert
+        self.assertEqual(self.mock_embedding_port.embed_texts.await_count, 2)
+        self.assertEqual(
+            [(p.stage, p.chunks_total, p.chunks_embedded, p.chunks_upserted) for p in reports],
+            [
+                (IngestionStage.EXTRACTING, 0, 0, 0),
+                (IngestionStage.CHUNKING, 0, 0, 0),
+                (IngestionStage.EMBEDDING, 3, 0, 0),
+                (IngestionStage.EMBEDDING, 3, 2, 0),
+                (IngestionStage.EMBEDDING, 3, 3, 0),
+                (IngestionStage.UPSERTING, 3, 3, 0),
+                (IngestionStage.UPSERTING, 3, 3, 2),
+                (IngestionStage.UPSERTING, 3, 3, 3),
+                (IngestionStage.DONE, 3, 3, 3),
+            ],
+        )
+
+    async def test_ingest_document_checkpoints_each_stage(self):
+        """Test that extracted content, chunks and each embedded group are checkpointed under the job id."""
+        # Arrange
+        job_id = uuid4()
+        checkpoint_port = AsyncMock(spec=IngestionCheckpointPort)
+        checkpoint_port.load.return_value = IngestionCheckpoint()
+        self.service.checkpoint_port = checkpoint_port
+        self.service.embedding_group_size = 2
+
+        # Act
+        await self.service.ingest_document(self.input_document, job_id=job_id)
+
+        # Assert
+        self.assertEqual(checkpoint_port.save_extracted.await_args.args[0], job_id)
+        saved_job_id, saved_chunks, stored_chunk_ids = checkpoint_port.save_chunks.await_args.args
+        self.assertEqual(saved_job_id, job_id)
+        self.assertEqual([chunk.content for chunk in saved_chunks], [chunk.content for chunk in self.chunks])
+        self.assertEqual(stored_chunk_ids, [])
+        self.assertEqual([call.args[1] for call in checkpoint_port.save_embeddings.await_args_list], [0, 2])
+
+    async def test_ingest_document_resumes_after_last_checkpointed_stage(self):
+        """Test that a resumed ingestion skips extraction, chunking and the embedded groups."""
+        # Arrange
+        checkpoint_port = AsyncMock(spec=IngestionCheckpointPort)
+        checkpoint_port.load.return_value = IngestionCheckpoint(
+            chunks=self.chunks,
+            embeddings=[Embedding(model="test-model", vector=[9.0, 0.5]) for _ in range(2)],
+        )
+        self.service.checkpoint_port = checkpoint_port
+        self.service.embedding_group_size = 2
+
+        # Act
+        result = await self.service.ingest_document(self.input_document, job_id=uuid4())
+
+        # Assert
+        self.mock_text_extraction_port.extract_text.assert_not_called()
+        self.mock_text_chunking_port.chunk_text.assert_not_called()
+        self.mock_embedding_port.embed_texts.assert_awaited_once_with([self.chunks[2].content])
+        vectors = self.mock_vector_store_port.upsert.await_args.args[0]
+        self.assertEqual([v.id for v in vectors], [chunk.id for chunk in self.chunks])
+        self.assertEqual([v.vector[0] for v in vectors], [9.0, 9.0, 0.0])
+        self.assertEqual(result.ingested_chunks, 3)
+
+    async def test_resumed_ingestion_diffs_against_the_checkpointed_stored_chunks(self):
+        """Test that a resumed ingestion reuses the stored chunk ids saved with its chunks, without listing them."""
+        # Arrange
+        checkpoint_port = AsyncMock(spec=IngestionCheckpointPort)
+        checkpoint_port.load.return_value = IngestionCheckpoint(
+            chunks=self.chunks,
+            stored_chunk_ids=[self.chunks[0].id],
+            embeddings=[Embedding(model="test-model", vector=[9.0, 0.5])],
+        )
+        # Chunk 1 was upserted before the interruption
+        self.mock_vector_store_port.list_chunk_ids.return_value = [self.chunks[0].id, self.chunks[1].id]
+        self.service.checkpoint_port = checkpoint_port
+
+        # Act
+        await self.service.ingest_document(self.input_document, job_id=uuid4())
+
+        # Assert
+        self.mock_vector_store_port.list_chunk_ids.assert_not_called()
+        self.mock_embedding_port.embed_texts.assert_awaited_once_with([self.chunks[2].content])
+        vectors = self.mock_vector_store_port.upsert.await_args.args[0]
+        self.assertEqual([(v.id, v.vector[0]) for v in vectors], [(self.chunks[1].id, 9.0), (self.chunks[2].id, 0.0)])
@@ -0,0 +1,164 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.components.rag.domain.services.document_store_service import DocumentStoreService
+from src.components.rag.domain.services.ingestion_job_service import IngestionJobService, IngestionQueueFullError
+from src.components.rag.domain.value_objects import InputDocument, IngestionJobStatus, IngestionProgress, \
+    IngestionStage, StoreDocumentResult
+from src.components.rag.domain.value_objects.input_document import StoreDocumentStatus
+from src.components.rag.infrastructure.adapters.driven.ingestion_jobs import InMemoryIngestionJobRepository
+
+
+class TestIngestionJobService(unittest.IsolatedAsyncioTestCase):
+    """Test cases for background ingestion jobs."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.result = StoreDocumentResult(total_chunks=4, ingested_chunks=4, failed_chunks=0,
+                                          status=StoreDocumentStatus.SUCCESS)
+        self.mock_document_store_service = AsyncMock(spec=DocumentStoreService)
+        self.repository = InMemoryIngestionJobRepository(max_finished_jobs=10)
+        self.document = InputDocument(filename="doc.pdf", content=b"%PDF", type="application/pdf")
+        self.release = MagicMock()
+
+    def _service(self, max_workers: int = 1, max_queued: int = 10) -> IngestionJobService:
+        return IngestionJobService(
+            document_store_service=self.mock_document_store_service,
+            job_repository=self.repository,
+            max_workers=max_workers,
+            max_queued=max_queued,
+            release_document=self.release,
+        )
+
+    async def _wait_finished(self, service: IngestionJobService, job_id):
+        for _ in range(200):
+            job = await service.get_job(job_id)
+            if job.status in (IngestionJobStatus.SUCCEEDED, IngestionJobStatus.FAILED):
+                return job
+            await asyncio.sleep(0.005)
+        self.fail("Job did not finish")
+
+    async def test_submit_returns_queued_job_then_records_progress_and_result(self):
+        """Test that a job is returned at once, then tracks the ingestion until its result."""
+        # Arrange
+        seen_progress = []
+
+        async def ingest(document, on_progress, job_id, replace):
+            await on_progress(IngestionProgress(stage=IngestionStage.EMBEDDING, chunks_total=4, chunks_embedded=2))
+            seen_progress.append((await service.get_job(job.id)).progress)
+            return self.result
+
+        self.mock_document_store_service.ingest_document.side_effect = ingest
+        service = self._service()
+
+        # Act
+        job = await service.submit(self.document)
+        queued = await service.get_job(job.id)
+        await service.start()
+        finished = await self._wait_finished(service, job.id)
+        await service.close()
+
+        # Assert
+        self.assertEqual(queued.status, IngestionJobStatus.QUEUED)
+        self.assertEqual(seen_progress[0].chunks_embedded, 2)
+        self.assertEqual(finished.status, IngestionJobStatus.SUCCEEDED)
+        self.assertEqual(finished.result, self.result)
+        self.assertEqual(finished.progress.stage, IngestionStage.DONE)
+        self.assertEqual(self.mock_document_store_service.ingest_document.await_args.kwargs["job_id"], job.id)
+        self.release.assert_called_once_with(self.document)
+
+    async def test_replacing_job_replaces_the_stored_document(self):
+        """Test that the replacement requested at submission is recorded on the job and applied by the worker."""
+        # Arrange
+        self.mock_document_store_service.ingest_document.return_value = self.result
+        service = self._service()
+
+        # Act
+        job = await service.submit(self.document, replace=True)
+        await service.start()
+        finished = await self._wait_finished(service, job.id)
+        await service.close()
+
+        # Assert
+        self.assertTrue(finished.replace)
+        self.assertTrue(self.mock_document_store_service.ingest_document.await_args.kwargs["replace"])
+
+    async def test_failed_ingestion_marks_job_failed_and_releases_document(self):
+        """Test that an ingestion error is recorded on the job and does not stop the worker."""
+        # Arrange
+        self.mock_document_store_service.ingest_document.side_effect = [RuntimeError("boom"), self.result]
+        service = self._service()
+        await service.start()
+
+        # Act
+        failed = await self._wait_finished(service, (await service.submit(self.document)).id)
+        succeeded = await self._wait_finished(service, (await service.submit(self.document)).id)
+        await service.close()
+
+        # Assert
+        self.assertEqual(failed.status, IngestionJobStatus.FAILED)
+        self.assertEqual(failed.error, "boom")
+        self.assertEqual(succeeded.status, IngestionJobStatus.SUCCEEDED)
+        self.assertEqual(self.release.call_count, 2)
+
+    async def test_submit_rejects_when_queue_full(self):
+        """Test that submissions beyond the queue capacity are rejected."""
+        # Arrange
+        service = self._service(max_queued=1)
+        await service.submit(self.document)
+
+        # Act / Assert
+        with self.assertRaises(IngestionQueueFullError):
+            await service.submit(self.document)
+
+    async def test_unfinished_jobs_resume_on_next_start(self):
+        """Test that jobs left queued at shutdown are kept and ingested by the next start."""
+        # Arrange
+        self.mock_document_store_service.ingest_document.return_value = self.result
+        job = await self._service().submit(self.document)
+        await self._service().close()
+        self.release.assert_not_called()
+
+        # Act
+        service = self._service()
+        await service.start()
+        finished = await self._wait_finished(service, job.id)
+        await service.close()
+
+        # Assert
+        self.assertEqual(finished.status, IngestionJobStatus.SUCCEEDED)
+        self.mock_document_store_service.ingest_document.assert_awaited_once()
+        self.release.assert_called_once_with(self.document)
+
+    async def test_workers_bound_concurrent_ingestions(self):
+        """Test that no more documents than workers are ingested at once."""
+        # Arrange
+        running = 0
+        peak = 0
+
+        async def ingest(document, on_progress, job_id, replace):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return self.result
+
+        self.mock_document_store_service.ingest_document.side_effect = ingest
+        service = self._service(max_workers=2)
+        await service.start()
+
+        # Act
+        jobs = [await service.submit(self.document) for _ in range(5)]
+        for job in jobs:
+            await self._wait_finished(service, job.id)
+        await service.close()
+
+        # Assert
+        self.assertEqual(peak, 2)
+
+    async def test_get_job_returns_none_for_unknown_job(self):
+        """Test that an unknown job id yields None."""
+        self.assertIsNone(await self._service().get_job(uuid4()))
@@ -3,9 +3,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import uuid
 
 from src.components.rag.domain.services.query_service import QueryService
-from src.components.rag.domain.value_objects import Query, DocumentRetrieval, Message, Response, RAGResponse, Embedding
+from src.components.rag.domain.value_objects import Query, DocumentRetrieval, Message, Response, RAGResponse, Embedding, \
+    ResponseChunk, SourcesEvent, TokenEvent, CompletedEvent, SearchFilter, SearchOptions
 from src.components.rag.domain.value_objects.message_role import MessageRole
-from src.components.rag.application.ports.driven import VectorRetrieverPort, LLMPort, EmbeddingPort
+from src.components.rag.application.ports.driven import VectorRetrieverPort, LLMPort, EmbeddingPort, \
+    SemanticCachePort
 import unittest
 
 
@@ -55,7 +57,7 @@ class TestQueryService(unittest.TestCase):
         
         self.mock_embedding_port.embed_text.return_value = Embedding(
             model="text-embedding-ada-002",
-            embedding=[0.1, 0.2, 0.3, 0.4, 0.5],
+            vector=[0.1, 0.2, 0.3, 0.4, 0.5],
             prompt_tokens=10,
             completion_tokens=0,
             provider="openai"
@@ -329,3 +331,154 @@ class TestQueryService(unittest.TestCase):
         # Assert
         self.mock_vector_retriever_port.search.assert_called_once_with(empty_embedding)
         self.assertEqual(documents, [self.doc1, self.doc2])
+
+
+
+class TestQueryServiceSemanticCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the semantic answer cache path of QueryService."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.mock_vector_retriever_port = AsyncMock(spec=VectorRetrieverPort)
+        self.mock_llm_port = AsyncMock(spec=LLMPort)
+        self.mock_embedding_port = AsyncMock(spec=EmbeddingPort)
+        self.mock_semantic_cache_port = AsyncMock(spec=SemanticCachePort)
+        self.mock_rag_config = MagicMock()
+        self.mock_rag_config.system_prompt = "You are a helpful assistant."
+
+        self.doc = DocumentRetrieval(content="Document content", score=0.9)
+        self.mock_vector_retriever_port.search.return_value = [self.doc]
+        self.mock_llm_port.generate_response.return_value = Response(content="Generated answer")
+        self.mock_embedding_port.embed_text.return_value = Embedding(model="test-model", vector=[0.1, 0.2])
+
+        self.query_service = QueryService(
+            vector_retriever_port=self.mock_vector_retriever_port,
+            llm_port=self.mock_llm_port,
+            embedding_port=self.mock_embedding_port,
+            rag_config=self.mock_rag_config,
+            semantic_cache_port=self.mock_semantic_cache_port,
+        )
+
+    async def test_cache_hit_skips_retrieval_and_generation(self):
+        """Test that a cached answer is returned without calling the retriever or the LLM."""
+        cached = RAGResponse(content="Cached answer", sources=[self.doc], cached=True, cache_similarity=0.98)
+        self.mock_semantic_cache_port.lookup.return_value = cached
+
+        result = await self.query_service.process_query(Query(content="What is RAG?"))
+
+        self.assertTrue(result.cached)
+        self.assertEqual(result.sources, [self.doc])
+        self.mock_semantic_cache_port.lookup.assert_awaited_once_with([0.1, 0.2])
+        self.mock_vector_retriever_port.search.assert_not_called()
+        self.mock_llm_port.generate_response.assert_not_called()
+
+    async def test_cache_miss_stores_generated_answer(self):
+        """Test that a generated answer is stored in the cache."""
+        self.mock_semantic_cache_port.lookup.return_value = None
+
+        result = await self.query_service.process_query(Query(content="What is RAG?"))
+
+        self.assertFalse(result.cached)
+        self.assertEqual(result.content, "Generated answer")
+        args, kwargs = self.mock_semantic_cache_port.store.await_args
+        self.assertEqual(args, ([0.1, 0.2], result))
+        self.assertIn("retrieved_at", kwargs)
+
+    async def test_filtered_query_bypasses_cache(self):
+        """Test that a filtered query is retrieved with its filter and neither looked up nor stored in the cache."""
+        search_filter = SearchFilter(document_types=["application/pdf"])
+
+        result = await self.query_service.process_query(Query(content="What is RAG?", search_filter=search_filter))
+
+        self.assertEqual(result.content, "Generated answer")
+        self.mock_vector_retriever_port.search.assert_awaited_once_with(query=[0.1, 0.2], search_filter=search_filter,
+                                                                        options=None)
+        self.mock_semantic_cache_port.lookup.assert_not_called()
+        self.mock_semantic_cache_port.store.assert_not_called()
+
+    async def test_query_with_search_options_bypasses_cache(self):
+        """Test that the search options of a query reach the retriever and bypass the cache."""
+        search_options = SearchOptions(exact=True)
+
+        await self.query_service.process_query(Query(content="What is RAG?", search_options=search_options))
+
+        self.mock_vector_retriever_port.search.assert_awaited_once_with(query=[0.1, 0.2], search_filter=None,
+                                                                        options=search_options)
+        self.mock_semantic_cache_port.lookup.assert_not_called()
+        self.mock_semantic_cache_port.store.assert_not_called()
+
+
+class TestQueryServiceStreaming(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the streamed response path of QueryService."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.mock_vector_retriever_port = AsyncMock(spec=VectorRetrieverPort)
+        self.mock_llm_port = AsyncMock(spec=LLMPort)
+        self.mock_embedding_port = AsyncMock(spec=EmbeddingPort)
+        self.mock_semantic_cache_port = AsyncMock(spec=SemanticCachePort)
+        self.mock_rag_config = MagicMock()
+        self.mock_rag_config.system_prompt = "You are a helpful assistant."
+
+        self.doc = DocumentRetrieval(content="Document content", score=0.9)
+        self.mock_vector_retriever_port.search.return_value = [self.doc]
+        self.mock_embedding_port.embed_text.return_value = Embedding(model="test-model", vector=[0.1, 0.2])
+        self.mock_semantic_cache_port.lookup.return_value = None
+
+        async def stream_response(messages):
+            yield ResponseChunk(content="Hello", model_used="test-model")
+            yield ResponseChunk(content=" world", finish_reason="stop", model_used="test-model")
+            yield ResponseChunk(model_used="test-model", input_tokens=12, output_tokens=2)
+
+        self.mock_llm_port.stream_response = MagicMock(side_effect=stream_response)
+
+        self.query_service = QueryService(
+            vector_retriever_port=self.mock_vector_retriever_port,
+            llm_port=self.mock_llm_port,
+            embedding_port=self.mock_embedding_port,
+            rag_config=self.mock_rag_config,
+            semantic_cache_port=self.mock_semantic_cache_port,
+        )
+
+    async def _collect(self, query: str) -> list:
+        return [event async for event in self.query_service.stream_query(Query(content=query))]
+
+    async def test_stream_query_emits_sources_tokens_then_completed(self):
+        """Test the order and content of the streamed events."""
+        events = await self._collect("What is RAG?")
+
+        self.assertIsInstance(events[0], SourcesEvent)
+        self.assertEqual(events[0].sources, [self.doc])
+        self.assertEqual([e.content for e in events[1:-1]], ["Hello", " world"])
+        self.assertIsInstance(events[-1], CompletedEvent)
+        self.assertEqual(events[-1].model_used, "test-model")
+        self.assertEqual((events[-1].input_tokens, events[-1].output_tokens), (12, 2))
+        self.assertIsNotNone(events[-1].time_to_first_token_ms)
+        self.assertFalse(events[-1].cached)
+        self.mock_llm_port.generate_response.assert_not_called()
+
+    async def test_stream_query_stores_full_answer_in_cache(self):
+        """Test that the concatenated answer is stored in the semantic cache."""
+        await self._collect("What is RAG?")
+
+        args, kwargs = self.mock_semantic_cache_port.store.await_args
+        self.assertEqual(args[0], [0.1, 0.2])
+        self.assertEqual(args[1].content, "Hello world")
+        self.assertEqual(args[1].sources, [self.doc])
+
+    async def test_stream_query_replays_cached_answer(self):
+        """Test that a cached answer is streamed without retrieval or generation."""
+        self.mock_semantic_cache_port.lookup.return_value = RAGResponse(content="Cached answer", sources=[self.doc])
+
+        events = await self._collect("What is RAG?")
+
+        self.assertEqual([type(e) for e in events], [SourcesEvent, TokenEvent, CompletedEvent])
+        self.assertEqual(events[1].content, "Cached answer")
+        self.assertTrue(events[2].cached)
+        self.mock_vector_retriever_port.search.assert_not_called()
+        self.mock_llm_port.stream_response.assert_not_called()
+
+    async def test_stream_query_rejects_empty_query(self):
+        """Test that validation errors are raised before any event is emitted."""
+        with self.assertRaises(ValueError):
+            await self._collect("   ")
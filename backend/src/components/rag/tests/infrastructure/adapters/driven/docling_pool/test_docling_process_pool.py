@@ -0,0 +1,97 @@
+import asyncio
+import math
+import operator
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.components.rag.infrastructure.adapters.driven.docling_pool import DoclingProcessPool
+
+
+class TestDoclingProcessPool(unittest.IsolatedAsyncioTestCase):
+    """Test cases for DoclingProcessPool."""
+
+    def tearDown(self):
+        """Stop the worker processes between tests."""
+        self.pool.close()
+
+    async def test_run_returns_result_of_worker_process(self):
+        """Test that a task runs in a worker process and returns its result."""
+        self.pool = DoclingProcessPool(max_workers=2)
+
+        results = await asyncio.gather(*(self.pool.run(math.factorial, n) for n in range(5)))
+
+        self.assertEqual(results, [1, 1, 2, 6, 24])
+        self.assertEqual(self.pool.get_metrics()["completed"], 5)
+
+    async def test_run_keeps_event_loop_responsive(self):
+        """Test that a blocking task does not block other coroutines."""
+        self.pool = DoclingProcessPool(max_workers=1, enabled=False)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(self.pool.run(time.sleep, 0.2), ticker())
+
+        self.assertEqual(len(ticks), 5)
+        self.assertLess(ticks[-1] - ticks[0], 0.15)
+
+    async def test_run_bounds_tasks_handed_to_executor(self):
+        """Test that at most max_workers + max_pending tasks are admitted at a time."""
+        self.pool = DoclingProcessPool(max_workers=1, max_pending=1, enabled=False)
+        max_in_flight = 0
+
+        async def watch():
+            nonlocal max_in_flight
+            while True:
+                max_in_flight = max(max_in_flight, self.pool.get_metrics()["in_flight"])
+                await asyncio.sleep(0.005)
+
+        watcher = asyncio.create_task(watch())
+        await asyncio.gather(*(self.pool.run(time.sleep, 0.03) for _ in range(6)))
+        watcher.cancel()
+
+        self.assertEqual(max_in_flight, 2)
+
+    async def test_run_raises_task_errors(self):
+        """Test that exceptions raised in the worker are propagated and counted."""
+        self.pool = DoclingProcessPool(max_workers=1)
+
+        with self.assertRaises(ZeroDivisionError):
+            await self.pool.run(operator.truediv, 1, 0)
+        self.assertEqual(self.pool.get_metrics()["failed"], 1)
+
+    async def test_run_abandons_task_after_timeout(self):
+        """Test that a task exceeding the timeout is abandoned but keeps its slot until it finishes."""
+        self.pool = DoclingProcessPool(max_workers=1, max_pending=0, task_timeout_seconds=0.05, enabled=False)
+        started = time.perf_counter()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.pool.run(time.sleep, 0.3)
+        self.assertEqual(self.pool.get_metrics()["timed_out"], 1)
+        self.assertEqual(self.pool.get_metrics()["in_flight"], 1)
+
+        await self.pool.run(time.sleep, 0)
+
+        self.assertGreaterEqual(time.perf_counter() - started, 0.3)
+        self.assertEqual(self.pool.get_metrics()["in_flight"], 0)
+
+    async def test_start_spawns_every_worker(self):
+        """Test that the warmup starts all worker processes upfront."""
+        self.pool = DoclingProcessPool(max_workers=2)
+
+        await self.pool.start()
+
+        self.assertEqual(len(self.pool._executor._processes), 2)
+
+    async def test_start_runs_initializer_when_disabled(self):
+        """Test that the warmup runs the initializer in-process when worker processes are disabled."""
+        initializer = MagicMock()
+        self.pool = DoclingProcessPool(initializer=initializer, initargs=(("pdf",),), enabled=False)
+
+        await self.pool.start()
+
+        initializer.assert_called_once_with(("pdf",))
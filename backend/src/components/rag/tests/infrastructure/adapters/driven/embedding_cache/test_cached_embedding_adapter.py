@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock
+
+from src.components.rag.application.ports.driven import EmbeddingPort
+from src.components.rag.domain.value_objects import Embedding
+from src.components.rag.infrastructure.adapters.driven.embedding_cache import CachedEmbeddingAdapter, \
+    EmbeddingCacheStore
+
+
+class TestCachedEmbeddingAdapter(unittest.IsolatedAsyncioTestCase):
+    """Test cases for CachedEmbeddingAdapter and its two-tier store."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.sqlite_path = os.path.join(self.tmp_dir.name, "cache.sqlite3")
+
+        self.mock_embedding_port = AsyncMock(spec=EmbeddingPort)
+        self.mock_embedding_port.model = "ollama/nomic-embed-text:v1.5"
+        self.mock_embedding_port.fallback_dimension = 768
+        self.mock_embedding_port.get_metrics.return_value = {}
+        self.mock_embedding_port.embed_texts.side_effect = lambda texts: [
+            Embedding(model="test-model", vector=[float(len(text)), 0.5]) for text in texts
+        ]
+        self.stores = []
+
+    def tearDown(self):
+        """Close stores and remove the temporary directory."""
+        for store in self.stores:
+            store.close()
+        self.tmp_dir.cleanup()
+
+    def _adapter(self, memory_max_bytes: int = 1024 * 1024, sqlite_path: str = None) -> CachedEmbeddingAdapter:
+        """Build a cached adapter around the mocked embedding port."""
+        store = EmbeddingCacheStore(memory_max_bytes=memory_max_bytes, sqlite_path=sqlite_path)
+        self.stores.append(store)
+        return CachedEmbeddingAdapter(embedding_port=self.mock_embedding_port, store=store)
+
+    async def test_embed_texts_only_embeds_unique_misses(self):
+        """Test that duplicates and cached texts are not sent to the wrapped port."""
+        adapter = self._adapter()
+
+        first = await adapter.embed_texts(["header", "body", "header"])
+        second = await adapter.embed_texts(["header", "new text"])
+
+        self.assertEqual([e.vector for e in first], [[6.0, 0.5], [4.0, 0.5], [6.0, 0.5]])
+        self.assertEqual([e.vector for e in second], [[6.0, 0.5], [8.0, 0.5]])
+        self.assertEqual([call.args[0] for call in self.mock_embedding_port.embed_texts.await_args_list],
+                         [["header", "body"], ["new text"]])
+        metrics = adapter.get_metrics()["cache"]
+        self.assertEqual(metrics["memory_hits"], 1)
+        self.assertEqual(metrics["misses"], 3)
+
+    async def test_embed_text_uses_cache(self):
+        """Test that single text embeddings go through the cache."""
+        adapter = self._adapter()
+
+        await adapter.embed_text("hello")
+        embedding = await adapter.embed_text("hello")
+
+        self.assertEqual(embedding.vector, [5.0, 0.5])
+        self.mock_embedding_port.embed_texts.assert_awaited_once_with(["hello"])
+
+    async def test_disk_tier_survives_restart(self):
+        """Test that a new store on the same SQLite file serves previous embeddings."""
+        await self._adapter(sqlite_path=self.sqlite_path).embed_texts(["persisted"])
+
+        restarted = self._adapter(sqlite_path=self.sqlite_path)
+        embeddings = await restarted.embed_texts(["persisted"])
+
+        self.assertEqual(embeddings[0].vector, [9.0, 0.5])
+        self.mock_embedding_port.embed_texts.assert_awaited_once()
+        self.assertEqual(restarted.get_metrics()["cache"]["disk_hits"], 1)
+
+    async def test_cache_is_keyed_by_model(self):
+        """Test that embeddings of another model are not reused."""
+        sqlite_adapter = self._adapter(sqlite_path=self.sqlite_path)
+        await sqlite_adapter.embed_texts(["text"])
+
+        self.mock_embedding_port.model = "ollama/other-model"
+        other_model_adapter = self._adapter(sqlite_path=self.sqlite_path)
+        await other_model_adapter.embed_texts(["text"])
+
+        self.assertEqual(self.mock_embedding_port.embed_texts.await_count, 2)
+
+    async def test_memory_tier_is_bounded_by_bytes(self):
+        """Test that the memory tier evicts least recently used entries over its byte budget."""
+        adapter = self._adapter(memory_max_bytes=400)
+
+        await adapter.embed_texts(["a", "bb", "ccc"])
+
+        metrics = adapter.get_metrics()["cache"]
+        self.assertLessEqual(metrics["memory_bytes"], 400)
+        self.assertEqual(metrics["memory_entries"], 2)
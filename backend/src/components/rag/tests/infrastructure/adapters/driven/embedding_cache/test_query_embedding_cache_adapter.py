@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import AsyncMock
+
+from src.components.rag.application.ports.driven import EmbeddingPort
+from src.components.rag.domain.value_objects import Embedding
+from src.components.rag.infrastructure.adapters.driven.embedding_cache import QueryEmbeddingCacheAdapter
+
+
+class TestQueryEmbeddingCacheAdapter(unittest.IsolatedAsyncioTestCase):
+    """Test cases for QueryEmbeddingCacheAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.now = 0.0
+        self.mock_embedding_port = AsyncMock(spec=EmbeddingPort)
+        self.mock_embedding_port.model = "ollama/nomic-embed-text:v1.5"
+        self.mock_embedding_port.get_metrics.return_value = {}
+        self.mock_embedding_port.embed_text.side_effect = lambda text: Embedding(model="test-model", vector=[1.0])
+        self.mock_embedding_port.embed_texts.side_effect = lambda texts: [
+            Embedding(model="test-model", vector=[float(len(text))]) for text in texts
+        ]
+        self.adapter = QueryEmbeddingCacheAdapter(
+            embedding_port=self.mock_embedding_port,
+            max_entries=2,
+            ttl_seconds=60,
+            clock=lambda: self.now,
+        )
+
+    async def test_repeated_normalized_query_hits_cache(self):
+        """Test that queries differing only by case and whitespace share an entry."""
+        await self.adapter.embed_text("What is  RAG?")
+        await self.adapter.embed_text("  what is rag? ")
+
+        self.mock_embedding_port.embed_text.assert_awaited_once_with("What is  RAG?")
+        self.assertEqual(self.adapter.get_metrics()["query_cache"]["hits"], 1)
+
+    async def test_expired_entry_is_recomputed(self):
+        """Test that entries are recomputed after their TTL."""
+        await self.adapter.embed_text("question")
+        self.now = 61.0
+        await self.adapter.embed_text("question")
+
+        self.assertEqual(self.mock_embedding_port.embed_text.await_count, 2)
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache keeps at most max_entries entries."""
+        await self.adapter.embed_text("first")
+        await self.adapter.embed_text("second")
+        await self.adapter.embed_text("first")
+        await self.adapter.embed_text("third")
+        await self.adapter.embed_text("first")
+        await self.adapter.embed_text("second")
+
+        self.assertEqual([call.args[0] for call in self.mock_embedding_port.embed_text.await_args_list],
+                         ["first", "second", "third", "second"])
+
+    async def test_embed_texts_embeds_misses_in_one_call(self):
+        """Test that batched lookups only embed the missing queries together."""
+        await self.adapter.embed_text("cached")
+
+        embeddings = await self.adapter.embed_texts(["cached", "new one", "New  one"])
+
+        self.mock_embedding_port.embed_texts.assert_awaited_once_with(["new one"])
+        self.assertEqual([e.vector for e in embeddings], [[1.0], [7.0], [7.0]])
@@ -0,0 +1,138 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from src.components.rag.domain.value_objects import DocumentRetrieval, Embedding, IngestionJob, \
+    IngestionJobStatus, InputDocument
+from src.components.rag.domain.value_objects.extracted_content import ExtractedContent
+from src.components.rag.infrastructure.adapters.driven.ingestion_jobs import SqliteIngestionJobStore
+
+
+class StructuredDocument(BaseModel):
+    """Stand-in for the structured document of an extraction backend."""
+    body: str
+
+
+class TestSqliteIngestionJobStore(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the durable store of ingestion jobs and checkpoints."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.sqlite_path = os.path.join(self.tmp_dir.name, "jobs.sqlite3")
+        self.stores = []
+
+    def tearDown(self):
+        """Close stores and remove the temporary directory."""
+        for store in self.stores:
+            store.close()
+        self.tmp_dir.cleanup()
+
+    def _store(self, max_finished_jobs: int = 10) -> SqliteIngestionJobStore:
+        """Open a store on the test database, as a new process would."""
+        store = SqliteIngestionJobStore(sqlite_path=self.sqlite_path, max_finished_jobs=max_finished_jobs)
+        self.stores.append(store)
+        return store
+
+    async def test_unfinished_jobs_and_documents_survive_reopening(self):
+        """Test that queued jobs are listed with their documents after a restart."""
+        # Arrange
+        on_disk = InputDocument(filename="a.pdf", path="/spool/upload-1/a.pdf", type="application/pdf")
+        in_memory = InputDocument(filename="b.txt", content=b"hello", type="text/plain")
+        first, second = IngestionJob(filename="a.pdf"), IngestionJob(filename="b.txt")
+        store = self._store()
+        await store.add(first, on_disk)
+        await store.add(second, in_memory)
+        await store.save(first.model_copy(update={"status": IngestionJobStatus.RUNNING}))
+
+        # Act
+        unfinished = await self._store().list_unfinished()
+
+        # Assert
+        self.assertEqual([job.id for job, _ in unfinished], [first.id, second.id])
+        self.assertEqual(unfinished[0][0].status, IngestionJobStatus.RUNNING)
+        self.assertEqual([document for _, document in unfinished], [on_disk, in_memory])
+
+    async def test_checkpoints_survive_reopening(self):
+        """Test that extracted content, chunks and leading embedding groups are loaded back."""
+        # Arrange
+        job_id = uuid4()
+        chunks = [DocumentRetrieval(content=f"chunk {i}", metadata={"chunk_index": i}) for i in range(3)]
+        store = self._store()
+        await store.save_extracted(job_id, ExtractedContent(text="text", metadata={"filename": "a.pdf"},
+                                                            document=StructuredDocument(body="body")))
+        extracted = (await self._store().load(job_id)).extracted
+        stored_chunk_ids = [uuid4(), uuid4()]
+        await store.save_chunks(job_id, chunks, stored_chunk_ids)
+        await store.save_embeddings(job_id, 0, [Embedding(model="m", vector=[0.5, 1.0]),
+                                                Embedding(model="m", vector=[1.5, 2.0])])
+        # A group saved after a missing one cannot be used
+        await store.save_embeddings(job_id, 3, [Embedding(model="m", vector=[9.0, 9.0])])
+
+        # Act
+        checkpoint = await self._store().load(job_id)
+
+        # Assert
+        self.assertEqual(extracted.text, "text")
+        self.assertEqual(extracted.document, StructuredDocument(body="body"))
+        self.assertIsNone(checkpoint.extracted)
+        self.assertEqual(checkpoint.chunks, chunks)
+        self.assertEqual(checkpoint.stored_chunk_ids, stored_chunk_ids)
+        self.assertEqual([e.vector for e in checkpoint.embeddings], [[0.5, 1.0], [1.5, 2.0]])
+
+    async def test_database_of_a_previous_version_is_migrated(self):
+        """Test that the chunk checkpoints of an older schema gain their stored chunk ids column."""
+        # Arrange
+        job_id = uuid4()
+        with sqlite3.connect(self.sqlite_path) as db:
+            db.execute("CREATE TABLE chunk_checkpoints (job_id TEXT PRIMARY KEY, chunks TEXT NOT NULL)")
+            db.execute("INSERT INTO chunk_checkpoints VALUES (?, ?)", (str(job_id), "[]"))
+        db.close()
+
+        # Act
+        store = self._store()
+        legacy = await store.load(job_id)
+        await store.save_chunks(job_id, [], [uuid4()])
+
+        # Assert
+        self.assertEqual(legacy.chunks, [])
+        self.assertIsNone(legacy.stored_chunk_ids)
+        self.assertEqual(len((await store.load(job_id)).stored_chunk_ids), 1)
+
+    async def test_finishing_a_job_drops_its_document_and_checkpoints(self):
+        """Test that a finished job is kept for polling while its resume state is removed."""
+        # Arrange
+        job = IngestionJob(filename="a.pdf")
+        store = self._store()
+        await store.add(job, InputDocument(filename="a.pdf", content=b"%PDF", type="application/pdf"))
+        await store.save_chunks(job.id, [DocumentRetrieval(content="chunk")])
+        await store.save_embeddings(job.id, 0, [Embedding(model="m", vector=[1.0])])
+
+        # Act
+        await store.save(job.model_copy(update={"status": IngestionJobStatus.SUCCEEDED}))
+
+        # Assert
+        self.assertEqual((await store.get(job.id)).status, IngestionJobStatus.SUCCEEDED)
+        self.assertEqual(await store.list_unfinished(), [])
+        checkpoint = await store.load(job.id)
+        self.assertIsNone(checkpoint.chunks)
+        self.assertEqual(checkpoint.embeddings, [])
+
+    async def test_oldest_finished_jobs_are_evicted(self):
+        """Test that only the most recent finished jobs are kept."""
+        # Arrange
+        store = self._store(max_finished_jobs=2)
+        jobs = [IngestionJob(filename=f"{i}.pdf") for i in range(3)]
+
+        # Act
+        for job in jobs:
+            await store.add(job, InputDocument(filename=job.filename, content=b"x", type="application/pdf"))
+            await store.save(job.model_copy(update={"status": IngestionJobStatus.FAILED}))
+
+        # Assert
+        self.assertIsNone(await store.get(jobs[0].id))
+        self.assertIsNotNone(await store.get(jobs[2].id))
@@ -0,0 +1,137 @@
+import asyncio
+import gc
+import unittest
+
+import httpx
+
+from src.components.rag.domain.value_objects import Embedding
+from src.components.rag.infrastructure.adapters.driven.llm.embedding_scheduler import AdaptiveEmbeddingScheduler
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    """Build an httpx.HTTPStatusError with the given status code."""
+    request = httpx.Request("POST", "http://test-url.com/embeddings")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status_code, request=request))
+
+
+class TestAdaptiveEmbeddingScheduler(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AdaptiveEmbeddingScheduler."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.texts = [f"text {i}" for i in range(20)]
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    async def _embed_batch(self, batch):
+        """Fake embedding backend recording concurrency and batches."""
+        self.calls.append(list(batch))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [Embedding(model="test-model", vector=[float(text.split()[1])]) for text in batch]
+
+    async def test_run_keeps_batches_in_flight_and_preserves_order(self):
+        """Test that several batches run concurrently and results keep input order."""
+        scheduler = AdaptiveEmbeddingScheduler(max_batch_size=2, max_batch_tokens=100,
+                                               initial_concurrency=3, max_concurrency=3)
+
+        embeddings = await scheduler.run(self.texts, self._embed_batch)
+
+        self.assertEqual([e.vector[0] for e in embeddings], [float(i) for i in range(20)])
+        self.assertEqual(self.max_in_flight, 3)
+        self.assertTrue(all(len(batch) <= 2 for batch in self.calls))
+
+    async def test_concurrent_runs_share_the_batches_in_flight(self):
+        """Test that the concurrency bounds the batches of all the concurrent calls together."""
+        scheduler = AdaptiveEmbeddingScheduler(max_batch_size=2, max_batch_tokens=100, initial_concurrency=3,
+                                               max_concurrency=3, adaptive=False)
+
+        first, second = await asyncio.gather(scheduler.run(self.texts, self._embed_batch),
+                                             scheduler.run(self.texts[:10], self._embed_batch))
+
+        self.assertEqual(self.max_in_flight, 3)
+        self.assertEqual([e.vector[0] for e in first], [float(i) for i in range(20)])
+        self.assertEqual([e.vector[0] for e in second], [float(i) for i in range(10)])
+
+    async def test_run_reads_every_failed_batch_before_raising(self):
+        """Test that the errors of all the completed batches are retrieved when giving up."""
+        scheduler = AdaptiveEmbeddingScheduler(max_batch_size=2, max_batch_tokens=100, initial_concurrency=3,
+                                               max_concurrency=3, retry_backoff=0)
+        unretrieved = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unretrieved.append(context))
+
+        all_started = asyncio.Event()
+        started = []
+
+        async def embed_batch(batch):
+            # The three batches fail together
+            started.append(batch)
+            if len(started) == 3:
+                all_started.set()
+            await all_started.wait()
+            raise _status_error(400)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await scheduler.run(self.texts, embed_batch)
+        gc.collect()
+
+        self.assertEqual(unretrieved, [])
+        self.assertEqual(scheduler.get_metrics()["errors"], 3)
+
+    async def test_run_increases_concurrency_on_fast_batches(self):
+        """Test the additive increase of concurrency up to its maximum."""
+        scheduler = AdaptiveEmbeddingScheduler(max_batch_size=2, max_batch_tokens=100,
+                                               initial_concurrency=1, max_concurrency=4)
+
+        await scheduler.run(self.texts, self._embed_batch)
+
+        self.assertEqual(scheduler.get_metrics()["concurrency"], 4)
+        self.assertEqual(scheduler.get_metrics()["batches"], 10)
+
+    async def test_run_backs_off_and_retries_on_throttling(self):
+        """Test that a 429 halves the batch size and the batch is retried."""
+        scheduler = AdaptiveEmbeddingScheduler(max_batch_size=4, max_batch_tokens=100, initial_concurrency=2,
+                                               max_concurrency=2, retry_backoff=0, adaptive=True)
+        throttled = {"done": False}
+
+        async def embed_batch(batch):
+            if not throttled["done"]:
+                throttled["done"] = True
+                raise _status_error(429)
+            return await self._embed_batch(batch)
+
+        embeddings = await scheduler.run(self.texts[:8], embed_batch)
+
+        metrics = scheduler.get_metrics()
+        self.assertEqual([e.vector[0] for e in embeddings], [float(i) for i in range(8)])
+        self.assertEqual(metrics["throttled"], 1)
+        self.assertEqual(metrics["retries"], 1)
+        # The throttled batch is retried with the halved batch size
+        self.assertIn(["text 0", "text 1"], self.calls)
+        self.assertIn(["text 2", "text 3"], self.calls)
+
+    async def test_run_raises_non_retryable_errors(self):
+        """Test that client errors are not retried."""
+        scheduler = AdaptiveEmbeddingScheduler(max_batch_size=4, max_batch_tokens=100, retry_backoff=0)
+
+        async def embed_batch(batch):
+            raise _status_error(400)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await scheduler.run(self.texts, embed_batch)
+        self.assertEqual(scheduler.get_metrics()["retries"], 0)
+
+    async def test_run_gives_up_after_max_retries(self):
+        """Test that a batch failing repeatedly eventually raises."""
+        scheduler = AdaptiveEmbeddingScheduler(max_batch_size=4, max_batch_tokens=100,
+                                               max_retries=2, retry_backoff=0)
+
+        async def embed_batch(batch):
+            raise _status_error(503)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await scheduler.run(self.texts[:1], embed_batch)
+        self.assertEqual(scheduler.get_metrics()["retries"], 2)
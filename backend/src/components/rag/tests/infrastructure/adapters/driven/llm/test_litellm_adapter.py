@@ -1,9 +1,15 @@
+import asyncio
+import json
 import unittest
 from unittest.mock import patch, AsyncMock
+import httpx
 import pytest
 
 from src.components.rag.infrastructure.adapters.driven.litellm_proxy.litellm_base_adapter import LiteLLMBaseAdapter
 from src.components.rag.infrastructure.adapters.driven.litellm_proxy.litellm_config import LiteLLMConfig
+from src.components.rag.infrastructure.adapters.driven.llm.litellm_embedding_adapter import LiteLLMEmbeddingAdapter
+from src.components.rag.infrastructure.adapters.driven.llm.litellm_llm_adapter import LiteLLMAdapter
+from src.components.rag.domain.value_objects import Message
 
 
 class TestLiteLLMBaseAdapter(unittest.TestCase):
@@ -221,4 +227,158 @@ class TestLiteLLMBaseAdapter(unittest.TestCase):
         args, kwargs = mock_post.call_args
         self.assertEqual(kwargs["url"], "http://test-url.com/chat/completions")
         self.assertEqual(kwargs["headers"], adapter.headers)
-        self.assertEqual(kwargs["json"], {"model": "test-model", "messages": []})
\ No newline at end of file
+        self.assertEqual(kwargs["json"], {"model": "test-model", "messages": []})
+
+class TestLiteLLMBaseAdapterHttpClient(unittest.TestCase):
+    """Test cases for the shared HTTP client of LiteLLMBaseAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_config = LiteLLMConfig(
+            api_key="test-api-key",
+            base_url="http://test-url.com",
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=12.0,
+        )
+
+    def tearDown(self):
+        """Close the shared HTTP client between tests."""
+        asyncio.run(LiteLLMBaseAdapter.close_http_client())
+
+    def test_http_client_is_shared_between_adapters(self):
+        """Test that all adapters reuse the same pooled HTTP client."""
+        first = LiteLLMBaseAdapter(config=self.test_config)
+        second = LiteLLMBaseAdapter(config=self.test_config)
+
+        self.assertIs(first.http_client, second.http_client)
+        self.assertIs(first.http_client, LiteLLMBaseAdapter.open_http_client(self.test_config))
+
+    def test_http_client_is_not_shared_between_different_pool_limits(self):
+        """Test that an adapter configured with other pool limits gets its own client, with its limits."""
+        other_config = self.test_config.model_copy(update={"max_connections": 20})
+
+        client = LiteLLMBaseAdapter(config=self.test_config).http_client
+        other_client = LiteLLMBaseAdapter(config=other_config).http_client
+
+        self.assertIsNot(client, other_client)
+        self.assertEqual(other_client._transport._pool._max_connections, 20)
+        self.assertIs(client, LiteLLMBaseAdapter.open_http_client(self.test_config.model_copy(update={"timeout": 5.0})))
+
+    def test_http_client_uses_configured_pool_limits(self):
+        """Test that the connection pool honours the configured limits."""
+        client = LiteLLMBaseAdapter.open_http_client(self.test_config)
+        pool = client._transport._pool
+
+        self.assertEqual(pool._max_connections, 7)
+        self.assertEqual(pool._max_keepalive_connections, 3)
+        self.assertEqual(pool._keepalive_expiry, 12.0)
+
+    def test_close_http_client_recreates_on_next_use(self):
+        """Test that a closed client is replaced on next access."""
+        client = LiteLLMBaseAdapter.open_http_client(self.test_config)
+
+        asyncio.run(LiteLLMBaseAdapter.close_http_client())
+
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(client, LiteLLMBaseAdapter.open_http_client(self.test_config))
+
+
+class TestLiteLLMEmbeddingAdapterBatching(unittest.IsolatedAsyncioTestCase):
+    """Test cases for batched embeddings of LiteLLMEmbeddingAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_config = LiteLLMConfig(
+            api_key="test-api-key",
+            embedding_batch_size=2,
+            embedding_batch_max_tokens=100,
+        )
+        self.adapter = LiteLLMEmbeddingAdapter(config=self.test_config)
+
+    @staticmethod
+    def _embeddings_response(payload: dict) -> dict:
+        """Build an embeddings API response with one vector per input, in reverse order."""
+        data = [
+            {'object': 'embedding', 'embedding': [float(len(text))], 'index': i}
+            for i, text in enumerate(payload["input"])
+        ]
+        return {'data': list(reversed(data)), 'model': 'ollama/nomic-embed-text:v1.5', 'usage': {'prompt_tokens': 3}}
+
+    async def test_embed_texts_groups_inputs_by_batch_size(self):
+        """Test that texts are sent in batches and returned in input order."""
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        with patch.object(LiteLLMEmbeddingAdapter, '_make_request', new_callable=AsyncMock) as mock_make_request:
+            mock_make_request.side_effect = lambda endpoint, payload: self._embeddings_response(payload)
+            embeddings = await self.adapter.embed_texts(texts)
+
+        self.assertEqual(mock_make_request.await_count, 3)
+        self.assertEqual([call.args[1]["input"] for call in mock_make_request.await_args_list],
+                         [["a", "bb"], ["ccc", "dddd"], ["eeeee"]])
+        self.assertEqual([e.vector for e in embeddings], [[1.0], [2.0], [3.0], [4.0], [5.0]])
+
+    async def test_embed_texts_honours_token_budget(self):
+        """Test that a batch is closed before exceeding the token budget."""
+        texts = ["x" * 360, "y" * 80, "z" * 8]  # ~90, ~20 and ~2 estimated tokens
+
+        with patch.object(LiteLLMEmbeddingAdapter, '_make_request', new_callable=AsyncMock) as mock_make_request:
+            mock_make_request.side_effect = lambda endpoint, payload: self._embeddings_response(payload)
+            embeddings = await self.adapter.embed_texts(texts)
+
+        self.assertEqual([len(call.args[1]["input"]) for call in mock_make_request.await_args_list], [1, 2])
+        self.assertEqual(len(embeddings), 3)
+
+    async def test_embed_texts_with_empty_input(self):
+        """Test that no request is sent for an empty input."""
+        with patch.object(LiteLLMEmbeddingAdapter, '_make_request', new_callable=AsyncMock) as mock_make_request:
+            embeddings = await self.adapter.embed_texts([])
+
+        self.assertEqual(embeddings, [])
+        mock_make_request.assert_not_called()
+
+
+class TestLiteLLMAdapterStreaming(unittest.IsolatedAsyncioTestCase):
+    """Test cases for streamed chat completions of LiteLLMAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_config = LiteLLMConfig(api_key="test-api-key", base_url="http://test-url.com", chat_model="test-model")
+        self.requests = []
+        body = "\n\n".join([
+            'data: {"choices": [{"delta": {"role": "assistant"}, "finish_reason": null}]}',
+            'data: {"choices": [{"delta": {"content": "Hello"}, "finish_reason": null}]}',
+            'data: {"choices": [{"delta": {"content": " world"}, "finish_reason": "stop"}]}',
+            'data: {"choices": [], "usage": {"prompt_tokens": 12, "completion_tokens": 2}}',
+            'data: [DONE]',
+        ]) + "\n\n"
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+        LiteLLMBaseAdapter._http_clients[LiteLLMBaseAdapter._pool_key(self.test_config)] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler))
+        self.adapter = LiteLLMAdapter(config=self.test_config)
+
+    async def asyncTearDown(self):
+        """Close the shared HTTP client between tests."""
+        await LiteLLMBaseAdapter.close_http_client()
+
+    async def test_stream_response_yields_content_then_usage(self):
+        """Test that deltas are yielded in order and usage is reported on the last chunk."""
+        chunks = [chunk async for chunk in self.adapter.stream_response([Message(role="user", content="Hi")])]
+
+        self.assertEqual([c.content for c in chunks], ["Hello", " world", ""])
+        self.assertEqual(chunks[1].finish_reason, "stop")
+        self.assertEqual((chunks[-1].input_tokens, chunks[-1].output_tokens), (12, 2))
+        self.assertEqual(chunks[0].model_used, "test-model")
+
+    async def test_stream_response_requests_streaming_with_usage(self):
+        """Test that the request asks the proxy for a stream including usage."""
+        [chunk async for chunk in self.adapter.stream_response([Message(role="user", content="Hi")])]
+
+        payload = json.loads(self.requests[0].content)
+        self.assertTrue(payload["stream"])
+        self.assertEqual(payload["stream_options"], {"include_usage": True})
+        self.assertEqual(str(self.requests[0].url), "http://test-url.com/chat/completions")
@@ -0,0 +1,55 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.components.rag.domain.value_objects import DocumentRetrieval, RAGResponse
+from src.components.rag.infrastructure.adapters.driven.semantic_cache import InMemorySemanticCacheAdapter
+
+
+class TestInMemorySemanticCacheAdapter(unittest.IsolatedAsyncioTestCase):
+    """Test cases for InMemorySemanticCacheAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.now = 0.0
+        self.cache = InMemorySemanticCacheAdapter(similarity_threshold=0.95, max_entries=2, ttl_seconds=60,
+                                                  clock=lambda: self.now)
+        self.response = RAGResponse(content="Answer", sources=[DocumentRetrieval(content="Source")])
+        self.retrieved_at = datetime.now(timezone.utc)
+
+    async def test_similar_query_hits_with_sources(self):
+        """Test that a near-identical query returns the stored answer marked as cached."""
+        await self.cache.store([1.0, 0.0, 0.0], self.response, retrieved_at=self.retrieved_at)
+
+        hit = await self.cache.lookup([0.99, 0.05, 0.0])
+
+        self.assertTrue(hit.cached)
+        self.assertGreater(hit.cache_similarity, 0.95)
+        self.assertEqual(hit.sources, self.response.sources)
+
+    async def test_dissimilar_query_misses(self):
+        """Test that a query below the threshold is not served."""
+        await self.cache.store([1.0, 0.0, 0.0], self.response, retrieved_at=self.retrieved_at)
+
+        self.assertIsNone(await self.cache.lookup([0.0, 1.0, 0.0]))
+
+    async def test_invalidate_drops_answers_and_rejects_stale_ones(self):
+        """Test that a write invalidates entries and answers retrieved before it."""
+        await self.cache.store([1.0, 0.0, 0.0], self.response, retrieved_at=self.retrieved_at)
+
+        await self.cache.invalidate()
+        await self.cache.store([1.0, 0.0, 0.0], self.response, retrieved_at=self.retrieved_at - timedelta(seconds=1))
+
+        self.assertIsNone(await self.cache.lookup([1.0, 0.0, 0.0]))
+        self.assertEqual(self.cache.get_metrics()["entries"], 0)
+
+    async def test_entries_expire_and_are_bounded(self):
+        """Test TTL expiry and capacity eviction."""
+        await self.cache.store([1.0, 0.0, 0.0], self.response, retrieved_at=self.retrieved_at)
+        await self.cache.store([0.0, 1.0, 0.0], self.response, retrieved_at=self.retrieved_at)
+        await self.cache.store([0.0, 0.0, 1.0], self.response, retrieved_at=self.retrieved_at)
+
+        self.assertIsNone(await self.cache.lookup([1.0, 0.0, 0.0]))
+        self.assertIsNotNone(await self.cache.lookup([0.0, 0.0, 1.0]))
+
+        self.now = 61.0
+        self.assertIsNone(await self.cache.lookup([0.0, 0.0, 1.0]))
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from fastapi import UploadFile
+
+from src.components.rag.domain.value_objects import InputDocument
+
+from src.components.rag.infrastructure.api.v1.upload_spool import UploadConfig, UploadTooLargeError, spool_upload, \
+    spool_upload_to_disk, discard_spooled_upload
+
+
+class TestSpoolUpload(unittest.IsolatedAsyncioTestCase):
+    """Test cases for spooling uploads to a local path."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.spool_dir = tempfile.mkdtemp()
+        self.config = UploadConfig(max_size_bytes=1000, spool_dir=self.spool_dir, copy_chunk_bytes=64)
+
+    def _upload(self, content: bytes, filename: str = "report.pdf") -> UploadFile:
+        return UploadFile(file=BytesIO(content), filename=filename, headers={"content-type": "application/pdf"})
+
+    async def test_spool_upload_references_file_under_original_name(self):
+        """Test that the document references a spooled copy of the upload by path."""
+        async with spool_upload(self._upload(b"%PDF" * 100), self.config) as document:
+            self.assertIsNone(document.content)
+            self.assertEqual(os.path.basename(document.path), "report.pdf")
+            self.assertEqual(document.type, "application/pdf")
+            with open(document.path, "rb") as spooled:
+                self.assertEqual(spooled.read(), b"%PDF" * 100)
+
+        self.assertFalse(os.path.exists(document.path))
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    async def test_spool_upload_rejects_too_large_upload(self):
+        """Test that an upload over the size cap is rejected and nothing is left behind."""
+        with self.assertRaises(UploadTooLargeError):
+            async with spool_upload(self._upload(b"x" * 1001), self.config):
+                pass
+
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    async def test_spool_upload_strips_directories_from_filename(self):
+        """Test that a client-provided path cannot escape the spool directory."""
+        async with spool_upload(self._upload(b"data", filename="../../etc/passwd"), self.config) as document:
+            self.assertTrue(document.path.startswith(self.spool_dir))
+            self.assertEqual(os.path.basename(document.path), "passwd")
+
+    async def test_spool_upload_to_disk_keeps_file_until_discarded(self):
+        """Test that a file spooled for a background job survives until it is discarded."""
+        document = await spool_upload_to_disk(self._upload(b"data"), self.config)
+        self.assertTrue(os.path.exists(document.path))
+
+        discard_spooled_upload(document)
+
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    async def test_discard_spooled_upload_leaves_files_outside_spool_dir(self):
+        """Test that only documents spooled under the given directory are removed."""
+        outside_dir = tempfile.mkdtemp()
+        path = os.path.join(outside_dir, "report.pdf")
+        open(path, "wb").close()
+        document = InputDocument(filename="report.pdf", path=path, type="application/pdf")
+
+        discard_spooled_upload(document, spool_dir=self.spool_dir)
+
+        self.assertTrue(os.path.exists(path))
@@ -0,0 +1,170 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from qdrant_client import AsyncQdrantClient, models
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+from src.components.rag.infrastructure.persistence import QdrantVectorRetrieverAdapter, QdrantVectorStoreAdapter
+from src.components.rag.infrastructure.persistence.qdrant_vector_base import QdrantVectorBase
+
+
+class TestQdrantVectorBaseClient(unittest.TestCase):
+    """Test cases for the Qdrant client of QdrantVectorBase."""
+
+    def test_adapters_share_an_injected_client(self):
+        """Test that the store and retriever adapters reuse the injected client."""
+        client = AsyncMock(spec=AsyncQdrantClient)
+
+        with patch.object(QdrantVectorBase, "create_client") as mock_create_client:
+            store = QdrantVectorStoreAdapter(client=client)
+            retriever = QdrantVectorRetrieverAdapter(client=client)
+
+        self.assertIs(store.client, client)
+        self.assertIs(retriever.client, client)
+        mock_create_client.assert_not_called()
+
+    def test_client_is_created_when_not_injected(self):
+        """Test that an adapter without injected client creates its own."""
+        with patch.object(QdrantVectorBase, "create_client") as mock_create_client:
+            adapter = QdrantVectorStoreAdapter(host="qdrant", port=1234)
+
+        mock_create_client.assert_called_once_with(host="qdrant", port=1234)
+        self.assertIs(adapter.client, mock_create_client.return_value)
+
+
+class TestQdrantVectorBaseQuantization(unittest.TestCase):
+    """Test cases for the quantization profiles of QdrantVectorBase."""
+
+    def test_profiles_build_their_quantization_config(self):
+        """Test that each profile maps to its Qdrant quantization, and none to no quantization."""
+        self.assertIsNone(QdrantVectorBase.quantization_config("none"))
+        self.assertIsInstance(QdrantVectorBase.quantization_config("scalar"), models.ScalarQuantization)
+        self.assertIsInstance(QdrantVectorBase.quantization_config("binary"), models.BinaryQuantization)
+        product = QdrantVectorBase.quantization_config("product", product_compression="x32")
+        self.assertEqual(product.product.compression, models.CompressionRatio.X32)
+
+    def test_unknown_profile_is_rejected_at_construction(self):
+        """Test that an adapter with an unknown profile fails before any request."""
+        with self.assertRaises(ValueError):
+            QdrantVectorStoreAdapter(client=AsyncMock(spec=AsyncQdrantClient), quantization="int4")
+
+
+class TestQdrantVectorBaseStorage(unittest.TestCase):
+    """Test cases for the storage tiers of QdrantVectorBase."""
+
+    def test_tiers_set_every_structure(self):
+        """Test that the hot tier keeps everything in RAM and the warm tier puts everything on disk."""
+        self.assertEqual(set(QdrantVectorBase.storage_layout("hot", None, None, None).values()), {False})
+        self.assertEqual(set(QdrantVectorBase.storage_layout("warm", None, None, None).values()), {True})
+
+    def test_overrides_apply_on_top_of_the_tier(self):
+        """Test that an explicit on-disk flag wins over the tier."""
+        layout = QdrantVectorBase.storage_layout("hot", vectors_on_disk=True, payload_on_disk=None, hnsw_on_disk=None)
+
+        self.assertEqual(layout, {"vectors_on_disk": True, "payload_on_disk": False, "hnsw_on_disk": False})
+
+    def test_unknown_tier_is_rejected_at_construction(self):
+        """Test that an adapter with an unknown tier fails before any request."""
+        with self.assertRaises(ValueError):
+            QdrantVectorStoreAdapter(client=AsyncMock(spec=AsyncQdrantClient), storage_tier="cold")
+
+
+class TestQdrantVectorBaseCollection(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the memoized collection existence check of QdrantVectorBase."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = AsyncMock(spec=AsyncQdrantClient)
+        self.client.collection_exists.return_value = True
+        self.client.query_points.return_value = MagicMock(points=[])
+        self.retriever = QdrantVectorRetrieverAdapter(client=self.client)
+
+    async def test_steady_state_search_issues_one_rpc(self):
+        """Test that once the collection is known, a search is a single RPC."""
+        await self.retriever.search(query=[0.1, 0.2])
+        self.client.reset_mock()
+
+        await self.retriever.search(query=[0.1, 0.2])
+
+        self.assertEqual([name for name, _, _ in self.client.mock_calls], ["query_points"])
+
+    async def test_concurrent_first_calls_check_collection_once(self):
+        """Test that concurrent first searches share a single existence check."""
+        await asyncio.gather(*(self.retriever.search(query=[0.1, 0.2]) for _ in range(5)))
+
+        self.client.collection_exists.assert_awaited_once()
+        self.assertEqual(self.client.query_points.await_count, 5)
+
+    async def test_collection_is_created_when_missing(self):
+        """Test that a missing collection is created on first use."""
+        self.client.collection_exists.return_value = False
+
+        await self.retriever.search(query=[0.1, 0.2])
+        await self.retriever.search(query=[0.1, 0.2])
+
+        self.client.create_collection.assert_awaited_once()
+
+    async def test_collection_is_created_with_its_quantization_profile(self):
+        """Test that a missing collection is created with the quantization of its profile."""
+        self.client.collection_exists.return_value = False
+        retriever = QdrantVectorRetrieverAdapter(client=self.client, quantization="scalar")
+
+        await retriever.search(query=[0.1, 0.2])
+
+        quantization = self.client.create_collection.await_args.kwargs["quantization_config"]
+        self.assertIsInstance(quantization, models.ScalarQuantization)
+        self.assertEqual(quantization.scalar.type, models.ScalarType.INT8)
+
+    async def test_warm_collection_is_created_on_disk(self):
+        """Test that a collection of the warm tier is created with vectors, payloads and HNSW graph on disk."""
+        self.client.collection_exists.return_value = False
+        retriever = QdrantVectorRetrieverAdapter(client=self.client, storage_tier="warm")
+
+        await retriever.search(query=[0.1, 0.2])
+
+        kwargs = self.client.create_collection.await_args.kwargs
+        self.assertTrue(kwargs["vectors_config"].on_disk)
+        self.assertTrue(kwargs["on_disk_payload"])
+        self.assertTrue(kwargs["hnsw_config"].on_disk)
+
+    async def test_collection_is_created_with_its_hnsw_parameters(self):
+        """Test that the HNSW graph of a new collection is built with the given m and ef_construct."""
+        self.client.collection_exists.return_value = False
+        retriever = QdrantVectorRetrieverAdapter(client=self.client, hnsw_m=32, hnsw_ef_construct=256)
+
+        await retriever.search(query=[0.1, 0.2])
+
+        hnsw_config = self.client.create_collection.await_args.kwargs["hnsw_config"]
+        self.assertEqual((hnsw_config.m, hnsw_config.ef_construct), (32, 256))
+
+    async def test_payload_indexes_are_created_with_the_collection_check(self):
+        """Test that the filtered payload fields are indexed once, on first use."""
+        await self.retriever.search(query=[0.1, 0.2])
+        await self.retriever.search(query=[0.1, 0.2])
+
+        self.assertEqual([call.kwargs["field_name"] for call in self.client.create_payload_index.await_args_list],
+                         list(QdrantVectorBase.payload_indexes))
+
+    async def test_collection_not_found_triggers_recheck_and_retry(self):
+        """Test that a 'collection not found' error re-checks the collection and retries the search."""
+        await self.retriever.search(query=[0.1, 0.2])
+        not_found = UnexpectedResponse(404, "Not Found", b"Collection not found", httpx.Headers())
+        self.client.query_points.side_effect = [not_found, MagicMock(points=[])]
+        self.client.collection_exists.return_value = False
+
+        results = await self.retriever.search(query=[0.1, 0.2])
+
+        self.assertEqual(results, [])
+        self.assertEqual(self.client.collection_exists.await_count, 2)
+        self.client.create_collection.assert_awaited_once()
+
+    async def test_other_errors_are_not_retried(self):
+        """Test that errors other than a missing collection are raised as is."""
+        self.client.query_points.side_effect = RuntimeError("unavailable")
+
+        with self.assertRaises(RuntimeError):
+            await self.retriever.search(query=[0.1, 0.2])
+        self.client.query_points.assert_awaited_once()
+        self.client.collection_exists.assert_awaited_once()
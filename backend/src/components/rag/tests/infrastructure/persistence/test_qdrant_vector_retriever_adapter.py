@@ -0,0 +1,148 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from qdrant_client import AsyncQdrantClient, models
+
+from src.components.rag.domain.value_objects import SearchFilter, SearchOptions
+from src.components.rag.infrastructure.persistence import QdrantVectorRetrieverAdapter
+
+
+class TestQdrantVectorRetrieverAdapterFilter(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the metadata-filtered search of QdrantVectorRetrieverAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = AsyncMock(spec=AsyncQdrantClient)
+        self.client.collection_exists.return_value = True
+        self.client.query_points.return_value = MagicMock(points=[])
+        self.retriever = QdrantVectorRetrieverAdapter(client=self.client)
+
+    async def test_search_without_filter_searches_everything(self):
+        """Test that a search without filter sends no query filter."""
+        # Act
+        await self.retriever.search(query=[0.1, 0.2])
+
+        # Assert
+        self.assertIsNone(self.client.query_points.await_args.kwargs["query_filter"])
+
+    async def test_empty_filter_searches_everything(self):
+        """Test that a filter without condition sends no query filter."""
+        # Act
+        await self.retriever.search(query=[0.1, 0.2], search_filter=SearchFilter(filenames=[]))
+
+        # Assert
+        self.assertIsNone(self.client.query_points.await_args.kwargs["query_filter"])
+
+    async def test_filter_is_translated_to_indexed_conditions(self):
+        """Test that every condition of the filter becomes a condition on its metadata field."""
+        # Arrange
+        after = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        before = datetime(2025, 6, 30, tzinfo=timezone.utc)
+        search_filter = SearchFilter(filenames=["a.pdf", "b.pdf"], document_types=["application/pdf"],
+                                     ingested_after=after, ingested_before=before)
+
+        # Act
+        await self.retriever.search(query=[0.1, 0.2], top_k=3, search_filter=search_filter)
+
+        # Assert
+        kwargs = self.client.query_points.await_args.kwargs
+        self.assertEqual(kwargs["limit"], 3)
+        self.assertEqual(kwargs["query_filter"], models.Filter(must=[
+            models.FieldCondition(key="metadata.filename", match=models.MatchAny(any=["a.pdf", "b.pdf"])),
+            models.FieldCondition(key="metadata.document_type", match=models.MatchAny(any=["application/pdf"])),
+            models.FieldCondition(key="metadata.ingested_at", range=models.DatetimeRange(gte=after, lte=before)),
+        ]))
+
+    async def test_filtered_fields_are_indexed(self):
+        """Test that each field a filter can target has a payload index."""
+        # Act
+        await self.retriever.search(query=[0.1, 0.2], search_filter=SearchFilter(document_types=["text/csv"]))
+
+        # Assert
+        indexes = {call.kwargs["field_name"]: call.kwargs["field_schema"]
+                   for call in self.client.create_payload_index.await_args_list}
+        self.assertEqual(indexes["metadata.filename"], models.PayloadSchemaType.KEYWORD)
+        self.assertEqual(indexes["metadata.document_type"], models.PayloadSchemaType.KEYWORD)
+        self.assertEqual(indexes["metadata.ingested_at"], models.PayloadSchemaType.DATETIME)
+
+
+class TestQdrantVectorRetrieverAdapterOptions(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the search options of QdrantVectorRetrieverAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = AsyncMock(spec=AsyncQdrantClient)
+        self.client.collection_exists.return_value = True
+        self.client.query_points.return_value = MagicMock(points=[])
+
+    async def test_server_defaults_apply_without_options(self):
+        """Test that no search parameters are sent when neither the adapter nor the query sets options."""
+        # Arrange
+        retriever = QdrantVectorRetrieverAdapter(client=self.client, search_options=SearchOptions())
+
+        # Act
+        await retriever.search(query=[0.1, 0.2])
+
+        # Assert
+        kwargs = self.client.query_points.await_args.kwargs
+        self.assertIsNone(kwargs["search_params"])
+        self.assertIsNone(kwargs["score_threshold"])
+
+    async def test_query_options_override_adapter_defaults(self):
+        """Test that the options of a query override the adapter defaults, which fill the rest."""
+        # Arrange
+        retriever = QdrantVectorRetrieverAdapter(client=self.client, search_options=SearchOptions(
+            hnsw_ef=128, score_threshold=0.5, oversampling=2.0, rescore=True))
+
+        # Act
+        await retriever.search(query=[0.1, 0.2], options=SearchOptions(hnsw_ef=16, oversampling=4.0))
+
+        # Assert
+        kwargs = self.client.query_points.await_args.kwargs
+        self.assertEqual(kwargs["search_params"], models.SearchParams(
+            hnsw_ef=16, quantization=models.QuantizationSearchParams(oversampling=4.0, rescore=True)))
+        self.assertEqual(kwargs["score_threshold"], 0.5)
+
+    async def test_exact_and_indexed_only_searches(self):
+        """Test that exact and indexed-only searches are passed to Qdrant."""
+        # Arrange
+        retriever = QdrantVectorRetrieverAdapter(client=self.client, search_options=SearchOptions())
+
+        # Act
+        await retriever.search(query=[0.1, 0.2], options=SearchOptions(exact=True, indexed_only=True))
+
+        # Assert
+        self.assertEqual(self.client.query_points.await_args.kwargs["search_params"],
+                         models.SearchParams(exact=True, indexed_only=True))
+
+
+class TestSearchFilter(unittest.TestCase):
+    """Test cases for the SearchFilter value object."""
+
+    def test_inverted_ingestion_range_is_rejected(self):
+        """Test that a range ending before it starts is rejected."""
+        with self.assertRaises(ValueError):
+            SearchFilter(ingested_after=datetime(2025, 2, 1), ingested_before=datetime(2025, 1, 1))
+
+    def test_filter_without_condition_is_empty(self):
+        """Test that only a filter without any condition is empty."""
+        self.assertTrue(SearchFilter().is_empty)
+        self.assertFalse(SearchFilter(ingested_before=datetime(2025, 1, 1)).is_empty)
+
+
+class TestSearchOptions(unittest.TestCase):
+    """Test cases for the SearchOptions value object."""
+
+    def test_unset_options_are_filled_from_defaults(self):
+        """Test that only the options left unset are taken from the defaults."""
+        options = SearchOptions(exact=True).with_defaults(SearchOptions(exact=False, hnsw_ef=64))
+
+        self.assertEqual((options.exact, options.hnsw_ef, options.rescore), (True, 64, None))
+
+    def test_invalid_options_are_rejected(self):
+        """Test that a null candidate list or an oversampling below one is rejected."""
+        with self.assertRaises(ValueError):
+            SearchOptions(hnsw_ef=0)
+        with self.assertRaises(ValueError):
+            SearchOptions(oversampling=0.5)
@@ -0,0 +1,312 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import CollectionStatus, UpdateStatus, VectorParams
+
+from src.components.rag.domain.value_objects import DocumentRetrieval, DocumentRetrievalVector, StorageTier
+from src.components.rag.domain.value_objects.input_document import StoreDocumentStatus
+from src.components.rag.infrastructure.persistence import QdrantVectorRetrieverAdapter, QdrantVectorStoreAdapter
+
+
+class TestQdrantVectorStoreAdapterUpsert(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the batched upserts of QdrantVectorStoreAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = AsyncMock(spec=AsyncQdrantClient)
+        self.client.collection_exists.return_value = True
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def upsert(collection_name, points, wait):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return MagicMock(status=UpdateStatus.COMPLETED if wait else UpdateStatus.ACKNOWLEDGED)
+
+        self.client.upsert.side_effect = upsert
+        self.documents = [
+            DocumentRetrievalVector(content=f"Chunk {i}", metadata={"chunk_index": i}, vector=[float(i), 0.5])
+            for i in range(10)
+        ]
+
+    async def test_upsert_sends_bounded_parallel_batches(self):
+        """Test that points are split in batches with a bounded number in flight."""
+        adapter = QdrantVectorStoreAdapter(client=self.client, batch_size=3, max_concurrency=2)
+
+        result = await adapter.upsert(self.documents)
+
+        self.assertEqual([len(call.kwargs["points"]) for call in self.client.upsert.await_args_list], [3, 3, 3, 1])
+        self.assertEqual(self.max_in_flight, 2)
+        self.assertEqual(result.status, StoreDocumentStatus.SUCCESS)
+        self.assertEqual((result.ingested_chunks, result.failed_chunks), (10, 0))
+
+    async def test_upsert_reports_each_stored_batch(self):
+        """Test that the progress callback receives the size of each batch stored, but not of failed ones."""
+        adapter = QdrantVectorStoreAdapter(client=self.client, batch_size=4, max_concurrency=1)
+        upsert = self.client.upsert.side_effect
+        stored = []
+
+        async def failing_upsert(collection_name, points, wait):
+            if points[0].payload["metadata"]["chunk_index"] == 4:
+                raise RuntimeError("payload too large")
+            return await upsert(collection_name, points, wait)
+
+        async def on_batch(count):
+            stored.append(count)
+
+        self.client.upsert.side_effect = failing_upsert
+
+        await adapter.upsert(self.documents, on_batch)
+
+        self.assertEqual(stored, [4, 2])
+
+    async def test_upsert_reports_partial_failure(self):
+        """Test that a failed batch is counted without failing the other batches."""
+        adapter = QdrantVectorStoreAdapter(client=self.client, batch_size=4, max_concurrency=1)
+        upsert = self.client.upsert.side_effect
+
+        async def failing_upsert(collection_name, points, wait):
+            if points[0].payload["metadata"]["chunk_index"] == 4:
+                raise RuntimeError("payload too large")
+            return await upsert(collection_name, points, wait)
+
+        self.client.upsert.side_effect = failing_upsert
+
+        result = await adapter.upsert(self.documents)
+
+        self.assertEqual(result.status, StoreDocumentStatus.PARTIAL)
+        self.assertEqual((result.total_chunks, result.ingested_chunks, result.failed_chunks), (10, 6, 4))
+        self.assertEqual(result.metrics["failed_batches"], 1)
+
+    async def test_upsert_reports_error_when_every_batch_fails(self):
+        """Test that the status is ERROR when nothing was stored."""
+        adapter = QdrantVectorStoreAdapter(client=self.client, batch_size=4)
+        self.client.upsert.side_effect = RuntimeError("unavailable")
+
+        result = await adapter.upsert(self.documents)
+
+        self.assertEqual(result.status, StoreDocumentStatus.ERROR)
+        self.assertEqual(result.failed_chunks, 10)
+
+    async def test_upsert_without_wait_confirms_acknowledged_points(self):
+        """Test the fire-and-confirm mode: acknowledged points are counted as ingested once found applied."""
+        adapter = QdrantVectorStoreAdapter(client=self.client, batch_size=5, wait=False)
+        documents = [document.model_copy(update={"metadata": {"document_hash": "abc"}}) for document in self.documents]
+        self.client.count.side_effect = [MagicMock(count=7), MagicMock(count=10)]
+
+        result = await adapter.upsert(documents)
+
+        self.assertTrue(all(call.kwargs["wait"] is False for call in self.client.upsert.await_args_list))
+        self.assertEqual(result.metrics["acknowledged_batches"], 2)
+        self.assertEqual(self.client.count.await_count, 2)
+        has_id, document_hash = self.client.count.await_args.kwargs["count_filter"].must
+        self.assertEqual(set(has_id.has_id), {str(document.id) for document in documents})
+        self.assertEqual((document_hash.key, document_hash.match.value), ("metadata.document_hash", "abc"))
+        self.assertEqual(result.status, StoreDocumentStatus.SUCCESS)
+        self.assertEqual((result.ingested_chunks, result.metrics["unconfirmed_chunks"]), (10, 0))
+
+    async def test_upsert_without_wait_fails_points_never_applied(self):
+        """Test that acknowledged points still missing after the confirmation timeout are not reported as ingested."""
+        adapter = QdrantVectorStoreAdapter(client=self.client, batch_size=5, wait=False, confirm_timeout=0)
+        self.client.count.return_value = MagicMock(count=4)
+
+        result = await adapter.upsert(self.documents)
+
+        self.assertEqual(result.status, StoreDocumentStatus.ERROR)
+        self.assertEqual((result.ingested_chunks, result.failed_chunks), (0, 10))
+        self.assertEqual(result.metrics["unconfirmed_chunks"], 10)
+
+    async def test_upsert_with_wait_is_not_confirmed(self):
+        """Test that applied batches are not counted again."""
+        adapter = QdrantVectorStoreAdapter(client=self.client, batch_size=5, wait=True)
+
+        result = await adapter.upsert(self.documents)
+
+        self.client.count.assert_not_called()
+        self.assertEqual(result.ingested_chunks, 10)
+
+
+class TestQdrantVectorStoreAdapterDocuments(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the document-level lookups of QdrantVectorStoreAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = AsyncMock(spec=AsyncQdrantClient)
+        self.client.collection_exists.return_value = True
+        self.adapter = QdrantVectorStoreAdapter(client=self.client, batch_size=2)
+        self.document_id = uuid4()
+
+    def _stored_point(self, chunk_count: int):
+        return MagicMock(payload={"metadata": {"chunk_count": chunk_count}})
+
+    async def test_document_with_every_chunk_is_stored(self):
+        """Test that a document is stored once all its chunks are, filtering on its hash."""
+        self.client.scroll.return_value = ([self._stored_point(3)], None)
+        self.client.count.return_value = MagicMock(count=3)
+
+        self.assertTrue(await self.adapter.is_document_stored(self.document_id, "abc"))
+
+        conditions = self.client.count.await_args.kwargs["count_filter"].must
+        self.assertEqual([(condition.key, condition.match.value) for condition in conditions],
+                         [("metadata.document_id", str(self.document_id)), ("metadata.document_hash", "abc")])
+
+    async def test_partially_upserted_document_is_not_stored(self):
+        """Test that a document missing some chunks is reported as not stored."""
+        self.client.scroll.return_value = ([self._stored_point(3)], None)
+        self.client.count.return_value = MagicMock(count=2)
+
+        self.assertFalse(await self.adapter.is_document_stored(self.document_id, "abc"))
+
+    async def test_unknown_document_is_not_stored(self):
+        """Test that a document without points is not stored, without counting."""
+        self.client.scroll.return_value = ([], None)
+
+        self.assertFalse(await self.adapter.is_document_stored(self.document_id, "abc"))
+        self.client.count.assert_not_called()
+
+    async def test_chunk_ids_of_a_document_are_listed_page_by_page(self):
+        """Test that every page of the document's points is scrolled, without payloads nor vectors."""
+        ids = [uuid4() for _ in range(3)]
+        self.client.scroll.side_effect = [
+            ([MagicMock(id=str(ids[0])), MagicMock(id=str(ids[1]))], "next"),
+            ([MagicMock(id=str(ids[2]))], None),
+        ]
+        document_id = uuid4()
+
+        chunk_ids = await self.adapter.list_chunk_ids(document_id)
+
+        self.assertEqual(chunk_ids, ids)
+        first, second = self.client.scroll.await_args_list
+        self.assertEqual((first.kwargs["offset"], second.kwargs["offset"]), (None, "next"))
+        self.assertFalse(first.kwargs["with_payload"])
+        condition = first.kwargs["scroll_filter"].must[0]
+        self.assertEqual((condition.key, condition.match.value), ("metadata.document_id", str(document_id)))
+
+    async def test_versions_of_a_document_are_read_one_point_each(self):
+        """Test that each request excludes the versions found so far, including the chunks stored without hash."""
+        self.client.scroll.side_effect = [
+            ([MagicMock(payload={"metadata": {"document_hash": "abc"}})], "next"),
+            ([MagicMock(payload={"metadata": {}})], "next"),
+            ([], None),
+        ]
+
+        versions = await self.adapter.list_document_versions(self.document_id, "doc.pdf")
+
+        self.assertEqual(versions, ["abc", None])
+        filters = [call.kwargs["scroll_filter"] for call in self.client.scroll.await_args_list]
+        self.assertEqual([(condition.key, condition.match.value) for condition in filters[0].should],
+                         [("metadata.document_id", str(self.document_id)), ("metadata.filename", "doc.pdf")])
+        self.assertIsNone(filters[0].must_not)
+        self.assertEqual(filters[1].must_not[0].match.any, ["abc"])
+        self.assertEqual(filters[2].must_not[1].is_empty.key, "metadata.document_hash")
+        self.assertEqual({call.kwargs["limit"] for call in self.client.scroll.await_args_list}, {1})
+
+    async def test_chunk_metadata_is_replaced_in_batches(self):
+        """Test that the metadata updates are sent as batches of payload operations."""
+        chunks = [DocumentRetrieval(content=f"Chunk {i}", metadata={"chunk_index": i}) for i in range(3)]
+
+        await self.adapter.update_chunk_metadata(chunks)
+
+        batches = [call.kwargs["update_operations"] for call in self.client.batch_update_points.await_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(batches[1][0].set_payload.payload, {"metadata": {"chunk_index": 2}})
+        self.assertEqual(batches[1][0].set_payload.points, [str(chunks[2].id)])
+
+    async def test_chunks_are_deleted_by_id_in_batches(self):
+        """Test that chunks are deleted by id, in batches."""
+        ids = [uuid4() for _ in range(3)]
+
+        await self.adapter.delete_chunks(ids)
+
+        selectors = [call.kwargs["points_selector"].points for call in self.client.delete.await_args_list]
+        self.assertEqual(selectors, [[str(ids[0]), str(ids[1])], [str(ids[2])]])
+
+    async def test_document_is_deleted_with_a_server_side_filter(self):
+        """Test that a document is deleted by filter on its id or filename, in one request."""
+        self.client.count.return_value = MagicMock(count=4)
+
+        deleted = await self.adapter.delete_document(self.document_id, "doc.pdf")
+
+        self.assertEqual(deleted, 4)
+        self.client.scroll.assert_not_called()
+        document_filter = self.client.delete.await_args.kwargs["points_selector"].filter
+        self.assertEqual([(condition.key, condition.match.value) for condition in document_filter.should],
+                         [("metadata.document_id", str(self.document_id)), ("metadata.filename", "doc.pdf")])
+        self.assertIsNone(document_filter.must_not)
+
+    async def test_replaced_document_keeps_the_chunks_of_its_new_version(self):
+        """Test that the chunks to keep are excluded from the deletion filter."""
+        self.client.count.return_value = MagicMock(count=1)
+        keep = [uuid4(), uuid4()]
+
+        await self.adapter.delete_document(self.document_id, keep=keep)
+
+        document_filter = self.client.delete.await_args.kwargs["points_selector"].filter
+        self.assertEqual(document_filter.must_not[0].has_id, [str(chunk_id) for chunk_id in keep])
+
+    async def test_unknown_document_is_not_deleted(self):
+        """Test that nothing is sent for a document without chunks."""
+        self.client.count.return_value = MagicMock(count=0)
+
+        self.assertEqual(await self.adapter.delete_document(self.document_id), 0)
+        self.client.delete.assert_not_called()
+
+
+class TestQdrantVectorStoreAdapterStorage(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the storage tiering of QdrantVectorStoreAdapter."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = AsyncMock(spec=AsyncQdrantClient)
+        self.client.collection_exists.return_value = True
+        self.adapter = QdrantVectorStoreAdapter(client=self.client, storage_tier="hot")
+
+    def _collection_info(self, on_disk: bool, status: CollectionStatus = CollectionStatus.GREEN):
+        info = MagicMock(status=status, points_count=42)
+        info.config.params.vectors = VectorParams(size=768, distance="Cosine", on_disk=on_disk)
+        info.config.params.on_disk_payload = on_disk
+        info.config.hnsw_config.on_disk = on_disk
+        return info
+
+    async def test_storage_layout_is_read_from_the_collection(self):
+        """Test that the on-disk flags of the collection map to its tier."""
+        self.client.get_collection.return_value = self._collection_info(on_disk=False)
+
+        storage = await self.adapter.get_storage()
+
+        self.assertEqual(storage.tier, StorageTier.HOT)
+        self.assertEqual(storage.points_count, 42)
+        self.assertFalse(storage.optimizing)
+
+    async def test_collection_is_moved_to_the_warm_tier(self):
+        """Test that moving to the warm tier puts vectors, payloads and HNSW graph on disk."""
+        self.client.get_collection.return_value = self._collection_info(on_disk=True, status=CollectionStatus.YELLOW)
+
+        storage = await self.adapter.set_storage_tier(StorageTier.WARM)
+
+        kwargs = self.client.update_collection.await_args.kwargs
+        self.assertTrue(kwargs["vectors_config"][""].on_disk)
+        self.assertTrue(kwargs["collection_params"].on_disk_payload)
+        self.assertTrue(kwargs["hnsw_config"].on_disk)
+        self.assertEqual(storage.tier, StorageTier.WARM)
+        self.assertTrue(storage.optimizing)
+        self.assertTrue(self.adapter.collection_parameters["storage"]["vectors_on_disk"])
+
+    async def test_storage_tier_applies_to_the_adapters_sharing_the_collection_parameters(self):
+        """Test that a retriever sharing the parameters of the store re-creates the collection in the new tier."""
+        retriever = QdrantVectorRetrieverAdapter(client=self.client,
+                                                 collection_parameters=self.adapter.collection_parameters)
+        self.client.get_collection.return_value = self._collection_info(on_disk=True)
+        await self.adapter.set_storage_tier(StorageTier.WARM)
+        self.client.collection_exists.return_value = False
+
+        await retriever._ensure_collection_exists()
+
+        kwargs = self.client.create_collection.await_args.kwargs
+        self.assertTrue(kwargs["vectors_config"].on_disk)
+        self.assertTrue(kwargs["on_disk_payload"])